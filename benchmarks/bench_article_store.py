@@ -0,0 +1,78 @@
+"""
+Benchmark: a user re-running overlapping windows (last 7 days, then 10, then
+14, ...) for one ticker. Without the store every run downloads its whole
+range; with ArticleStore only the missing days (plus today and the grace days) are fetched.
+The fetcher simulates NewsAPI with a fixed latency per request and per day.
+
+Usage:
+    python benchmarks/bench_article_store.py --runs 5 --latency 0.2
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import datetime as dt
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.repository.article_store import ArticleStore
+
+
+def make_fetcher(latency: float, per_day_cost: float, per_day: int, counter: dict):
+    def fetch(query, lo, hi, status=None):
+        lo, hi = dt.date.fromisoformat(lo), dt.date.fromisoformat(hi)
+        days = (hi - lo).days + 1
+        counter["requests"] += 1
+        counter["days"] += days
+        time.sleep(latency + per_day_cost * days)
+        for d in range(days):
+            day = lo + dt.timedelta(days=d)
+            for i in range(per_day):
+                yield {
+                    "title": f"{query} {day} {i}",
+                    "url": f"https://n.example/{day}/{i}",
+                    "publishedAt": f"{day}T12:00:00Z",
+                }
+        if status is not None:
+            status["complete"] = True
+
+    return fetch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--per-day-cost", type=float, default=0.02)
+    parser.add_argument("--per-day", type=int, default=40)
+    args = parser.parse_args()
+
+    today = dt.date.today()
+    windows = [(today - dt.timedelta(days=7 + 3 * i), today) for i in range(args.runs)]
+
+    naive = {"requests": 0, "days": 0}
+    fetch = make_fetcher(args.latency, args.per_day_cost, args.per_day, naive)
+    t0 = time.perf_counter()
+    for lo, hi in windows:
+        list(fetch("Tesla", lo.isoformat(), hi.isoformat()))
+    t_naive = time.perf_counter() - t0
+
+    stored = {"requests": 0, "days": 0}
+    fetch = make_fetcher(args.latency, args.per_day_cost, args.per_day, stored)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArticleStore(os.path.join(tmp, "articles.sqlite"))
+        t0 = time.perf_counter()
+        for lo, hi in windows:
+            list(store.iter_range("Tesla", lo, hi, fetch, today=today))
+        t_store = time.perf_counter() - t0
+
+    print(f"{args.runs} overlapping windows: " + ", ".join(f"{(hi - lo).days + 1}d" for lo, hi in windows))
+    print(f"refetch every run : {t_naive * 1000:8.0f} ms, {naive['requests']} requests, {naive['days']} days")
+    print(f"article store     : {t_store * 1000:8.0f} ms, {stored['requests']} requests, {stored['days']} days")
+    print(f"speedup           : {t_naive / t_store:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
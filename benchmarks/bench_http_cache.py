@@ -0,0 +1,114 @@
+"""
+Benchmark: the external calls of one pipeline run (NewsAPI pages, Alpha
+Vantage search + daily series, one OpenAI completion) against simulated slow
+upstreams, live (HTTP_CACHE_MODE=off) vs replayed from the record/replay
+cache. Replay never touches the network, so timings are deterministic.
+
+With --pipeline COMPANY the real run_pipeline is timed in replay mode
+instead. The date range is pinned (--date-to, default below) so replays
+request exactly what was recorded; record it once first with --record and
+real keys.
+
+Usage:
+    python benchmarks/bench_http_cache.py --runs 5
+    python benchmarks/bench_http_cache.py --pipeline Tesla --days 7 --record   # once, online
+    python benchmarks/bench_http_cache.py --pipeline Tesla --days 7
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import datetime as dt
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.models.http_cache as hc
+from src.service.tiered_cache import TieredCache
+
+# end of the --pipeline date range; fixed so every replay asks for the same days
+PIPELINE_DATE_TO = "2025-09-26"
+
+# endpoint -> simulated upstream latency (seconds)
+UPSTREAMS = [
+    ("newsapi", {"q": "Tesla", "page": 1, "apiKey": "k"}, 0.30),
+    ("newsapi", {"q": "Tesla", "page": 2, "apiKey": "k"}, 0.30),
+    ("av_search", {"function": "SYMBOL_SEARCH", "keywords": "Tesla", "apikey": "k"}, 0.40),
+    ("av_daily", {"function": "TIME_SERIES_DAILY", "symbol": "TSLA", "apikey": "k"}, 0.60),
+    ("openai", {"model": "gpt-4o-mini", "messages": ["..."], "max_tokens": 600}, 2.00),
+]
+
+
+def one_run(mode: str):
+    for endpoint, params, latency in UPSTREAMS:
+        hc.cached_call(
+            endpoint,
+            params,
+            lambda latency=latency, endpoint=endpoint: time.sleep(latency)
+            or {"endpoint": endpoint},
+            mode=mode,
+        )
+
+
+def bench_calls(runs: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TieredCache(os.path.join(tmp, "http.sqlite"))
+        hc.get_http_cache = lambda: cache
+
+        t0 = time.perf_counter()
+        for _ in range(runs):
+            one_run("off")
+        t_live = (time.perf_counter() - t0) / runs
+
+        one_run("record")
+        t0 = time.perf_counter()
+        for _ in range(runs):
+            one_run("replay")
+        t_replay = (time.perf_counter() - t0) / runs
+
+    print(f"external calls per run: {len(UPSTREAMS)}")
+    print(f"live (simulated)  : {t_live * 1000:9.1f} ms/run")
+    print(f"replay            : {t_replay * 1000:9.3f} ms/run")
+    print(f"speedup           : {t_live / t_replay:9.0f}x")
+
+
+def bench_pipeline(company: str, days: int, runs: int, date_to: str, record: bool):
+    from src.pipeline.run_pipeline import run_pipeline
+
+    date_to = dt.date.fromisoformat(date_to)
+    date_from = date_to - dt.timedelta(days=days)
+    if record:
+        hc.HTTP_CACHE_MODE = "record"
+        result = run_pipeline(company, date_from=date_from, date_to=date_to)
+        print(f"recorded run_pipeline('{company}', {date_from}..{date_to}), {result['count']} articles")
+        return
+    hc.HTTP_CACHE_MODE = "replay"
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        result = run_pipeline(company, date_from=date_from, date_to=date_to)
+        timings.append(time.perf_counter() - t0)
+    print(f"run_pipeline('{company}', {date_from}..{date_to}) replayed, {result['count']} articles")
+    print(f"first run : {timings[0] * 1000:9.1f} ms (model load included)")
+    if runs > 1:
+        rest = sorted(timings[1:])
+        print(f"median    : {rest[len(rest) // 2] * 1000:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--pipeline", metavar="COMPANY")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--date-to", default=PIPELINE_DATE_TO, help="YYYY-MM-DD")
+    parser.add_argument("--record", action="store_true", help="record the --pipeline run once")
+    args = parser.parse_args()
+    if args.pipeline:
+        bench_pipeline(args.pipeline, args.days, args.runs, args.date_to, args.record)
+    else:
+        bench_calls(args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: N sequential GETs with a fresh requests.get connection each time
+(the old fetchers) vs the shared pooled HttpClient (keep-alive), against a
+local HTTP/1.1 server. Connection setup cost is far higher over TLS to a
+real API; this measures the lower bound on loopback.
+
+Usage:
+    python benchmarks/bench_http_client.py --requests 500
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.http_client import HttpClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def do_GET(self):
+        payload = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    import requests
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/query"
+    try:
+        t0 = time.perf_counter()
+        for i in range(args.requests):
+            requests.get(url, params={"page": i}, timeout=10)
+        t_fresh = time.perf_counter() - t0
+
+        client = HttpClient()
+        t0 = time.perf_counter()
+        for i in range(args.requests):
+            client.get(url, params={"page": i})
+        t_pooled = time.perf_counter() - t0
+        m = client.metrics()
+        client.close()
+    finally:
+        server.shutdown()
+
+    n = args.requests
+    print(f"{n} sequential GETs on loopback")
+    print(f"fresh connection each : {t_fresh * 1000:8.1f} ms ({t_fresh / n * 1e6:6.0f} us/req)")
+    print(f"pooled HttpClient     : {t_pooled * 1000:8.1f} ms ({t_pooled / n * 1e6:6.0f} us/req)")
+    print(f"speedup               : {t_fresh / t_pooled:8.2f}x")
+    print(f"metrics               : {m}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: cold-start import time of the pipeline entry points.
+
+Each module is imported in a fresh interpreter with `python -X importtime`;
+the report shows the total cumulative import time, the heaviest top-level
+imports and whether any deferred heavy dependency was pulled in eagerly.
+
+Usage:
+    python benchmarks/bench_import_time.py [--top 8] [module ...]
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+ENTRY_POINTS = [
+    "src.pipeline.run_pipeline",  # used by src/main.py and streamlit_app.py
+    "src.pipeline.price_pipeline",
+    "src.service.sentiment_finBERT",
+    "src.service.sentiment_server",
+    "src.service.openai",
+    "src.models.news_api",
+]
+HEAVY = ["torch", "transformers", "onnxruntime", "openai", "fuzzywuzzy", "requests"]
+
+
+def import_profile(module: str) -> list[tuple[str, int, int]]:
+    """Return [(package, self_us, cumulative_us)] for `import module` in a fresh process."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:") :].split("|", 2)
+        # name is "<space><two spaces per nesting level><package>"
+        rows.append((name[1:].rstrip(), int(self_us), int(cum_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        rows = import_profile(module)
+        top_level = [r for r in rows if not r[0].startswith(" ")]
+        total_ms = sum(r[2] for r in top_level) / 1000
+        loaded = {r[0].strip().split(".")[0] for r in rows}
+        eager = [h for h in HEAVY if h in loaded]
+        print(f"\n== {module}: {total_ms:.1f} ms")
+        print(f"   heavy deps imported eagerly: {', '.join(eager) or 'none'}")
+        for name, _, cum in sorted(top_level, key=lambda r: -r[2])[: args.top]:
+            print(f"   {cum / 1000:8.1f} ms  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: FinBERT cold start from the Hugging Face hub cache vs the local
+safetensors snapshot.
+
+Each measurement runs `_load()` in a fresh interpreter and reports load time
+and resident memory. Run once beforehand (or let the first hub run) so the
+snapshot exists in FINBERT_SNAPSHOT_DIR.
+
+Usage:
+    python benchmarks/bench_model_startup.py --repeat 3
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+_PROBE = """
+import json, resource, time
+t0 = time.perf_counter()
+from src.service.sentiment_finBERT import _load
+_load()
+print(json.dumps({
+    "seconds": time.perf_counter() - t0,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def _probe(snapshot_dir: str) -> dict:
+    env = dict(os.environ, FINBERT_SNAPSHOT_DIR=snapshot_dir)
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr[-2000:])
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    from src.service.finbert_snapshot import FINBERT_SNAPSHOT_DIR
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--snapshot-dir", default=FINBERT_SNAPSHOT_DIR)
+    args = parser.parse_args()
+
+    _probe(args.snapshot_dir)  # make sure the snapshot exists and caches are warm
+    for label, snapshot in (("hub (from_pretrained)", ""), ("safetensors snapshot", args.snapshot_dir)):
+        runs = [_probe(snapshot) for _ in range(args.repeat)]
+        best = min(r["seconds"] for r in runs)
+        rss = max(r["max_rss_mb"] for r in runs)
+        print(f"{label:<24} best {best:6.2f}s   max RSS {rss:7.1f} MB")
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, ROOT)
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: fetching every NewsAPI result page one after another vs
+iter_news_articles (concurrent pages, streamed), against a local stand-in
+server with a fixed per-request latency.
+
+Usage:
+    python benchmarks/bench_news_pagination.py --total 500 --latency 0.3 --concurrency 4
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.news_api import get_news_articles_urls, iter_news_articles
+
+
+def start_server(total: int, latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            params = parse_qs(urlparse(self.path).query)
+            page = int(params.get("page", ["1"])[0])
+            size = int(params.get("pageSize", ["100"])[0])
+            time.sleep(latency)
+            lo, hi = (page - 1) * size, min(page * size, total)
+            body = {
+                "status": "ok",
+                "totalResults": total,
+                "articles": [{"title": f"a{i}"} for i in range(lo, hi)],
+            }
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--total", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = start_server(args.total, args.latency)
+    url = f"http://127.0.0.1:{server.server_address[1]}/v2/everything"
+    try:
+        t0 = time.perf_counter()
+        first = get_news_articles_urls("x", api_key="k", base_url=url)
+        t_single = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        seq, page = [], 1
+        while len(seq) < args.total:
+            data = get_news_articles_urls(
+                "x", api_key="k", base_url=url, page=page, page_size=args.page_size
+            )
+            seq.extend(data["articles"])
+            page += 1
+        t_seq = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        t_first, conc = None, []
+        for article in iter_news_articles(
+            "x",
+            api_key="k",
+            base_url=url,
+            page_size=args.page_size,
+            max_results=args.total,
+            concurrency=args.concurrency,
+        ):
+            if t_first is None:
+                t_first = time.perf_counter() - t0
+            conc.append(article)
+        t_conc = time.perf_counter() - t0
+    finally:
+        server.shutdown()
+
+    print(f"{args.total} results, {args.latency * 1000:.0f} ms per request")
+    print(f"single request (old)    : {t_single * 1000:8.0f} ms, {len(first['articles'])} articles")
+    print(f"sequential pages        : {t_seq * 1000:8.0f} ms, {len(seq)} articles")
+    print(f"concurrent, streamed    : {t_conc * 1000:8.0f} ms, {len(conc)} articles")
+    print(f"  first article after   : {t_first * 1000:8.0f} ms")
+    print(f"speedup vs sequential   : {t_seq / t_conc:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
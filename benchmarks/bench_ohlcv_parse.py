@@ -0,0 +1,91 @@
+"""
+Benchmark: Alpha Vantage full-history parsing, dict-per-day (old
+format_av_daily_data) vs the columnar parse_av_daily.
+
+Builds a synthetic outputsize=full payload (--years x 252 trading days) and
+reports parse time and the memory held by the result (tracemalloc).
+
+Usage:
+    python benchmarks/bench_ohlcv_parse.py --years 25
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import datetime
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.service.ohlcv import parse_av_daily
+
+
+def make_payload(years: int, seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    day = datetime.date.today()
+    series = {}
+    price = 100.0
+    for _ in range(years * 252):
+        day -= datetime.timedelta(days=1 if day.weekday() else 3)
+        price *= 1 + rnd.gauss(0, 0.02)
+        series[day.isoformat()] = {
+            "1. open": f"{price * 0.99:.4f}",
+            "2. high": f"{price * 1.01:.4f}",
+            "3. low": f"{price * 0.98:.4f}",
+            "4. close": f"{price:.4f}",
+            "5. volume": str(rnd.randint(10**5, 10**8)),
+        }
+    return {"Meta Data": {}, "Time Series (Daily)": series}
+
+
+def legacy_format(data):
+    out = []
+    for date, v in data.get("Time Series (Daily)", {}).items():
+        out.append(
+            {
+                "date": datetime.datetime.strptime(date, "%Y-%m-%d").date(),
+                "open": float(v.get("1. open", 0)),
+                "high": float(v.get("2. high", 0)),
+                "low": float(v.get("3. low", 0)),
+                "close": float(v.get("4. close", 0)),
+                "adjusted_close": float(v.get("5. adjusted close", 0)),
+                "volume": int(v.get("5. volume", 0)),
+            }
+        )
+    return out
+
+
+def _measure(fn, payload):
+    t0 = time.perf_counter()
+    fn(payload)
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    result = fn(payload)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=25)
+    args = parser.parse_args()
+
+    payload = make_payload(args.years)
+    n = len(payload["Time Series (Daily)"])
+    t_old, m_old = _measure(legacy_format, payload)
+    t_new, m_new = _measure(parse_av_daily, payload)
+    t_view, _ = _measure(lambda p: parse_av_daily(p).rows(), payload)
+
+    print(f"{n} trading days")
+    print(f"dict per day  : {t_old * 1000:8.1f} ms  {m_old / 2**20:7.2f} MiB")
+    print(f"columnar      : {t_new * 1000:8.1f} ms  {m_new / 2**20:7.2f} MiB")
+    print(f"columns+rows(): {t_view * 1000:8.1f} ms")
+    print(f"speedup {t_old / t_new:.1f}x, memory {m_old / max(1, m_new):.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
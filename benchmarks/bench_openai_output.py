@@ -0,0 +1,60 @@
+"""
+Benchmark: relevance-filter output format against a local OpenAI-compatible
+stand-in (fixed time to first token + a cost per output token). "echo" makes
+the model re-type every kept article as JSON; "ids" returns only the article
+numbers and scores in JSON mode. Reports output tokens and seconds per call.
+
+Usage:
+    python benchmarks/bench_openai_output.py --articles 100 --per-token 0.01
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.service.openai as oa
+from benchmarks.openai_standin import StandInOpenAI
+from benchmarks.bench_openai_relevance import make_articles
+
+
+def run(articles, output, concurrency):
+    stats = {}
+    kept = oa.filter_relevant_articles(
+        articles, api_key="k", company="Tesla", stats=stats,
+        output=output, concurrency=concurrency,
+    )
+    return kept, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--ttft", type=float, default=0.4, help="seconds to first token")
+    parser.add_argument("--per-token", type=float, default=0.01, help="seconds per output token")
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    results = {}
+    with StandInOpenAI(latency=args.ttft, per_output_token=args.per_token) as api:
+        oa.OPENAI_BASE_URL = api.url
+        for output in ("echo", "ids"):
+            results[output] = run(articles, output, args.concurrency)
+
+    (kept_echo, echo), (kept_ids, ids) = results["echo"], results["ids"]
+    assert [a["url"] for a in kept_echo] == [a["url"] for a in kept_ids]
+    print(f"{args.articles} articles, {len(kept_ids)} relevant, {ids['requests']} calls")
+    for name, s in (("echo", echo), ("ids", ids)):
+        print(
+            f"{name:5}: {s['completion_tokens']:6d} output tokens, "
+            f"{s['call_seconds'] / s['requests'] * 1000:7.0f} ms/call, "
+            f"{s['wall_seconds'] * 1000:7.0f} ms wall"
+        )
+    print(f"output tokens: {echo['completion_tokens'] / ids['completion_tokens']:.1f}x fewer")
+    print(f"speedup      : {echo['wall_seconds'] / ids['wall_seconds']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: end-to-end relevance filtering latency for N articles against a
+local OpenAI-compatible stand-in (fixed time to first token + a cost per
+output token). One prompt holding every article (the old behaviour) vs
+token-budgeted chunks sent concurrently.
+
+Usage:
+    python benchmarks/bench_openai_relevance.py --articles 100 --concurrency 4
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.service.openai as oa
+from benchmarks.openai_standin import StandInOpenAI
+
+KINDS = [
+    "Tesla shares jump as market cheers deliveries",
+    "Celebrity spotted driving a Tesla",
+    "Tesla stock market value slides after recall",
+    "Local football club wins again",
+]
+
+
+def make_articles(n: int):
+    return [
+        {
+            "title": f"{KINDS[i % len(KINDS)]} ({i})",
+            "url": f"https://news.example/2025/09/{i}",
+            "source": {"id": None, "name": "Reuters"},
+            "description": "Lorem ipsum " * 10,
+        }
+        for i in range(n)
+    ]
+
+
+def timed(articles, **kwargs):
+    stats = {}
+    t0 = time.perf_counter()
+    kept = oa.filter_relevant_articles(articles, api_key="k", company="Tesla", stats=stats, **kwargs)
+    return time.perf_counter() - t0, kept, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=15)
+    parser.add_argument("--ttft", type=float, default=0.4, help="seconds to first token")
+    parser.add_argument("--per-token", type=float, default=0.01, help="seconds per output token")
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    with StandInOpenAI(latency=args.ttft, per_output_token=args.per_token) as api:
+        oa.OPENAI_BASE_URL = api.url
+        t_one, kept_one, _ = timed(
+            articles, concurrency=1, chunk_size=10**6, chunk_tokens=10**9
+        )
+        out_one = api.completion_tokens
+        t_chunk, kept_chunk, stats = timed(
+            articles, concurrency=args.concurrency, chunk_size=args.chunk_size
+        )
+        out_chunk = api.completion_tokens - out_one
+
+    assert kept_one == kept_chunk
+    print(f"{args.articles} articles, {len(kept_chunk)} relevant")
+    print(f"single prompt          : {t_one * 1000:8.0f} ms, {out_one} output tokens")
+    print(
+        f"chunked x{args.concurrency:<2} ({stats['chunks']} chunks): "
+        f"{t_chunk * 1000:8.0f} ms, {out_chunk} output tokens"
+    )
+    print(f"speedup                : {t_one / t_chunk:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
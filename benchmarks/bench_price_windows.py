@@ -0,0 +1,62 @@
+"""
+Benchmark: N price windows for one symbol, per-window filter_ohlcv_by_range +
+aggregate_price_change over the dict list vs one vectorized window_stats call
+over the cached PriceSeries (which also adds drawdown and volatility).
+
+Usage:
+    python benchmarks/bench_price_windows.py --years 20 --windows 1000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_ohlcv_parse import make_payload
+from src.service.ohlcv import PriceSeries
+from src.service.pre_processing import (
+    aggregate_price_change,
+    filter_ohlcv_by_range,
+    format_av_daily_data,
+)
+from src.service.price_stats import window_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--windows", type=int, default=1000)
+    args = parser.parse_args()
+
+    payload = make_payload(args.years)
+    rows = format_av_daily_data(payload)
+    series = PriceSeries.from_av(payload)
+    first, last = series.row(0)["date"], series.row(-1)["date"]
+    span = (last - first).days
+    rnd = random.Random(0)
+    windows = []
+    for _ in range(args.windows):
+        a = first + datetime.timedelta(days=rnd.randint(0, span))
+        windows.append((a, a + datetime.timedelta(days=rnd.randint(1, 30))))
+
+    t0 = time.perf_counter()
+    for a, b in windows:
+        aggregate_price_change(filter_ohlcv_by_range(rows, a, b))
+    t_loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    window_stats(series, windows)
+    t_vec = time.perf_counter() - t0
+
+    print(f"{len(series)} trading days, {args.windows} windows")
+    print(f"per-window filter+aggregate : {t_loop * 1000:9.1f} ms")
+    print(f"window_stats (vectorized)   : {t_vec * 1000:9.1f} ms")
+    print(f"speedup                     : {t_loop / t_vec:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
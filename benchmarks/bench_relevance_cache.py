@@ -0,0 +1,71 @@
+"""
+Benchmark: relevance filtering over overlapping runs against a local
+OpenAI-compatible stand-in. Each run covers a sliding window of articles that
+shares most of its URLs with the previous one; with the relevance cache only
+the new articles are sent to the model.
+
+Usage:
+    python benchmarks/bench_relevance_cache.py --window 100 --step 20 --runs 5
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.service.openai as oa
+from benchmarks.openai_standin import StandInOpenAI
+from benchmarks.bench_openai_relevance import make_articles
+from src.service.tiered_cache import TieredCache
+
+
+def sliding_runs(articles, window, step, runs, use_cache):
+    timings, requests = [], []
+    for r in range(runs):
+        batch = articles[r * step : r * step + window]
+        stats = {}
+        t0 = time.perf_counter()
+        oa.filter_relevant_articles(
+            batch, api_key="k", company="Tesla", stats=stats, use_cache=use_cache
+        )
+        timings.append(time.perf_counter() - t0)
+        requests.append(stats.get("requests", 0))
+    return timings, requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--window", type=int, default=100)
+    parser.add_argument("--step", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--ttft", type=float, default=0.4, help="seconds to first token")
+    parser.add_argument("--per-token", type=float, default=0.01, help="seconds per output token")
+    args = parser.parse_args()
+
+    articles = make_articles(args.window + args.step * (args.runs - 1))
+    cache = TieredCache(None, table="relevance")
+    oa.get_relevance_cache = lambda: cache
+    with StandInOpenAI(latency=args.ttft, per_output_token=args.per_token) as api:
+        oa.OPENAI_BASE_URL = api.url
+        t_off, r_off = sliding_runs(articles, args.window, args.step, args.runs, False)
+        t_on, r_on = sliding_runs(articles, args.window, args.step, args.runs, True)
+        t0 = time.perf_counter()
+        stats = {}
+        oa.filter_relevant_articles(
+            articles[: args.window], api_key="k", company="Tesla", stats=stats
+        )
+        t_full = time.perf_counter() - t0
+
+    print(f"{args.runs} runs of {args.window} articles, window moves by {args.step}")
+    print(f"no cache  : {sum(t_off) * 1000:8.0f} ms total, {sum(r_off)} OpenAI calls")
+    print(f"cached    : {sum(t_on) * 1000:8.0f} ms total, {sum(r_on)} OpenAI calls")
+    warm = sum(t_on[1:]) / max(1, len(t_on) - 1)
+    print(f"  warm runs (after the first): {warm * 1000:.0f} ms/run")
+    print(f"fully cached rerun: {t_full * 1000:.2f} ms, {stats.get('requests', 0)} OpenAI calls")
+    print(f"speedup   : {sum(t_off) / sum(t_on):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
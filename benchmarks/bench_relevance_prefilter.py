@@ -0,0 +1,126 @@
+"""
+Benchmark: OpenAI relevance filtering with and without the local embedding
+prefilter, against a local OpenAI-compatible stand-in. Reports how many
+articles still reach the LLM (call reduction), the number of LLM calls, wall
+time and how often the prefilter's decision agrees with the LLM-only run.
+
+--embedder minilm uses the real sentence-transformers model (needs the
+package and the model download); --embedder hashing uses a hashed
+bag-of-words embedder so the scheduling effect can be measured offline.
+
+Usage:
+    python benchmarks/bench_relevance_prefilter.py --articles 200 --accept 0.25 --reject 0.1
+"""
+
+import os
+import re
+import sys
+import time
+import zlib
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.service.openai as oa
+from src.service import relevance_prefilter as rp
+from benchmarks.openai_standin import StandInOpenAI
+
+# (title, description); the stand-in LLM keeps titles containing "market"
+KINDS = [
+    ("Tesla shares jump as market cheers deliveries",
+     "Investors bid up the stock after quarterly deliveries beat analyst estimates."),
+    ("Celebrity spotted driving a Tesla",
+     "The singer was photographed leaving a restaurant in Los Angeles."),
+    ("Tesla stock market value slides after recall",
+     "The recall weighs on shares as analysts cut price targets and earnings estimates."),
+    ("Local football club wins again",
+     "The team extended its unbeaten run with a late goal on Saturday."),
+    ("Tesla opens showroom near the market square",
+     "The new store is part of expansion plans; investors were not told of costs."),
+    ("Tesla boss speaks at technology conference",
+     "Remarks covered robotics and software, with few details for shareholders."),
+]
+
+
+def make_articles(n: int):
+    return [
+        {
+            "title": f"{KINDS[i % len(KINDS)][0]} ({i})",
+            "url": f"https://news.example/2025/09/{i}",
+            "source": {"id": None, "name": "Reuters"},
+            "description": KINDS[i % len(KINDS)][1],
+        }
+        for i in range(n)
+    ]
+
+
+def hashing_embedder(texts, dim=256):
+    out = np.zeros((len(texts), dim), dtype="float32")
+    for row, text in enumerate(texts):
+        for word in re.findall(r"[a-z]+", text.lower()):
+            if len(word) > 3 and word != "tesla":
+                out[row, zlib.crc32(word.encode()) % dim] += 1.0
+    return out
+
+
+def run(articles, accept, reject, embed):
+    llm_stats, stats = {}, {}
+
+    def llm(arts):
+        return oa.filter_relevant_articles(
+            arts, api_key="k", company="Tesla", stats=llm_stats, use_cache=False
+        )
+
+    t0 = time.perf_counter()
+    kept = rp.prefilter_relevant_articles(
+        articles, "Tesla", llm, accept=accept, reject=reject, embed=embed, stats=stats
+    )
+    return time.perf_counter() - t0, kept, stats, llm_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--accept", type=float, default=0.25)
+    parser.add_argument("--reject", type=float, default=0.1)
+    parser.add_argument("--embedder", choices=("minilm", "hashing"), default="hashing")
+    parser.add_argument("--ttft", type=float, default=0.4, help="seconds to first token")
+    parser.add_argument("--per-token", type=float, default=0.01, help="seconds per output token")
+    args = parser.parse_args()
+
+    embed = hashing_embedder if args.embedder == "hashing" else rp.embed_texts
+    articles = make_articles(args.articles)
+    with StandInOpenAI(latency=args.ttft, per_output_token=args.per_token) as api:
+        oa.OPENAI_BASE_URL = api.url
+        t_llm, kept_llm, _, s_llm = run(articles, None, None, embed)
+        if args.embedder == "minilm":
+            rp.embed_texts(["warm-up"])  # keep model load out of the timing
+        t_pre, kept_pre, stats, s_pre = run(articles, args.accept, args.reject, embed)
+
+    llm_urls = {a["url"] for a in kept_llm}
+    pre_urls = {a["url"] for a in kept_pre}
+    agree = sum((a["url"] in llm_urls) == (a["url"] in pre_urls) for a in articles)
+    print(
+        f"{args.articles} articles, embedder={args.embedder}, "
+        f"accept={args.accept}, reject={args.reject}"
+    )
+    print(
+        f"LLM only  : {t_llm * 1000:7.0f} ms, {args.articles} articles to LLM, "
+        f"{s_llm.get('requests', 0)} calls"
+    )
+    print(
+        f"prefilter : {t_pre * 1000:7.0f} ms, {stats['forwarded']} articles to LLM, "
+        f"{s_pre.get('requests', 0)} calls "
+        f"({stats['accepted']} accepted, {stats['rejected']} rejected locally)"
+    )
+    print(
+        f"call reduction: {stats['call_reduction']:.0%}, "
+        f"agreement with LLM only: {agree / len(articles):.0%}"
+    )
+    print(f"speedup       : {t_llm / t_pre:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
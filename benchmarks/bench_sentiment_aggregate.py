@@ -0,0 +1,93 @@
+"""
+Benchmark: aggregate sentiment, per-article Python loop vs the vectorized
+aggregator, and a 31-day chart as 31 per-day calls vs one rolling call.
+
+Usage:
+    python benchmarks/bench_sentiment_aggregate.py --n 100000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import datetime as dt
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.service.sentiment_finBERT import label_to_signed
+from src.service.sentiment_aggregate import (
+    SentimentAggregator,
+    encode_articles,
+    rolling_sentiment,
+)
+
+
+def make_articles(n: int, days: int = 31, seed: int = 0) -> list[dict]:
+    rnd = random.Random(seed)
+    start = dt.datetime(2025, 1, 1)
+    return [
+        {
+            "sentiment_label": rnd.choice(["positive", "neutral", "negative"]),
+            "sentiment_conf": rnd.random(),
+            "published_at": (
+                start + dt.timedelta(minutes=rnd.randrange(days * 1440))
+            ).isoformat()
+            + "Z",
+        }
+        for _ in range(n)
+    ]
+
+
+def loop_aggregate(articles):
+    """The original four-pass implementation (score + three label counts)."""
+    sum_w = sum_ws = 0.0
+    for a in articles:
+        conf = float(a.get("sentiment_conf", 0.0) or 0.0)
+        sum_w += conf
+        sum_ws += conf * label_to_signed(a.get("sentiment_label"), conf)
+    counts = {
+        lb: sum(1 for a in articles if a.get("sentiment_label") == lb)
+        for lb in ("positive", "neutral", "negative")
+    }
+    return sum_ws / sum_w if sum_w else 0.0, counts
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=100_000)
+    args = parser.parse_args()
+
+    arts = make_articles(args.n)
+    codes, confs, _ = encode_articles(arts)
+    agg = SentimentAggregator()
+
+    t_loop = _time(lambda: loop_aggregate(arts))
+    t_encode = _time(lambda: encode_articles(arts))
+    t_vec = _time(lambda: agg.add_arrays(codes, confs))
+    print(f"python loop       : {t_loop * 1000:8.2f} ms")
+    print(f"encode (once)     : {t_encode * 1000:8.2f} ms")
+    print(f"vectorized pass   : {t_vec * 1000:8.2f} ms")
+
+    by_day = {}
+    for a in arts:
+        by_day.setdefault(a["published_at"][:10], []).append(a)
+    t_daily = _time(
+        lambda: [SentimentAggregator.from_articles(v).result() for v in by_day.values()]
+    )
+    t_roll = _time(lambda: rolling_sentiment(arts, "D"))
+    print(f"31 per-day calls  : {t_daily * 1000:8.2f} ms")
+    print(f"1 rolling call    : {t_roll * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: eager PyTorch vs int8 ONNX Runtime FinBERT backend.
+
+Reports articles/sec for both, the speedup, label agreement and the mean/max
+absolute difference in class probabilities (the accuracy cost of quantization).
+
+Usage:
+    python benchmarks/bench_sentiment_backends.py --n 300 --batch-size 32
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_sentiment_batching import make_texts, _rate
+from src.service.sentiment_finBERT import score_texts
+
+
+def _timed(texts, batch_size, backend):
+    score_texts(texts[:8], batch_size=batch_size, backend=backend)  # warm-up / export
+    t0 = time.perf_counter()
+    res = score_texts(texts, batch_size=batch_size, backend=backend)
+    return res, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    texts = make_texts(args.n)
+    torch_res, t_torch = _timed(texts, args.batch_size, "torch")
+    onnx_res, t_onnx = _timed(texts, args.batch_size, "onnx")
+
+    agree = sum(a["label"] == b["label"] for a, b in zip(torch_res, onnx_res))
+    deltas = [
+        abs(p - q)
+        for a, b in zip(torch_res, onnx_res)
+        for p, q in zip(a["probs"], b["probs"])
+    ]
+    print(f"articles:          {args.n}")
+    print(f"torch:             {_rate(args.n, t_torch):8.1f} articles/sec ({t_torch:.2f}s)")
+    print(f"onnx int8:         {_rate(args.n, t_onnx):8.1f} articles/sec ({t_onnx:.2f}s)")
+    print(f"speedup:           {t_torch / t_onnx:8.2f}x")
+    print(f"label agreement:   {agree}/{args.n} ({100.0 * agree / args.n:.1f}%)")
+    print(f"prob delta:        mean {sum(deltas) / len(deltas):.4f}, max {max(deltas):.4f}")
+
+
+if __name__ == "__main__":
+    main()
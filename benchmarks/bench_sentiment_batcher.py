@@ -0,0 +1,61 @@
+"""
+Benchmark: concurrent sessions scoring FinBERT directly vs through the shared
+micro-batching queue.
+
+Each of --sessions threads scores --requests small requests of --per-request
+headlines (like one Streamlit _run), either calling score_texts itself or
+going through get_batcher(). Reports aggregate articles/sec and the queue's
+batch-size histogram.
+
+Usage:
+    python benchmarks/bench_sentiment_batcher.py --sessions 8 --requests 10 --per-request 4
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_sentiment_batching import make_texts, _rate
+from src.service.sentiment_finBERT import _load, score_texts
+from src.service.sentiment_batcher import get_batcher
+
+
+def _drive(fn, chunks, sessions):
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as ex:
+        list(ex.map(fn, chunks))
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--per-request", type=int, default=4)
+    args = parser.parse_args()
+
+    n = args.sessions * args.requests * args.per_request
+    texts = make_texts(n)
+    chunks = [texts[i : i + args.per_request] for i in range(0, n, args.per_request)]
+    _load()
+    score_texts(texts[:8])  # warm-up
+
+    t_direct = _drive(score_texts, chunks, args.sessions)
+    batcher = get_batcher()
+    t_queue = _drive(batcher.score, chunks, args.sessions)
+    m = batcher.metrics()
+
+    print(f"sessions x requests x texts: {args.sessions} x {args.requests} x {args.per_request} = {n}")
+    print(f"direct score_texts:  {_rate(n, t_direct):8.1f} articles/sec ({t_direct:.2f}s)")
+    print(f"micro-batch queue:   {_rate(n, t_queue):8.1f} articles/sec ({t_queue:.2f}s)")
+    print(f"speedup:             {t_direct / t_queue:8.2f}x")
+    print(f"batches: {m['batches']}, mean size: {m['mean_batch_size']}")
+    print(f"batch-size histogram: {m['batch_size_histogram']}")
+
+
+if __name__ == "__main__":
+    main()
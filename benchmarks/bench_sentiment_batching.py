@@ -0,0 +1,76 @@
+"""
+Benchmark: per-article FinBERT loop vs batched, length-bucketed scoring.
+
+Usage:
+    python benchmarks/bench_sentiment_batching.py --n 200 --batch-size 32
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.service.sentiment_finBERT import _load, score_text, score_texts
+
+HEADLINES = [
+    "Tesla beats delivery expectations",
+    "Shares plunge after regulator widens probe into Autopilot crashes",
+    "Apple to hold annual shareholder meeting",
+    "Nvidia raises full-year guidance as data-center demand stays strong",
+    "Oil slips as inventories build for a third straight week",
+    "Bank earnings mixed; net interest income falls short of analyst forecasts",
+]
+FILLER = (
+    "Analysts said the move reflects broader market conditions and investors "
+    "will watch the next quarterly report closely"
+)
+
+
+def make_texts(n: int, seed: int = 0) -> list[str]:
+    """Headline + a random-length description, like NewsAPI title+description."""
+    rnd = random.Random(seed)
+    words = FILLER.split()
+    out = []
+    for _ in range(n):
+        desc = " ".join(rnd.choices(words, k=rnd.randint(0, 60)))
+        out.append(f"{rnd.choice(HEADLINES)}. {desc}".strip())
+    return out
+
+
+def _rate(n: int, seconds: float) -> float:
+    return n / seconds if seconds > 0 else float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    texts = make_texts(args.n)
+    _load()
+    score_texts(texts[:4])  # warm-up
+
+    t0 = time.perf_counter()
+    loop = [score_text(t) for t in texts]
+    t_loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched = score_texts(texts, batch_size=args.batch_size)
+    t_batch = time.perf_counter() - t0
+
+    agree = sum(a["label"] == b["label"] for a, b in zip(loop, batched))
+    print(f"articles:            {args.n}")
+    print(f"per-item loop:       {_rate(args.n, t_loop):8.1f} articles/sec ({t_loop:.2f}s)")
+    print(
+        f"batched (bs={args.batch_size:>3}):    {_rate(args.n, t_batch):8.1f} articles/sec ({t_batch:.2f}s)"
+    )
+    print(f"speedup:             {t_loop / t_batch:8.2f}x")
+    print(f"label agreement:     {agree}/{args.n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: full FinBERT vs the lexicon-first cascade at several thresholds.
+
+For each threshold reports articles/sec, the fraction routed to FinBERT and
+label agreement with full-FinBERT scoring, so a backfill can pick its
+accuracy/throughput trade-off.
+
+Usage:
+    python benchmarks/bench_sentiment_cascade.py --n 500 --thresholds 0.5 0.7 0.9
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_sentiment_batching import make_texts, _rate
+from src.service.sentiment_finBERT import _load, score_texts, score_texts_cascade
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.7, 0.9])
+    args = parser.parse_args()
+
+    texts = make_texts(args.n)
+    _load()
+    score_texts(texts[:4])  # warm-up
+
+    def finbert(batch):
+        return score_texts(batch, batch_size=args.batch_size)
+
+    t0 = time.perf_counter()
+    reference = finbert(texts)
+    t_full = time.perf_counter() - t0
+    print(f"full FinBERT       {_rate(args.n, t_full):8.1f} art/s")
+
+    for th in args.thresholds:
+        stats = {}
+        t0 = time.perf_counter()
+        out = score_texts_cascade(texts, th, finbert, stats=stats)
+        dt = time.perf_counter() - t0
+        agree = sum(a["label"] == b["label"] for a, b in zip(out, reference)) / args.n
+        print(
+            f"cascade @ {th:<5}    {_rate(args.n, dt):8.1f} art/s  "
+            f"routed {stats['cascade']['routed_fraction']:.1%}  agreement {agree:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
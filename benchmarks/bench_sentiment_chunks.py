@@ -0,0 +1,82 @@
+"""
+Benchmark: body-level sentiment, one forward pass per chunk vs all chunks of
+all articles in shared length-bucketed batches.
+
+Reports cost per 1k chunks (seconds) for both, plus the pooled result spread
+across pooling methods.
+
+Usage:
+    python benchmarks/bench_sentiment_chunks.py --articles 100 --sentences 20
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_sentiment_batching import HEADLINES, FILLER
+from src.service.sentiment_finBERT import _load, score_text, score_texts
+from src.service.sentiment_chunks import POOLING, article_chunks, score_articles_chunked
+
+
+def make_articles(n: int, sentences: int, seed: int = 0) -> list[dict]:
+    rnd = random.Random(seed)
+    words = FILLER.split()
+    out = []
+    for _ in range(n):
+        body = " ".join(
+            f"{rnd.choice(HEADLINES)}. {' '.join(rnd.choices(words, k=rnd.randint(5, 25)))}."
+            for _ in range(rnd.randint(1, sentences))
+        )
+        out.append(
+            {
+                "title": rnd.choice(HEADLINES),
+                "description": " ".join(rnd.choices(words, k=12)),
+                "content": f"{body} [+{rnd.randint(500, 5000)} chars]",
+            }
+        )
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--sentences", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles, args.sentences)
+    chunks = [c for a in articles for c in article_chunks(a)]
+    n = len(chunks)
+    _load()
+    score_texts(chunks[:4])  # warm-up
+
+    t0 = time.perf_counter()
+    for c in chunks:
+        score_text(c)
+    t_loop = time.perf_counter() - t0
+
+    def scorer(texts):
+        return score_texts(texts, batch_size=args.batch_size)
+
+    t0 = time.perf_counter()
+    pooled = score_articles_chunked(articles, scorer, "mean")
+    t_batched = time.perf_counter() - t0
+
+    print(f"{args.articles} articles -> {n} chunks")
+    print(f"per-chunk loop : {t_loop / n * 1000:8.2f} s / 1k chunks")
+    print(f"shared batches : {t_batched / n * 1000:8.2f} s / 1k chunks")
+    print(f"speedup        : {t_loop / t_batched:8.2f}x")
+    for method in POOLING:
+        res = score_articles_chunked(articles, scorer, method)
+        labels = [r["label"] for r in res]
+        counts = ", ".join(f"{lb}={labels.count(lb)}" for lb in sorted(set(labels)))
+        print(f"{method:<10} {counts}")
+    assert len(pooled) == args.articles
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: FinBERT throughput vs number of pool workers.
+
+Scales workers 1, 2, 4, ... up to the physical core count and reports
+articles/sec, speedup over one worker and parallel efficiency.
+
+Usage:
+    python benchmarks/bench_sentiment_pool.py --n 2000 --batch-size 32
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_sentiment_batching import make_texts, _rate
+from src.service.sentiment_pool import SentimentPool, physical_cores
+
+
+def _worker_counts(max_workers: int) -> list[int]:
+    counts, w = [], 1
+    while w < max_workers:
+        counts.append(w)
+        w *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-workers", type=int, default=physical_cores())
+    parser.add_argument("--backend", default=None)
+    args = parser.parse_args()
+
+    texts = make_texts(args.n)
+    print(f"articles: {args.n}, physical cores: {physical_cores()}")
+    print(f"{'workers':>7} {'threads':>7} {'art/sec':>9} {'speedup':>8} {'efficiency':>10}")
+    base = None
+    for w in _worker_counts(args.max_workers):
+        with SentimentPool(workers=w, backend=args.backend, batch_size=args.batch_size) as pool:
+            pool.score_texts(texts[: w * args.batch_size])  # warm up every worker
+            t0 = time.perf_counter()
+            pool.score_texts(texts)
+            elapsed = time.perf_counter() - t0
+        rate = _rate(args.n, elapsed)
+        base = base or rate
+        print(
+            f"{w:>7} {pool.threads_per_worker:>7} {rate:>9.1f} {rate / base:>7.2f}x {100 * rate / base / w:>9.0f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
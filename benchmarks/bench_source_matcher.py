@@ -0,0 +1,81 @@
+"""
+Benchmark: trusted-source filtering, per-article fuzzy extractOne (old
+is_trusted_source) vs the compiled SourceMatcher.
+
+Reports articles/sec for both and how many articles reach the LLM and
+FinBERT stages with the old threshold=0 behaviour vs the matcher threshold.
+
+Usage:
+    python benchmarks/bench_source_matcher.py --n 2000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from resources.trusted_sources import trusted_domains, trusted_sources
+from src.service.source_matcher import TRUSTED_SOURCE_THRESHOLD, SourceMatcher
+
+UNTRUSTED = [
+    ("Yahoo Entertainment", "yahoo.com"), ("Biztoc.com", "biztoc.com"),
+    ("Gizmodo.com", "gizmodo.com"), ("Slashdot.org", "slashdot.org"),
+    ("The Times of India", "timesofindia.indiatimes.com"),
+    ("Economic Times", "economictimes.indiatimes.com"), ("PRNewswire", "prnewswire.com"),
+    ("GlobeNewswire", "globenewswire.com"), ("Electrek", "electrek.co"),
+    ("Teslarati", "teslarati.com"), ("Fox Business", "foxbusiness.com"),
+]
+
+
+def make_articles(n: int, trusted_share: float = 0.4, seed: int = 0) -> list[dict]:
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        if rnd.random() < trusted_share:
+            name = rnd.choice(trusted_sources)
+            domain = trusted_domains[name][0]
+        else:
+            name, domain = rnd.choice(UNTRUSTED)
+        out.append({"source": {"name": name}, "url": f"https://www.{domain}/a/{i}"})
+    return out
+
+
+def legacy_is_trusted(source, threshold):
+    from fuzzywuzzy import process
+
+    result = process.extractOne(source, trusted_sources)
+    return bool(result) and result[1] >= threshold
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=2000)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", module="fuzzywuzzy")
+
+    arts = make_articles(args.n)
+    t0 = time.perf_counter()
+    legacy = [a for a in arts if legacy_is_trusted(a["source"]["name"], 0)]
+    t_legacy = time.perf_counter() - t0
+
+    matcher = SourceMatcher(trusted_sources, trusted_domains)
+    t0 = time.perf_counter()
+    kept = [a for a in arts if matcher.is_trusted(a["source"]["name"], a["url"])]
+    t_matcher = time.perf_counter() - t0
+
+    print(f"legacy extractOne : {args.n / t_legacy:10.0f} art/s  kept {len(legacy)}/{args.n}")
+    print(
+        f"SourceMatcher     : {args.n / t_matcher:10.0f} art/s  kept {len(kept)}/{args.n}"
+        f"  (threshold {TRUSTED_SOURCE_THRESHOLD})"
+    )
+    print(f"speedup           : {t_legacy / t_matcher:10.1f}x")
+    print(f"downstream LLM/FinBERT work cut by {1 - len(kept) / max(1, len(legacy)):.0%}")
+    print(f"lookup stats      : {matcher.stats}")
+
+
+if __name__ == "__main__":
+    main()
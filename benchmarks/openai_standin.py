@@ -0,0 +1,157 @@
+"""
+Local OpenAI-compatible stand-in for /v1/chat/completions, used by the
+relevance benchmarks and tests.
+
+It reads the articles out of the prompt (numbered "[n] Title: ..." blocks,
+or "Title: ..." / "URL: ..." blocks for the echo format), keeps those whose
+title satisfies `relevant(title)` and answers in the matching format:
+{"relevant": [{"id", "score"}]} or the echoed article list. Latency models
+a real LLM: a fixed time to first token plus a cost per output token, so
+echoing long JSON is slow. With rpm set, requests beyond rpm per `window`
+seconds get a 429 like the real API.
+"""
+
+import re
+import json
+import time
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+_ARTICLE_RE = re.compile(r"Title: (.*)\nURL: (.*)\nSource: (.*)\n")
+_NUMBERED_RE = re.compile(r"\[(\d+)\] Title: (.*)\n")
+
+
+def _default_relevant(title: str) -> bool:
+    return "market" in title.lower()
+
+
+class StandInOpenAI:
+    def __init__(
+        self,
+        latency: float = 0.2,
+        per_output_token: float = 0.002,
+        relevant: Callable[[str], bool] = _default_relevant,
+        garbage_if: str | None = None,
+        rpm: int = 0,
+        window: float = 60.0,
+    ):
+        self.latency = latency
+        self.per_output_token = per_output_token
+        self.relevant = relevant
+        self.garbage_if = garbage_if
+        self.rpm = rpm
+        self.window = window
+        self.rate_limited = 0
+        self._accepted = deque()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        self._limit_lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = body["messages"][-1]["content"]
+                if api.over_limit():
+                    error = {"message": "Rate limit reached", "type": "requests"}
+                    self.reply(429, {"error": error})
+                    return
+                with lock:
+                    api.requests += 1
+                    api.in_flight += 1
+                    api.max_in_flight = max(api.max_in_flight, api.in_flight)
+                try:
+                    content = api.answer(prompt)
+                    prompt_tokens = sum(len(m["content"]) for m in body["messages"]) // 4
+                    completion_tokens = max(1, len(content) // 4)
+                    time.sleep(api.latency + api.per_output_token * completion_tokens)
+                    with lock:
+                        api.prompt_tokens += prompt_tokens
+                        api.completion_tokens += completion_tokens
+                finally:
+                    with lock:
+                        api.in_flight -= 1
+                out = {
+                    "id": "chatcmpl-standin",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "stand-in"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": content},
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                }
+                self.reply(200, out)
+
+            def reply(self, status, out):
+                payload = json.dumps(out).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    def over_limit(self) -> bool:
+        if not self.rpm:
+            return False
+        with self._limit_lock:
+            now = time.monotonic()
+            while self._accepted and self._accepted[0] <= now - self.window:
+                self._accepted.popleft()
+            if len(self._accepted) >= self.rpm:
+                self.rate_limited += 1
+                return True
+            self._accepted.append(now)
+            return False
+
+    def answer(self, prompt: str) -> str:
+        if self.garbage_if and self.garbage_if in prompt:
+            return "Sorry, I cannot help with that."
+        numbered = _NUMBERED_RE.findall(prompt)
+        if numbered:
+            return json.dumps(
+                {
+                    "relevant": [
+                        {"id": int(n), "score": 0.9}
+                        for n, t in numbered
+                        if self.relevant(t)
+                    ]
+                }
+            )
+        kept = [
+            {"title": t, "url": u, "source": s}
+            for t, u, s in _ARTICLE_RE.findall(prompt)
+            if self.relevant(t)
+        ]
+        return json.dumps(kept)
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -1,42 +1,25 @@
 
 
 '''
-This file contains a list of trusted sources that are used to filter out
-unreliable news sources. This list is used by the NewsAPI class in the
-news_api.py file to filter out news articles from untrusted sources.
+This file exposes the list of trusted sources that are used to filter out
+unreliable news sources. The list itself lives in trusted_sources.json
+(source -> domains, optional weight) so it can be edited without a
+redeploy; running pipelines pick changes up through
+src/service/source_registry.py. The names below are a snapshot taken at
+import time, kept for code that wants a plain list.
 
 '''
 
+import os
+import json
 
-trusted_sources = [
-    # --- Core Financial & Market News ---
-    "Bloomberg", "Reuters", "Financial Times", "Wall Street Journal", "CNBC",
-    "Forbes", "Yahoo Finance", "MarketWatch", "Investing.com", "The Economist",
-    "Barron's", "Business Insider", "TheStreet", "Seeking Alpha", "Nikkei Asia",
-    "Financial Post", "Fortune", "Motley Fool", "Kiplinger", "ValueWalk",
-    "TipRanks", "Zacks Investment Research", "Morningstar", "Simply Wall St",
-    "Benzinga",
+TRUSTED_SOURCES_FILE = os.path.join(os.path.dirname(__file__), "trusted_sources.json")
 
-    # --- Major Newspapers / Broadcasters ---
-    "BBC News", "The Guardian", "The New York Times", "The Washington Post",
-    "The Telegraph", "The Times (UK)", "The Independent", "Politico",
-    "The Hill",
+with open(TRUSTED_SOURCES_FILE, encoding="utf-8") as _f:
+    _registry = json.load(_f)["sources"]
 
-    # --- Commodities, Energy & Metals ---
-    "OilPrice.com", "Mining.com", "Platts (S&P Global)", "Gold.org",
-    "Argus Media", "Hellenic Shipping News", "ICIS",
-
-    # --- Technology & Business Impact ---
-    "TechCrunch", "The Verge", "Wired", "Ars Technica",
-    "MIT Technology Review", "VentureBeat",
-
-    # --- Crypto / Digital Assets ---
-    "CoinDesk", "Cointelegraph", "Decrypt", "CryptoSlate",
-    "Bitcoin Magazine", "The Block", "Messari",
-
-    # --- Institutions & Research ---
-    "International Monetary Fund", "World Bank", "OECD",
-    "Bank for International Settlements", "Federal Reserve",
-    "European Central Bank", "Bank of England", "Bank of Japan"
-]
+trusted_sources = list(_registry)
 
+# Canonical web domains per trusted source, used for exact lookup on the
+# article URL's domain (subdomains such as uk.reuters.com match too).
+trusted_domains = {name: entry.get("domains", []) for name, entry in _registry.items()}
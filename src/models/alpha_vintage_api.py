@@ -95,9 +95,11 @@
 #     return data
 import os
 import sys
-import requests
+import time
 import datetime
 from dotenv import load_dotenv
+from src.models.http_cache import cached_call
+from src.models.http_client import http_get
 
 # Load environment variables from .env file
 load_dotenv()
@@ -120,18 +122,23 @@ def av_symbol_search(
     """
     av_key = av_api_key or ALPHA_VINTAGE_API_KEY
     av_url = av_api_url or ALPHA_VINTAGE_API_URL
-    if not av_key or not av_url:
-        raise ValueError(
-            "Alpha Vantage API key or URL not set in environment variables."
-        )
 
     params = {"function": "SYMBOL_SEARCH", "keywords": query, "apikey": av_key}
-    r = requests.get(av_url, params=params, timeout=15)
-    r.raise_for_status()
-    data = r.json()
+
+    def fetch():
+        if not av_key or not av_url:
+            raise ValueError(
+                "Alpha Vantage API key or URL not set in environment variables."
+            )
+        r = http_get(av_url, params=params, timeout=15)
+        r.raise_for_status()
+        data = r.json()
+        if not data.get("bestMatches"):
+            raise RuntimeError(f"No matches for '{query}': {data}")
+        return data
+
+    data = cached_call("av_search", params, fetch, url=av_url)
     matches = data.get("bestMatches", []) or []
-    if not matches:
-        raise RuntimeError(f"No matches for '{query}': {data}")
 
     # Normalize + score
     def key(m):
@@ -161,23 +168,28 @@ def av_time_series_daily(
     """
     av_key = av_api_key or ALPHA_VINTAGE_API_KEY
     av_url = av_api_url or ALPHA_VINTAGE_API_URL
-    if not av_key or not av_url:
-        raise ValueError(
-            "Alpha Vantage API key or URL not set in environment variables."
-        )
 
     params = {"function": "TIME_SERIES_MONTHLY", "symbol": ticker, "apikey": av_key}
-    r = requests.get(av_url, params=params, timeout=15)
-    r.raise_for_status()
-    data = r.json()
-    if "Error Message" in data:
-        raise RuntimeError(
-            f"Error from Alpha Vantage for '{ticker}': {data['Error Message']}"
-        )
+
+    def fetch():
+        if not av_key or not av_url:
+            raise ValueError(
+                "Alpha Vantage API key or URL not set in environment variables."
+            )
+        r = http_get(av_url, params=params, timeout=15)
+        r.raise_for_status()
+        data = r.json()
+        if "Error Message" in data:
+            raise RuntimeError(
+                f"Error from Alpha Vantage for '{ticker}': {data['Error Message']}"
+            )
+        if not data.get("Monthly Time Series"):
+            raise RuntimeError(f"No time series data for '{ticker}': {data}")
+        return data
+
+    data = cached_call("av_monthly", params, fetch, url=av_url)
     meta = data.get("Meta Data", {})
     ts = data.get("Monthly Time Series", {}) or {}
-    if not ts:
-        raise RuntimeError(f"No time series data for '{ticker}': {data}")
 
     # Convert date strings to datetime.date and values to float
     time_series = {}
@@ -195,30 +207,41 @@ def av_time_series_daily(
 
 
 def get_av_daily_data(
-    ticker, av_api_url: str | None = None, av_api_key: str | None = None
+    ticker,
+    av_api_url: str | None = None,
+    av_api_key: str | None = None,
+    delay: float = 0.0,
 ) -> dict:
     """
     Get the daily time series data for a given ticker from Alpha Vantage API.
+    `delay` seconds are slept before a live request (not when the response
+    comes from the record/replay cache) to stay under the free-tier rate.
     """
     av_key = av_api_key or ALPHA_VINTAGE_API_KEY
     av_url = av_api_url or ALPHA_VINTAGE_API_URL
-    if not av_key or not av_url:
-        raise ValueError(
-            "Alpha Vantage API key or URL not set in environment variables."
-        )
 
     params = {
         "function": "TIME_SERIES_DAILY",
         "symbol": ticker,
         "apikey": av_key,
     }
-    response = requests.get(av_url, params=params)
-    response.raise_for_status()
-    data = response.json()
-    if "Error Message" in data:
-        raise RuntimeError(
-            f"Error from Alpha Vantage for '{ticker}': {data['Error Message']}"
-        )
-    if "Time Series (Daily)" not in data:
-        raise RuntimeError(f"No daily time series data for '{ticker}': {data}")
-    return data
+
+    def fetch():
+        if not av_key or not av_url:
+            raise ValueError(
+                "Alpha Vantage API key or URL not set in environment variables."
+            )
+        if delay:
+            time.sleep(delay)
+        response = http_get(av_url, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        if "Error Message" in data:
+            raise RuntimeError(
+                f"Error from Alpha Vantage for '{ticker}': {data['Error Message']}"
+            )
+        if "Time Series (Daily)" not in data:
+            raise RuntimeError(f"No daily time series data for '{ticker}': {data}")
+        return data
+
+    return cached_call("av_daily", params, fetch, url=av_url)
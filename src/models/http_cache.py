@@ -0,0 +1,154 @@
+"""
+Record/replay cache for external API responses (NewsAPI, Alpha Vantage, OpenAI).
+
+Each fetcher routes its network call through cached_call(endpoint, params,
+call, url=...). Entries are keyed by the endpoint name, the base URL (scheme,
+host and path, so a sandbox or proxy never shares entries with production)
+and the request parameters (sorted, API keys removed), so the same request
+made with a different key hits the same entry. Values are the validated JSON payloads, never errors.
+
+HTTP_CACHE_MODE:
+  off     - no caching (default)
+  record  - serve entries younger than the endpoint's TTL, otherwise call the
+            API and store the result; if the API fails, fall back to a stale
+            entry when one exists
+  replay  - never touch the network: serve any recorded entry regardless of
+            age and raise ReplayMiss when there is none
+"""
+
+import os
+import json
+import hashlib
+from urllib.parse import urlsplit
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict
+from logging_config import logger
+from src.service.tiered_cache import TieredCache
+
+HTTP_CACHE_MODE = os.getenv("HTTP_CACHE_MODE", "off").strip().lower()
+HTTP_CACHE_PATH = os.getenv(
+    "HTTP_CACHE_PATH", os.path.join(".cache", "http_cache.sqlite")
+)
+MODES = ("off", "record", "replay")
+
+# seconds; override one with HTTP_CACHE_TTL_<ENDPOINT>, e.g. HTTP_CACHE_TTL_NEWSAPI=60
+_DEFAULT_TTLS = {
+    "newsapi": 15 * 60,
+    "av_daily": 6 * 3600,
+    "av_monthly": 24 * 3600,
+    "av_search": 7 * 24 * 3600,
+    "openai": 7 * 24 * 3600,
+}
+HTTP_CACHE_TTLS = {
+    name: float(os.getenv(f"HTTP_CACHE_TTL_{name.upper()}", ttl))
+    for name, ttl in _DEFAULT_TTLS.items()
+}
+_SECRET_PARAMS = {"apikey", "api_key", "key", "token", "access_token"}
+
+
+class ReplayMiss(RuntimeError):
+    """Replay mode found no recorded response for a request."""
+
+
+def public_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Request parameters without API keys or None values, strings stripped."""
+    return {
+        k: v.strip() if isinstance(v, str) else v
+        for k, v in params.items()
+        if k.lower() not in _SECRET_PARAMS and v is not None
+    }
+
+
+def base_url(url: str | None) -> str:
+    """scheme://host[:port]/path of `url`, lower-cased host, no query or trailing /."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def request_key(endpoint: str, params: Dict[str, Any], url: str | None = None) -> str:
+    """sha256 of endpoint + base URL + sorted params, API-key parameters left out."""
+    blob = json.dumps(
+        [endpoint, base_url(url), public_params(params)],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_http_cache() -> TieredCache:
+    """Process-wide cache instance (memory-only if HTTP_CACHE_PATH is empty)."""
+    return TieredCache(HTTP_CACHE_PATH or None, maxsize=512, table="http")
+
+
+_MISS = object()
+
+
+def _lookup(endpoint: str, params: Dict[str, Any], url: str | None, mode: str):
+    """(key, cached value or _MISS) for a record/replay mode request."""
+    key = request_key(endpoint, params, url)
+    if mode == "replay":
+        hit = get_http_cache().get_many([key])
+        if key not in hit:
+            raise ReplayMiss(
+                f"No recorded {endpoint} response from {base_url(url) or '?'} "
+                f"for {public_params(params)}"
+            )
+        return key, hit[key]
+    hit = get_http_cache().get_many([key], max_age=HTTP_CACHE_TTLS.get(endpoint))
+    return key, hit.get(key, _MISS)
+
+
+def _stale_or_raise(endpoint: str, key: str, error: Exception) -> Any:
+    stale = get_http_cache().get_many([key])
+    if key not in stale:
+        raise error
+    logger.warning(f"{endpoint} failed ({error}); serving stale cached response")
+    return stale[key]
+
+
+def cached_call(
+    endpoint: str,
+    params: Dict[str, Any],
+    call: Callable[[], Any],
+    mode: str | None = None,
+    url: str | None = None,
+) -> Any:
+    """Result of call(), served from / recorded into the cache per HTTP_CACHE_MODE."""
+    mode = mode or HTTP_CACHE_MODE
+    if mode not in MODES or mode == "off":
+        return call()
+    key, value = _lookup(endpoint, params, url, mode)
+    if value is not _MISS:
+        return value
+    try:
+        value = call()
+    except Exception as e:
+        return _stale_or_raise(endpoint, key, e)
+    get_http_cache().put(key, value)
+    return value
+
+
+async def cached_acall(
+    endpoint: str,
+    params: Dict[str, Any],
+    acall: Callable[[], Awaitable[Any]],
+    mode: str | None = None,
+    url: str | None = None,
+) -> Any:
+    """cached_call for coroutine functions (the async OpenAI client)."""
+    mode = mode or HTTP_CACHE_MODE
+    if mode not in MODES or mode == "off":
+        return await acall()
+    key, value = _lookup(endpoint, params, url, mode)
+    if value is not _MISS:
+        return value
+    try:
+        value = await acall()
+    except Exception as e:
+        return _stale_or_raise(endpoint, key, e)
+    get_http_cache().put(key, value)
+    return value
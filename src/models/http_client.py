@@ -0,0 +1,170 @@
+"""
+Shared HTTP transport for every external fetcher (NewsAPI, Alpha Vantage).
+
+One requests.Session per process keeps a keep-alive connection pool per host
+(HTTPAdapter), so repeated calls to the same API reuse TCP/TLS connections.
+get() retries connection errors and 429/5xx responses with jittered
+exponential backoff, waits exactly as long as a Retry-After header asks, and
+never runs past the call's deadline. Counters for requests, retries and
+connection reuse are available from metrics().
+"""
+
+import os
+import time
+import random
+import threading
+import email.utils
+from functools import lru_cache
+from typing import Dict, Any
+from logging_config import logger
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+HTTP_DEADLINE = float(os.getenv("HTTP_DEADLINE", "45"))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF", "0.5"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "20"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def backoff_delay(
+    attempt: int, base: float = HTTP_BACKOFF, cap: float = HTTP_BACKOFF_MAX
+) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0.0, min(cap, base * (2**attempt)))
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Retry-After header (delta seconds or HTTP date) -> seconds, None if absent/bad."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class HttpClient:
+    """Pooled, retrying GET client. Thread-safe; share one per process."""
+
+    def __init__(
+        self,
+        pool_size: int = HTTP_POOL_SIZE,
+        retries: int = HTTP_RETRIES,
+        timeout: float = HTTP_TIMEOUT,
+        deadline: float = HTTP_DEADLINE,
+    ):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.retries = retries
+        self.timeout = timeout
+        self.deadline = deadline
+        self.session = requests.Session()
+        # retries are done here (Retry-After, deadline, metrics), not by urllib3
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self._lock = threading.Lock()
+        self._metrics = {"requests": 0, "attempts": 0, "retries": 0, "failures": 0}
+
+    def _count(self, **deltas: int):
+        with self._lock:
+            for k, v in deltas.items():
+                self._metrics[k] += v
+
+    def get(
+        self,
+        url: str,
+        params: Dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        retries: int | None = None,
+        **kwargs,
+    ):
+        """
+        GET with retries. `timeout` bounds one attempt, `deadline` the whole
+        call including backoff sleeps (seconds). Returns the last response,
+        which may still be a 429/5xx once retries or the deadline run out;
+        the last connection error is re-raised the same way.
+        """
+        import requests
+
+        timeout = self.timeout if timeout is None else timeout
+        retries = self.retries if retries is None else retries
+        end = time.monotonic() + (self.deadline if deadline is None else deadline)
+        self._count(requests=1)
+        attempt = 0
+        while True:
+            remaining = end - time.monotonic()
+            self._count(attempts=1)
+            resp, error = None, None
+            try:
+                resp = self.session.get(
+                    url,
+                    params=params,
+                    timeout=max(0.1, min(timeout, remaining)),
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            if resp is not None and resp.status_code not in RETRY_STATUSES:
+                return resp
+
+            wait = backoff_delay(attempt)
+            if resp is not None:
+                hinted = retry_after_seconds(resp.headers.get("Retry-After"))
+                if hinted is not None:
+                    wait = hinted
+            if attempt >= retries or time.monotonic() + wait >= end:
+                self._count(failures=1)
+                if error is not None:
+                    raise error
+                return resp
+            reason = error or f"HTTP {resp.status_code}"
+            logger.warning(
+                f"GET {url} failed ({reason}); retry {attempt + 1} in {wait:.2f}s"
+            )
+            self._count(retries=1)
+            time.sleep(wait)
+            attempt += 1
+
+    def metrics(self) -> Dict[str, int]:
+        """Request/retry counters plus connections opened vs reused, per pool."""
+        with self._lock:
+            out = dict(self._metrics)
+        opened = served = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                served += pool.num_requests
+        out["connections_opened"] = opened
+        out["connections_reused"] = max(0, served - opened)
+        return out
+
+    def close(self):
+        self.session.close()
+
+
+@lru_cache(maxsize=1)
+def get_client() -> HttpClient:
+    """The process-wide client used by all API modules."""
+    return HttpClient()
+
+
+def http_get(url: str, params: Dict[str, Any] | None = None, **kwargs):
+    """get_client().get(...) - the call every fetcher makes."""
+    return get_client().get(url, params=params, **kwargs)
+
+
+def http_metrics() -> Dict[str, int]:
+    return get_client().metrics()
@@ -1,10 +1,12 @@
 import os
 import sys
 from datetime import datetime
-import requests
-from typing import List, Dict, Any
+from functools import partial
+from typing import List, Dict, Any, Iterator
 from urllib.parse import urlparse
 from dotenv import load_dotenv
+from logging_config import logger
+from src.models.http_cache import cached_call
 
 load_dotenv()
 
@@ -15,21 +17,29 @@ NEWS_API_KEY = os.getenv("NEWS_API_KEY", "fdac2281006a456d88ae4acccd2490eb")
 NEWS_API_URL = os.getenv("NEWS_API_URL", "https://newsapi.org/v2/everything")
 
 
+# pagination: NewsAPI allows at most 100 articles per page, and the developer
+# plan serves only the first 100 results of a query (raise this on paid plans)
+NEWS_API_PAGE_SIZE = int(os.getenv("NEWS_API_PAGE_SIZE", "100"))
+NEWS_API_MAX_RESULTS = int(os.getenv("NEWS_API_MAX_RESULTS", "100"))
+NEWS_API_CONCURRENCY = int(os.getenv("NEWS_API_CONCURRENCY", "4"))
+
+
 def get_news_articles_urls(
     query: str,
     date_from: str | None = None,
     date_to: str | None = None,
     api_key: str | None = None,
     base_url: str | None = None,
+    page: int | None = None,
+    page_size: int | None = None,
 ):
     """
     Fetch raw NewsAPI response for a company name (query).
     date_from/date_to should be ISO 'YYYY-MM-DD' if provided.
+    page/page_size select one page of the results (NewsAPI defaults otherwise);
+    see iter_news_articles for all pages.
     """
     key = api_key or NEWS_API_KEY
-    if not key:
-        raise RuntimeError("NEWS_API_KEY not set. export NEWS_API_KEY=...")
-
     url = base_url or NEWS_API_URL or "https://newsapi.org/v2/everything"
 
     params = {
@@ -42,48 +52,163 @@ def get_news_articles_urls(
         params["from"] = str(date_from)[:10]
     if date_to:
         params["to"] = str(date_to)[:10]
+    if page:
+        params["page"] = int(page)
+    if page_size:
+        params["pageSize"] = int(page_size)
 
-    try:
-        resp = requests.get(url, params=params, timeout=10)
-    except requests.RequestException as e:
-        raise RuntimeError(f"NewsAPI request failed: {e}")
+    def fetch():
+        if not key:
+            raise RuntimeError("NEWS_API_KEY not set. export NEWS_API_KEY=...")
 
-    if resp.status_code != 200:
-        snippet = resp.text[:300].replace("\n", " ")
-        raise RuntimeError(f"NewsAPI HTTP {resp.status_code}. Body: {snippet}")
+        import requests  # deferred so importing the pipeline stays cheap
+        from src.models.http_client import http_get
 
-    try:
-        data = resp.json()
-    except ValueError:
-        snippet = resp.text[:300].replace("\n", " ")
-        raise RuntimeError(f"NewsAPI returned non-JSON response. Body: {snippet}")
+        try:
+            resp = http_get(url, params=params, timeout=10)
+        except requests.RequestException as e:
+            raise RuntimeError(f"NewsAPI request failed: {e}")
 
-    if data.get("status") != "ok":
-        raise RuntimeError(f"NewsAPI error: {data}")
+        if resp.status_code != 200:
+            snippet = resp.text[:300].replace("\n", " ")
+            raise RuntimeError(f"NewsAPI HTTP {resp.status_code}. Body: {snippet}")
 
-    return data
+        try:
+            data = resp.json()
+        except ValueError:
+            snippet = resp.text[:300].replace("\n", " ")
+            raise RuntimeError(f"NewsAPI returned non-JSON response. Body: {snippet}")
 
+        if data.get("status") != "ok":
+            raise RuntimeError(f"NewsAPI error: {data}")
+        return data
 
-def extract_title_url_content(data):
-    articles = data["articles"]
-    title_url_content = []
-    for article in articles:
-        title = article.get("title", "No title available")
-        source = article.get("source", "No source available")
-        url = article.get("url", "No url available")
-        description = article.get("description", "No description available")
-        content = article.get("content", "No content available")
-        title_url_content.append(
-            {
-                "title": title,
-                "source": source,
-                "url": url,
-                "description": description,
-                "content": content,
-            }
+    return cached_call("newsapi", params, fetch, url=url)
+
+
+def iter_news_articles(
+    query: str,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    api_key: str | None = None,
+    base_url: str | None = None,
+    *,
+    page_size: int = NEWS_API_PAGE_SIZE,
+    max_results: int = NEWS_API_MAX_RESULTS,
+    concurrency: int = NEWS_API_CONCURRENCY,
+    status: Dict[str, Any] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield raw NewsAPI articles across all result pages.
+
+    Page 1 is fetched first to learn totalResults; the remaining pages, up to
+    min(totalResults, max_results), are requested concurrently (at most
+    `concurrency` in flight) and their articles are yielded as each page
+    arrives, so callers can start work before the last page lands. Pages are
+    not yielded in order. A failing later page (e.g. the plan's result cap)
+    is logged and skipped; a failing first page raises like
+    get_news_articles_urls.
+
+    Pass a dict as `status` to learn whether the result was exhaustive: it is
+    filled with total_results, fetched, skipped_pages and complete, which is
+    True only once the generator is exhausted with every one of
+    totalResults articles yielded (no max_results cut, no skipped page).
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    page_size = max(1, min(100, page_size))
+    fetch = partial(
+        get_news_articles_urls,
+        query,
+        date_from,
+        date_to,
+        api_key,
+        base_url,
+        page_size=page_size,
+    )
+    if status is None:
+        status = {}
+    status.update(total_results=0, fetched=0, skipped_pages=[], complete=False)
+    first = fetch(page=1)
+    status["total_results"] = int(first.get("totalResults") or 0)
+    total = min(status["total_results"], max_results)
+    budget = total
+    for article in first.get("articles", [])[:budget]:
+        budget -= 1
+        status["fetched"] += 1
+        yield article
+
+    pages = -(-total // page_size)
+    if pages <= 1 or budget <= 0:
+        _finish(status)
+        return
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, pages - 1)),
+        thread_name_prefix="newsapi-page",
+    )
+    try:
+        futures = {executor.submit(fetch, page=p): p for p in range(2, pages + 1)}
+        for fut in as_completed(futures):
+            try:
+                data = fut.result()
+            except RuntimeError as e:
+                logger.warning(f"NewsAPI page {futures[fut]} skipped: {e}")
+                status["skipped_pages"].append(futures[fut])
+                continue
+            for article in data.get("articles", [])[:budget]:
+                budget -= 1
+                status["fetched"] += 1
+                yield article
+            if budget <= 0:
+                break
+        _finish(status)
+    finally:
+        # generator closed early -> drop pages that have not started yet
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _finish(status: Dict[str, Any]):
+    status["complete"] = (
+        status["fetched"] >= status["total_results"] and not status["skipped_pages"]
+    )
+    if not status["complete"]:
+        logger.warning(
+            f"NewsAPI result truncated: {status['fetched']} of "
+            f"{status['total_results']} articles, skipped pages {status['skipped_pages']}"
         )
 
-    return title_url_content
+
+def get_all_news_articles(query: str, date_from=None, date_to=None, **kwargs) -> Dict:
+    """
+    All pages collected into one NewsAPI-shaped response dict; "complete" is
+    False when the result was cut short (see iter_news_articles).
+    """
+    status: Dict[str, Any] = {}
+    articles = list(
+        iter_news_articles(query, date_from, date_to, status=status, **kwargs)
+    )
+    return {
+        "status": "ok",
+        "totalResults": len(articles),
+        "articles": articles,
+        "complete": status["complete"],
+    }
+
+
+def extract_article(article: Dict[str, Any]) -> Dict[str, Any]:
+    """Minimal fields of one raw NewsAPI article."""
+    return {
+        "title": article.get("title", "No title available"),
+        "source": article.get("source", "No source available"),
+        "url": article.get("url", "No url available"),
+        "description": article.get("description", "No description available"),
+        "content": article.get("content", "No content available"),
+        "published_at": article.get("publishedAt"),
+    }
+
+
+def extract_title_url_content(data):
+    return [extract_article(article) for article in data["articles"]]
 
 
 def print_news_articles(stock_name):
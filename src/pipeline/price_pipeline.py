@@ -1,13 +1,11 @@
 import os
-from src.models.alpha_vintage_api import get_av_daily_data
-from src.service.pre_processing import (
-    filter_ohlcv_by_range,
-    aggregate_price_change,
-    format_av_daily_data,
-)
+import threading
+from typing import Dict, List, Tuple
+from src.service.pre_processing import aggregate_price_change
+from src.service.ohlcv import PriceSeries
+from src.service.price_stats import window_stats
 from src.agent.us_resolver import resolve_us_ticker_basic as resolve_ticker
 import time
-from datetime import datetime
 from logging_config import logger
 
 
@@ -16,48 +14,82 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def price_pipeline(ticker, date_from, date_to, api_key=None, api_url=None):
-    logger.debug(
-        f"price_pipeline called with ticker: {ticker}, start_date: {date_from}, end_date: {date_to}"
-    )
-    av_api_key = api_key or os.getenv("ALPHA_VINTAGE_API_KEY")
-    av_api_url = api_url or os.getenv("ALPHA_VINTAGE_API_URL")
-    if not av_api_key or not av_api_url:
-        raise ValueError(
-            "Alpha Vantage API key or URL not set in environment variables."
-        )
+# fetched series per symbol, reused for PRICE_SERIES_TTL seconds
+PRICE_SERIES_TTL = float(os.getenv("PRICE_SERIES_TTL", "21600"))
+_series_cache: Dict[str, Tuple[float, PriceSeries]] = {}
+_series_lock = threading.Lock()
+
+
+def _resolve_symbol(ticker: str) -> str:
     resolved_ticker = resolve_ticker(ticker)
     logger.debug(f"Resolved ticker: {resolved_ticker}")
-    ticker_to_search = (
+    return (
         resolved_ticker.get("ticker")
         if isinstance(resolved_ticker, dict)
         else str(resolved_ticker)
     ).upper()
 
+
+def get_price_series(ticker, api_key=None, api_url=None) -> PriceSeries:
+    """
+    Daily PriceSeries for a company name / ticker. One Alpha Vantage fetch
+    per symbol per PRICE_SERIES_TTL; later calls reuse the cached series.
+    """
+    av_api_key = api_key or os.getenv("ALPHA_VINTAGE_API_KEY")
+    av_api_url = api_url or os.getenv("ALPHA_VINTAGE_API_URL")
+    if not av_api_key or not av_api_url:
+        raise ValueError(
+            "Alpha Vantage API key or URL not set in environment variables."
+        )
+    ticker_to_search = _resolve_symbol(ticker)
+
     # ticker_to_search = av_symbol_search(resolved_ticker, av_api_url, av_api_key)
     logger.debug(f"AlphaVantage symbol search result: {ticker_to_search}")
 
-    delay = 5  # to respect rate limits
-    time.sleep(delay)
-    av_daily_data = get_av_daily_data(ticker_to_search, av_api_url, av_api_key)
-    logger.debug(f"Got {len(av_daily_data)} days of data for {ticker_to_search}")
-    formatted_daily_data = format_av_daily_data(av_daily_data)
-    # Convert start_date and end_date to datetime.date
-    start_date = datetime.strptime(date_from, "%Y-%m-%d").date()
-    end_date = datetime.strptime(date_to, "%Y-%m-%d").date()
-
-    result = filter_ohlcv_by_range(formatted_daily_data, start_date, end_date)
-    percentage_change = aggregate_price_change(result)
-    _percent_change = (
-        percentage_change["percentage_change"] if percentage_change else 0.0
-    )
+    with _series_lock:
+        hit = _series_cache.get(ticker_to_search)
+    if hit and time.monotonic() - hit[0] < PRICE_SERIES_TTL:
+        return hit[1]
+
+    from src.models.alpha_vintage_api import get_av_daily_data  # pulls in requests
+
+    # 5 s before a live request to respect rate limits; cached responses skip it
+    av_daily_data = get_av_daily_data(ticker_to_search, av_api_url, av_api_key, delay=5)
+    series = PriceSeries.from_av(av_daily_data, ticker_to_search)
+    logger.debug(f"Got {len(series)} days of data for {ticker_to_search}")
+    with _series_lock:
+        _series_cache[ticker_to_search] = (time.monotonic(), series)
+    return series
+
+
+def price_windows(ticker, windows, api_key=None, api_url=None) -> List[Dict]:
+    """
+    Start/end price, percentage change, max drawdown and volatility for many
+    (date_from, date_to) windows of one symbol, e.g. per-article event windows
+    or price_stats.calendar_windows(...) weekly buckets, from one fetch.
+    """
+    series = get_price_series(ticker, api_key, api_url)
+    return window_stats(series, windows)
+
+
+def price_pipeline(ticker, date_from, date_to, api_key=None, api_url=None):
     logger.debug(
-        f"price_pipeline result: {{'first_day': {result[0]['date'] if result else None}, 'first_price': {result[0]['close'] if result else None}, 'last_day': {result[-1]['date'] if result else None}, 'last_price': {result[-1]['close'] if result else None}, 'percentage_change': {_percent_change}}}"
+        f"price_pipeline called with ticker: {ticker}, start_date: {date_from}, end_date: {date_to}"
     )
-    return {
-        "first_day": result[0]["date"] if result else None,
-        "first_price": result[0]["close"] if result else None,
-        "last_day": result[-1]["date"] if result else None,
-        "last_price": result[-1]["close"] if result else None,
+    series = get_price_series(ticker, api_key, api_url)
+
+    # ascending; nearest trading days around the range if it has none
+    window = series.range_or_nearest(date_from, date_to)
+    percentage_change = aggregate_price_change(window)
+    _percent_change = percentage_change.get("percentage_change") or 0.0
+    first = window.row(0) if len(window) else None
+    last = window.row(-1) if len(window) else None
+    result = {
+        "first_day": first["date"] if first else None,
+        "first_price": first["close"] if first else None,
+        "last_day": last["date"] if last else None,
+        "last_price": last["close"] if last else None,
         "percentage_change": _percent_change,
     }
+    logger.debug(f"price_pipeline result: {result}")
+    return result
@@ -3,7 +3,7 @@
 End-to-end pipeline (simple, title+description only).
 Input: a plain company name string (e.g., "Tesla").
 Flow:
-  fetch -> extract -> normalize -> trusted filter -> OpenAI relevance -> FinBERT -> aggregate (0..100)
+  fetch (paginated, streamed) -> extract -> normalize -> trusted filter -> OpenAI relevance -> FinBERT -> aggregate (0..100)
 """
 
 from __future__ import annotations
@@ -14,24 +14,18 @@ from typing import Optional
 from src.pipeline.price_pipeline import price_pipeline
 
 # --- your modules (adjust paths if needed) ---
-from src.models.news_api import get_news_articles_urls
-
-# Support either extractor name you used
-try:
-    from src.models.news_api import (
-        extract_title_url_content as extract_titles,
-    )
-except Exception:
-    from src.models.news_api import (
-        extract_title_and_urls as extract_titles,
-    )
+from src.models.news_api import iter_news_articles, extract_article
+from src.repository.article_store import get_article_store
 
 from src.service.pre_processing import filtered_articles  # your trusted filter
 from src.service.openai import filter_relevant_articles  # your OpenAI filter
+from src.service.relevance_prefilter import prefilter_relevant_articles
+from src.service.openai_scheduler import get_rate_limiter
 
 # FinBERT title+desc
 from src.service.sentiment_finBERT import enrich_with_sentiment  # FinBERT enrich
 from src.service.sentiment_finBERT import aggregate_sentiment  # 0..100 aggregator
+from src.service.sentiment_aggregate import rolling_sentiment  # per-day series
 
 
 def _to_datestr(d):
@@ -85,6 +79,8 @@ def run_pipeline(
     date_to: Optional[dt.date] = None,
     *,
     openai_api_key: str | None = None,
+    sentiment_mode: str | None = None,
+    sentiment_cascade: float | None = None,
 ) -> Dict[str, Any]:
     """
     Run the full pipeline for a company name within an optional date range (max 31 days).
@@ -93,6 +89,9 @@ def run_pipeline(
       company_name: e.g., "Tesla"
       date_from:    date object (inclusive)
       date_to:      date object (inclusive)
+      sentiment_mode: where FinBERT runs, see sentiment_finBERT.MODES
+      sentiment_cascade: lexicon confidence threshold for the cheap-first
+                         cascade (None = SENTIMENT_CASCADE_THRESHOLD / off)
 
     Returns:
       {
@@ -102,6 +101,14 @@ def run_pipeline(
         "count": int,
         "articles": [...],
         "aggregate_sentiment": {...}
+        "news_store": {"cached_days", "fetched_days", "fetches", "incomplete_fetches"} (empty if unused),
+        "relevance": {"cache_hits", "chunks", "requests", "completion_tokens", "queue_seconds", ...},
+        "relevance_prefilter": {"accepted", "rejected", "forwarded", "call_reduction", ...},
+        "openai_rate_limiter": {"requests", "waited", "wait_seconds", "window_requests", "window_tokens"},
+        "sentiment_cache": {"hits": int, "misses": int},
+        "sentiment_cascade": {"total", "routed", "routed_fraction", ...} | None,
+        "sentiment_content": {"pooling", "articles", "chunks"} | None,
+        "sentiment_by_day": [{"period": "YYYY-MM-DD", "score_0_100", ...}, ...],
         " percentage_change": float (0..100) | None,
         "Stock Price Start: Open price at start date, if available
         "Stock Price End: Close price at end date, if available
@@ -116,38 +123,76 @@ def run_pipeline(
     if date_from and date_to:
         date_from, date_to = _clip_dates(date_from, date_to)
 
-    # 1) Fetch raw (prefer passing dates to your fetcher if it supports them)
-    # try:
-    if date_from and date_to:
-        raw = get_news_articles_urls(
-            query=company_name.strip(),
-            date_from=_to_datestr(date_from),
-            date_to=_to_datestr(date_to),
+    # 1) Fetch all result pages (concurrently); articles stream in as pages land.
+    #    With a date range, days already in the local article store are served
+    #    from it and only the missing / still-open days hit NewsAPI.
+    query = company_name.strip()
+    store = get_article_store()
+    news_stats: Dict[str, int] = {}
+    if store is not None and date_from and date_to:
+        pages = store.iter_range(
+            query,
+            date_from,
+            date_to,
+            lambda q, lo, hi, status: iter_news_articles(
+                query=q, date_from=lo, date_to=hi, status=status
+            ),
+            stats=news_stats,
+        )
+    else:
+        pages = iter_news_articles(
+            query=query,
+            date_from=_to_datestr(date_from) if date_from else None,
+            date_to=_to_datestr(date_to) if date_to else None,
         )
 
     # 2) Extract minimal fields
-    extracted = extract_titles(raw)
+    extracted = (extract_article(a) for a in pages)
 
     # 3) Normalize
     # rows = normalize_minimal(extracted)
 
     # 3b) Local filter by date range if needed
     if date_from and date_to:
-        rows = [r for r in extracted if _within_range(r, date_from, date_to)]
+        extracted = (r for r in extracted if _within_range(r, date_from, date_to))
+    rows = list(extracted)
 
     # 4) Trusted-source filter
     trusted = filtered_articles(rows)
 
-    # 5) LLM relevance (OpenAI) — keep only relevant
-    final_articles: List[Dict[str, Any]] = filter_relevant_articles(
-        trusted, api_key=openai_api_key
+    # 5) LLM relevance (OpenAI) — keep only relevant; the embedding prefilter
+    #    (if thresholds are set) settles the obvious cases locally first
+    relevance_stats: Dict[str, Any] = {}
+    prefilter_stats: Dict[str, Any] = {}
+    limiter_before = get_rate_limiter().metrics()
+    final_articles: List[Dict[str, Any]] = prefilter_relevant_articles(
+        trusted,
+        query,
+        lambda arts: filter_relevant_articles(
+            arts, api_key=openai_api_key, company=query, stats=relevance_stats
+        ),
+        stats=prefilter_stats,
     )
-
-    # 6- FinBET Sentiment
-    enriched_articles = enrich_with_sentiment(final_articles)
+    # the limiter is process-wide: report this run's share of its counters
+    # and the window as it stands (other runs' requests included)
+    limiter_stats = get_rate_limiter().metrics()
+    for k in ("requests", "waited", "wait_seconds"):
+        limiter_stats[k] = round(limiter_stats[k] - limiter_before[k], 4)
+
+    # 6- FinBET Sentiment (cached per headline; stats = cache hits/misses)
+    sentiment_stats: Dict[str, Any] = {"hits": 0, "misses": 0}
+    enriched_articles = enrich_with_sentiment(
+        final_articles,
+        stats=sentiment_stats,
+        mode=sentiment_mode,
+        cascade_threshold=sentiment_cascade,
+    )
+    cascade_stats = sentiment_stats.pop("cascade", None)
+    content_stats = sentiment_stats.pop("content", None)
     # 7- Aggregate to a 0..100 score + tag
 
     agg = aggregate_sentiment(enriched_articles)
+    by_day = rolling_sentiment(enriched_articles, "D", start=date_from, end=date_to)
 
     # 8- Stock price change over the period (if date_from/date_to given)
     stock_date = (
@@ -167,8 +212,16 @@ def run_pipeline(
         "date_from": date_from.isoformat() if date_from else None,
         "date_to": date_to.isoformat() if date_to else None,
         "count": len(final_articles),
+        "news_store": news_stats,
+        "relevance": relevance_stats,
+        "relevance_prefilter": prefilter_stats,
+        "openai_rate_limiter": limiter_stats,
         "articles": final_articles,
         "aggregate": agg,
+        "sentiment_cache": sentiment_stats,
+        "sentiment_cascade": cascade_stats,
+        "sentiment_content": content_stats,
+        "sentiment_by_day": by_day,
         "price_change": stock_date["percentage_change"] if stock_date else None,
         "Stock Price Start": stock_date["first_price"] if stock_date else None,
         "Stock Price End": stock_date["last_price"] if stock_date else None,
@@ -0,0 +1,287 @@
+"""
+Day-sharded local store for raw NewsAPI articles.
+
+Articles are kept in SQLite keyed by (normalized query, UTC publication day,
+url), next to a table recording which days of a query have been fetched
+completely. A day is only marked complete when a fetch covering it was
+exhaustive (every result of the query returned, no result cap hit, no page
+skipped) and it ended more than ARTICLE_STORE_GRACE_DAYS ago, since NewsAPI
+keeps indexing articles for a while after they were published; today and the
+grace days are always fetched again. Asking for a range only goes to the
+network for the days that are not complete, one request per contiguous run
+of missing days; a fully covered range is served without any network access,
+which also makes it work offline.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import datetime as dt
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from logging_config import logger
+
+ARTICLE_STORE_PATH = os.getenv(
+    "ARTICLE_STORE_PATH", os.path.join(".cache", "articles.sqlite")
+)
+# days after a day has ended before it can be marked complete (late indexing)
+ARTICLE_STORE_GRACE_DAYS = int(os.getenv("ARTICLE_STORE_GRACE_DAYS", "2"))
+
+# fetch(query, date_from "YYYY-MM-DD", date_to "YYYY-MM-DD", status) -> raw
+# articles; once exhausted it must have set status["complete"] to True if the
+# result was exhaustive (see news_api.iter_news_articles)
+Fetcher = Callable[[str, str, str, Dict[str, Any]], Iterable[Dict[str, Any]]]
+
+
+def normalize_query(query: str) -> str:
+    """'  Tesla   Inc ' -> 'tesla inc'."""
+    return " ".join((query or "").lower().split())
+
+
+def _to_date(value) -> dt.date:
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, dt.date):
+        return value
+    return dt.date.fromisoformat(str(value).strip()[:10])
+
+
+def published_day(article: Dict[str, Any]) -> Optional[str]:
+    """UTC day ('YYYY-MM-DD') of a raw article's publishedAt, None if unknown."""
+    value = article.get("publishedAt") or article.get("published_at")
+    if not value:
+        return None
+    try:
+        ts = dt.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(dt.timezone.utc)
+    return ts.date().isoformat()
+
+
+def _days(start: dt.date, end: dt.date) -> List[str]:
+    return [
+        (start + dt.timedelta(days=i)).isoformat()
+        for i in range((end - start).days + 1)
+    ]
+
+
+def _in_run(article: Dict[str, Any], lo: str, hi: str) -> bool:
+    day = published_day(article)
+    return day is None or lo <= day <= hi
+
+
+def _runs(days: List[str]) -> List[Tuple[str, str]]:
+    """Sorted days -> contiguous (first, last) runs."""
+    runs: List[Tuple[str, str]] = []
+    for day in days:
+        prev = runs[-1][1] if runs else None
+        if prev and _to_date(day) - _to_date(prev) == dt.timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+class ArticleStore:
+    """SQLite-backed article shards with completed-day markers. Thread-safe."""
+
+    def __init__(
+        self, path: str = ARTICLE_STORE_PATH, grace_days: int = ARTICLE_STORE_GRACE_DAYS
+    ):
+        self.path = path
+        self.grace_days = grace_days
+        self._local = threading.local()
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _conn(self) -> sqlite3.Connection:
+        # one connection per thread, and never reuse one across a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                "query TEXT NOT NULL, day TEXT NOT NULL, url TEXT NOT NULL, "
+                "data TEXT NOT NULL, PRIMARY KEY (query, day, url))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS days ("
+                "query TEXT NOT NULL, day TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                "PRIMARY KEY (query, day))"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def complete_days(self, query: str, start, end) -> List[str]:
+        rows = (
+            self._conn()
+            .execute(
+                "SELECT day FROM days WHERE query = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (
+                    normalize_query(query),
+                    _to_date(start).isoformat(),
+                    _to_date(end).isoformat(),
+                ),
+            )
+            .fetchall()
+        )
+        return [r[0] for r in rows]
+
+    def missing_days(self, query: str, start, end) -> List[str]:
+        """Days of [start, end] that still need fetching (incl. the grace days)."""
+        start, end = _to_date(start), _to_date(end)
+        done = set(self.complete_days(query, start, end))
+        return [d for d in _days(start, end) if d not in done]
+
+    def put_articles(
+        self,
+        query: str,
+        articles: Iterable[Dict[str, Any]],
+        start,
+        end,
+        today: Optional[dt.date] = None,
+        complete: bool = True,
+    ):
+        """
+        Store articles fetched for [start, end]. If the fetch was exhaustive
+        (`complete`), also mark that range's days complete, except today and
+        the grace days before it. Articles outside the range or without a
+        publication date are not stored.
+        """
+        key = normalize_query(query)
+        lo, hi = _to_date(start).isoformat(), _to_date(end).isoformat()
+        rows = []
+        for a in articles:
+            day = published_day(a)
+            if day and lo <= day <= hi:
+                rows.append((key, day, a.get("url") or "", json.dumps(a)))
+        today = today or dt.datetime.now(dt.timezone.utc).date()
+        sealed = (today - dt.timedelta(days=self.grace_days)).isoformat()
+        closed = []
+        if complete:
+            closed = [
+                (key, d, time.time())
+                for d in _days(_to_date(lo), _to_date(hi))
+                if d < sealed
+            ]
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO articles (query, day, url, data) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO days (query, day, fetched_at) VALUES (?, ?, ?)",
+                closed,
+            )
+
+    def get_articles(self, query: str, start, end) -> List[Dict[str, Any]]:
+        """Stored raw articles of [start, end], oldest day first."""
+        rows = (
+            self._conn()
+            .execute(
+                "SELECT data FROM articles WHERE query = ? AND day BETWEEN ? AND ? "
+                "ORDER BY day, url",
+                (
+                    normalize_query(query),
+                    _to_date(start).isoformat(),
+                    _to_date(end).isoformat(),
+                ),
+            )
+            .fetchall()
+        )
+        return [json.loads(r[0]) for r in rows]
+
+    def iter_range(
+        self,
+        query: str,
+        start,
+        end,
+        fetch: Fetcher,
+        today: Optional[dt.date] = None,
+        stats: Optional[Dict[str, int]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every article of [start, end]: stored days first, then the
+        missing days from fetch(), one call per contiguous run of missing
+        days. A single run streams through as it arrives; several runs are
+        fetched concurrently and yielded run by run. Each run is stored once
+        it finishes; its days are marked complete only if the fetch reported
+        an exhaustive result. No fetch() call at all when the whole range is
+        complete. If `stats` is given, cached_days / fetched_days / fetches /
+        incomplete_fetches are added to it.
+        """
+        start, end = _to_date(start), _to_date(end)
+        missing = self.missing_days(query, start, end)
+        missing_set = set(missing)
+        stats = stats if stats is not None else {}
+        for k in ("cached_days", "fetched_days", "fetches", "incomplete_fetches"):
+            stats.setdefault(k, 0)
+        stats["cached_days"] += (end - start).days + 1 - len(missing)
+        for article in self.get_articles(query, start, end):
+            if published_day(article) not in missing_set:
+                yield article
+
+        runs = _runs(missing)
+        stats["fetches"] += len(runs)
+        stats["fetched_days"] += len(missing)
+        if not runs:
+            return
+        if len(runs) == 1:
+            # one gap: stream it straight through
+            lo, hi = runs[0]
+            logger.debug(f"Article store: fetching '{query}' {lo}..{hi}")
+            fetched, status = [], {}
+            for article in fetch(query, lo, hi, status):
+                fetched.append(article)
+                if _in_run(article, lo, hi):
+                    yield article
+            self._store_run(query, fetched, lo, hi, status, today, stats)
+            return
+
+        # several gaps (typically older days + today): fetch them concurrently
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        def fetch_run(run):
+            status: Dict[str, Any] = {}
+            return list(fetch(query, *run, status)), status
+
+        with ThreadPoolExecutor(max_workers=min(len(runs), 4)) as pool:
+            futures = {pool.submit(fetch_run, run): run for run in runs}
+            logger.debug(f"Article store: fetching '{query}' runs {runs}")
+            for fut in as_completed(futures):
+                lo, hi = futures[fut]
+                fetched, status = fut.result()
+                self._store_run(query, fetched, lo, hi, status, today, stats)
+                for article in fetched:
+                    if _in_run(article, lo, hi):
+                        yield article
+
+    def _store_run(self, query, fetched, lo, hi, status, today, stats):
+        complete = status.get("complete") is True
+        if not complete:
+            stats["incomplete_fetches"] += 1
+            logger.warning(
+                f"Article store: fetch of '{query}' {lo}..{hi} was not exhaustive; "
+                "its days stay open and will be fetched again"
+            )
+        self.put_articles(query, fetched, lo, hi, today=today, complete=complete)
+
+    def clear(self):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM articles")
+            conn.execute("DELETE FROM days")
+
+
+@lru_cache(maxsize=1)
+def get_article_store() -> Optional[ArticleStore]:
+    """Process-wide store; None when ARTICLE_STORE_PATH is empty (store disabled)."""
+    return ArticleStore(ARTICLE_STORE_PATH) if ARTICLE_STORE_PATH else None
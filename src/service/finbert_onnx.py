@@ -0,0 +1,89 @@
+"""
+ONNX Runtime backend for FinBERT (CPU).
+
+The checkpoint is exported once to ONNX, dynamically quantized to int8 and
+cached on local disk; later processes only open the cached file.
+Select it with SENTIMENT_BACKEND=onnx (or backend="onnx" per call).
+"""
+
+import os
+import copy
+import numpy as np
+from typing import Dict
+
+FINBERT_ONNX_DIR = os.getenv("FINBERT_ONNX_DIR", os.path.join(".cache", "finbert-onnx"))
+INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+def onnx_model_path(out_dir: str = FINBERT_ONNX_DIR, quantize: bool = True) -> str:
+    return os.path.join(out_dir, "model.int8.onnx" if quantize else "model.onnx")
+
+
+def export_onnx(
+    model, tokenizer, out_dir: str = FINBERT_ONNX_DIR, quantize: bool = True
+) -> str:
+    """
+    Export a HF sequence-classification model to ONNX (dynamic batch/seq axes),
+    optionally quantize weights to int8, and return the model path.
+    Files are written under a temp name and renamed, so concurrent exports are safe.
+    """
+    import torch
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    os.makedirs(out_dir, exist_ok=True)
+    fp32_path = onnx_model_path(out_dir, quantize=False)
+    tmp = f"{fp32_path}.{os.getpid()}.tmp"
+
+    sample = tokenizer(["Shares rise after earnings beat"], return_tensors="pt")
+    args = tuple(sample[name] for name in INPUT_NAMES)
+    axes = {name: {0: "batch", 1: "sequence"} for name in INPUT_NAMES}
+    axes["logits"] = {0: "batch"}
+    if next(model.parameters()).device.type != "cpu":
+        model = copy.deepcopy(model).to("cpu")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            args,
+            tmp,
+            input_names=INPUT_NAMES,
+            output_names=["logits"],
+            dynamic_axes=axes,
+            opset_version=14,
+        )
+    os.replace(tmp, fp32_path)
+    if not quantize:
+        return fp32_path
+
+    q_path = onnx_model_path(out_dir, quantize=True)
+    q_tmp = f"{q_path}.{os.getpid()}.tmp"
+    quantize_dynamic(fp32_path, q_tmp, weight_type=QuantType.QInt8)
+    os.replace(q_tmp, q_path)
+    return q_path
+
+
+def load_session(path: str, intra_op_threads: int | None = None):
+    """Open an ONNX Runtime CPU session with full graph optimizations."""
+    import onnxruntime as ort
+
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if intra_op_threads:
+        opts.intra_op_num_threads = intra_op_threads
+    return ort.InferenceSession(path, opts, providers=["CPUExecutionProvider"])
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    z = logits - logits.max(axis=-1, keepdims=True)
+    e = np.exp(z)
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+def predict_probs(session, batch: Dict[str, np.ndarray]) -> np.ndarray:
+    """Run one padded batch (numpy arrays from tokenizer.pad) -> class probabilities."""
+    feed = {
+        i.name: np.asarray(batch[i.name], dtype=np.int64)
+        for i in session.get_inputs()
+        if i.name in batch
+    }
+    logits = session.run(["logits"], feed)[0]
+    return softmax(logits.astype(np.float64))
@@ -0,0 +1,90 @@
+"""
+Local safetensors snapshot of the FinBERT checkpoint.
+
+The first process that loads the model from the Hugging Face hub writes
+tokenizer + config + model.safetensors into FINBERT_SNAPSHOT_DIR. Later
+processes load straight from that directory: no hub resolution, no random
+weight init, and the safetensors file is memory-mapped, so concurrent
+processes share its pages in the OS page cache instead of each holding a
+private copy of the weights.
+"""
+
+import os
+import json
+import shutil
+
+FINBERT_SNAPSHOT_DIR = os.getenv(
+    "FINBERT_SNAPSHOT_DIR", os.path.join(".cache", "finbert-snapshot")
+)
+_MANIFEST = "snapshot.json"
+
+
+def snapshot_ready(path: str, model_id: str, revision: str) -> bool:
+    """True if `path` holds a complete snapshot of model_id@revision."""
+    try:
+        with open(os.path.join(path, _MANIFEST), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return (
+        meta.get("model_id") == model_id
+        and meta.get("revision") == revision
+        and os.path.exists(os.path.join(path, "model.safetensors"))
+    )
+
+
+def save_snapshot(model, tokenizer, path: str, model_id: str, revision: str) -> str:
+    """
+    Write the snapshot into a temp directory and rename it into place, so a
+    reader never sees a half-written snapshot. An existing snapshot is first
+    renamed aside and only deleted once the new one is in place (restored if
+    the swap fails), so `path` is never left empty by a failed save.
+    """
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    backup = f"{path}.{os.getpid()}.old"
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        model.save_pretrained(tmp, safe_serialization=True)
+        tokenizer.save_pretrained(tmp)
+        with open(os.path.join(tmp, _MANIFEST), "w", encoding="utf-8") as f:
+            json.dump({"model_id": model_id, "revision": revision}, f)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    moved_aside = False
+    try:
+        if os.path.exists(path):
+            os.replace(path, backup)
+            moved_aside = True
+        os.replace(tmp, path)
+    except OSError:
+        # another process won the race (or the rename failed): keep what is there
+        shutil.rmtree(tmp, ignore_errors=True)
+        if moved_aside and not os.path.exists(path):
+            os.replace(backup, path)
+            moved_aside = False
+    if moved_aside:
+        # readers that already mapped the old files keep them until they close
+        shutil.rmtree(backup, ignore_errors=True)
+    return path
+
+
+def load_snapshot_tokenizer(path: str):
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(path, local_files_only=True)
+
+
+def load_snapshot_model(path: str):
+    """Model from a snapshot directory, with its weights memory-mapped."""
+    from transformers import AutoModelForSequenceClassification
+
+    return AutoModelForSequenceClassification.from_pretrained(
+        path,
+        local_files_only=True,
+        use_safetensors=True,
+        low_cpu_mem_usage=True,  # skip random init; keep mmap-backed tensors
+    )
@@ -0,0 +1,215 @@
+"""
+Columnar daily OHLCV data parsed straight from Alpha Vantage JSON.
+
+parse_av_daily turns the "Time Series (Daily)" object into one NumPy array
+per field (datetime64[D] dates, float64 prices, int64 volume) in a single
+pass over the payload; numpy does the string -> number conversion in C.
+The dict-per-day shape used elsewhere is available as OHLCVColumns.rows().
+
+PriceSeries wraps the columns of one symbol sorted ascending and read-only,
+with binary-search range slicing and nearest-trading-day lookups.
+"""
+
+import datetime
+import numpy as np
+from typing import Dict, List
+
+TIME_SERIES_KEY = "Time Series (Daily)"
+_UNIX_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+PRICE_FIELDS = ("open", "high", "low", "close", "adjusted_close")
+FIELDS = PRICE_FIELDS + ("volume",)
+# Alpha Vantage keys; TIME_SERIES_DAILY_ADJUSTED reports volume as "6. volume"
+_AV_KEYS = {
+    "open": "1. open",
+    "high": "2. high",
+    "low": "3. low",
+    "close": "4. close",
+    "adjusted_close": "5. adjusted close",
+}
+
+
+class OHLCVColumns:
+    """
+    Parallel arrays, one entry per trading day, in the order they were given.
+
+    Attributes: dates (datetime64[D]), open, high, low, close, adjusted_close
+    (float64) and volume (int64).
+    """
+
+    __slots__ = ("dates",) + FIELDS
+
+    def __init__(self, dates: np.ndarray, **columns: np.ndarray):
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        for name in PRICE_FIELDS:
+            setattr(self, name, np.asarray(columns[name], dtype=np.float64))
+        self.volume = np.asarray(columns["volume"], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + sum(getattr(self, f).nbytes for f in FIELDS)
+
+    def take(self, index) -> "OHLCVColumns":
+        """Subset by a slice (views, no copy) or an index array."""
+        return OHLCVColumns(
+            self.dates[index], **{f: getattr(self, f)[index] for f in FIELDS}
+        )
+
+    def rows(self) -> List[Dict]:
+        """The dict-per-day view: date as datetime.date, floats and int volume."""
+        cols = [self.dates.tolist()] + [getattr(self, f).tolist() for f in FIELDS]
+        keys = ("date",) + FIELDS
+        return [dict(zip(keys, values)) for values in zip(*cols)]
+
+
+def parse_av_daily(data: Dict) -> OHLCVColumns:
+    """Columns from an Alpha Vantage TIME_SERIES_DAILY(_ADJUSTED) response."""
+    time_series = data.get(TIME_SERIES_KEY, {}) or {}
+    n = len(time_series)
+    if not n:
+        empty = np.empty(0)
+        return OHLCVColumns(
+            np.empty(0, dtype="datetime64[D]"), **{f: empty for f in FIELDS}
+        )
+
+    o, h, lo, c, adj = (_AV_KEYS[f] for f in PRICE_FIELDS)
+    table = np.array(
+        [
+            (
+                v.get(o, 0),
+                v.get(h, 0),
+                v.get(lo, 0),
+                v.get(c, 0),
+                v.get(adj, 0),
+                v.get("5. volume") or v.get("6. volume", 0),
+            )
+            for v in time_series.values()
+        ],
+        dtype=np.float64,
+    )
+    return OHLCVColumns(
+        np.array(list(time_series), dtype="datetime64[D]"),
+        open=table[:, 0],
+        high=table[:, 1],
+        low=table[:, 2],
+        close=table[:, 3],
+        adjusted_close=table[:, 4],
+        volume=table[:, 5].astype(np.int64),
+    )
+
+
+def _dates_to_days(dates: List) -> np.ndarray:
+    if all(isinstance(d, datetime.date) for d in dates):
+        # integer ordinals convert ~15x faster than datetime.date objects
+        ordinals = np.fromiter((d.toordinal() for d in dates), np.int64, len(dates))
+        return (ordinals - _UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+    return np.array(dates, dtype="datetime64[D]")
+
+
+def rows_to_columns(rows: List[Dict]) -> OHLCVColumns:
+    """Columns from the dict-per-day shape (date as datetime.date or 'YYYY-MM-DD')."""
+    return OHLCVColumns(
+        _dates_to_days([r["date"] for r in rows]),
+        **{f: [r.get(f, 0) for r in rows] for f in FIELDS},
+    )
+
+
+def to_day(value) -> np.datetime64:
+    """datetime.date / datetime / 'YYYY-MM-DD' / datetime64 -> datetime64[D]."""
+    if isinstance(value, str):
+        value = value[:10]
+    return np.datetime64(value, "D")
+
+
+class PriceSeries:
+    """
+    Immutable daily price series for one symbol, sorted by date ascending.
+
+    Range slicing and nearest-trading-day lookups are binary searches over
+    the date column; slices are NumPy views, so nothing is copied per row.
+    """
+
+    __slots__ = ("symbol", "_cols")
+
+    def __init__(self, columns: OHLCVColumns, symbol: str | None = None):
+        dates = columns.dates
+        if len(dates) > 1 and not (dates[1:] >= dates[:-1]).all():
+            if (dates[1:] <= dates[:-1]).all():
+                columns = columns.take(slice(None, None, -1))  # AV order: newest first
+            else:
+                columns = columns.take(np.argsort(dates, kind="stable"))
+        for name in ("dates",) + FIELDS:
+            getattr(columns, name).flags.writeable = False
+        self.symbol = symbol
+        self._cols = columns
+
+    @classmethod
+    def from_av(cls, data: Dict, symbol: str | None = None) -> "PriceSeries":
+        meta_symbol = (data.get("Meta Data") or {}).get("2. Symbol")
+        return cls(parse_av_daily(data), symbol or meta_symbol)
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict], symbol: str | None = None) -> "PriceSeries":
+        return cls(rows_to_columns(rows), symbol)
+
+    @property
+    def columns(self) -> OHLCVColumns:
+        return self._cols
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._cols.dates
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._cols.close
+
+    def __len__(self) -> int:
+        return len(self._cols)
+
+    def _slice(self, index) -> "PriceSeries":
+        return PriceSeries(self._cols.take(index), self.symbol)
+
+    def range(self, start, end) -> "PriceSeries":
+        """Trading days with start <= date <= end (inclusive), as a view."""
+        lo = np.searchsorted(self.dates, to_day(start), side="left")
+        hi = np.searchsorted(self.dates, to_day(end), side="right")
+        return self._slice(slice(lo, max(lo, hi)))
+
+    def nearest_before(self, day, inclusive: bool = False) -> int | None:
+        """Index of the last trading day before `day` (or on it if inclusive)."""
+        side = "right" if inclusive else "left"
+        i = np.searchsorted(self.dates, to_day(day), side=side)
+        return int(i - 1) if i > 0 else None
+
+    def nearest_after(self, day, inclusive: bool = False) -> int | None:
+        """Index of the first trading day after `day` (or on it if inclusive)."""
+        side = "left" if inclusive else "right"
+        i = np.searchsorted(self.dates, to_day(day), side=side)
+        return int(i) if i < len(self) else None
+
+    def range_or_nearest(self, start, end) -> "PriceSeries":
+        """
+        range(start, end); if that has no trading days, the nearest day
+        before start and the nearest day after end instead.
+        """
+        window = self.range(start, end)
+        if len(window):
+            return window
+        picks = [
+            i
+            for i in (self.nearest_before(start), self.nearest_after(end))
+            if i is not None
+        ]
+        return self._slice(np.array(picks, dtype=np.intp))
+
+    def row(self, i: int) -> Dict:
+        return {
+            "date": self.dates[i].item(),
+            **{f: getattr(self._cols, f)[i].item() for f in FIELDS},
+        }
+
+    def rows(self) -> List[Dict]:
+        return self._cols.rows()
@@ -1,18 +1,59 @@
+"""
+OpenAI relevance filter.
+
+Articles are split into token-budgeted chunks that are judged concurrently
+(at most RELEVANCE_CONCURRENCY requests in flight) through one shared
+AsyncOpenAI client per API key. The client lives on a background event loop
+so synchronous callers (run_pipeline, Streamlit) can use it too.
+
+The model sees numbered articles and answers in JSON mode with only the
+numbers (and relevance scores) of the ones it keeps; the original article
+dicts are joined back locally, in input order. A chunk whose request or JSON
+fails keeps (or drops, RELEVANCE_ON_ERROR=drop) its own articles without
+affecting the other chunks.
+
+Decisions are remembered per (URL, company, prompt version, model) in the
+relevance cache, so only articles never judged before are sent to the model.
+Live calls are paced by the process-wide rate limiter in openai_scheduler
+(OPENAI_RPM_LIMIT / OPENAI_TPM_LIMIT).
+"""
+
+import os
 import json
-from openai import OpenAI
+import time
+import asyncio
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List
 from dotenv import load_dotenv
+from logging_config import logger
+from src.models import http_cache
+from src.models.http_cache import cached_acall
+from src.service.relevance_cache import decision_key, get_relevance_cache
+from src.service.openai_scheduler import count_tokens, get_rate_limiter, request_tokens
 
 load_dotenv()
 
 # api_key = os.getenv("OPENAI_API_KEY")
+OPENAI_RELEVANCE_MODEL = os.getenv("OPENAI_RELEVANCE_MODEL", "gpt-4o-mini")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+_OPENAI_DEFAULT_URL = "https://api.openai.com/v1"  # the client's own default
+RELEVANCE_CHUNK_TOKENS = int(os.getenv("RELEVANCE_CHUNK_TOKENS", "2500"))
+RELEVANCE_CHUNK_ARTICLES = int(os.getenv("RELEVANCE_CHUNK_ARTICLES", "15"))
+RELEVANCE_CONCURRENCY = int(os.getenv("RELEVANCE_CONCURRENCY", "4"))
+RELEVANCE_ON_ERROR = os.getenv("RELEVANCE_ON_ERROR", "keep")  # keep | drop
+# ids: the model returns numbers (+ scores) of relevant articles;
+# echo: the model re-types every kept article as JSON (the original format)
+RELEVANCE_OUTPUT = os.getenv("RELEVANCE_OUTPUT", "ids")
+OUTPUT_FORMATS = ("ids", "echo")
+_SUMMARY_CHARS = 200
+# output-token budget per article in a chunk
+_OUTPUT_TOKENS_PER_ARTICLE = {"ids": 12, "echo": 60}
 
+SYSTEM_PROMPT = "You are an AI financial news assistant with expertise in markets, investments and global economny."
 
-def filter_relevant_articles(articles, api_key: str | None = None) -> list[dict]:
-    """
-    This functions sends a batch of articles to OpenAI and
-    filters only the most relevant ones.
-    """
-    prompt = """
+RELEVANCE_PROMPT = """
     #Role:
     You are an AI financial news assistant with expertise in markets,
     investments and global economny.
@@ -30,15 +71,16 @@ def filter_relevant_articles(articles, api_key: str | None = None) -> list[dict]
     company PR announcements, minor updates, general economy news without clear financial insights).
     5- Language** – Articles should be in English."""
 
-    formatted_articles = "\n".join(
-        [
-            f"Title: {a['title']}\nURL: {a['url']}\nSource: {a['source']}\n"
-            for a in articles
-        ]
-    )
-
-    # Add LLM Instructinos
-    prompt += formatted_articles + (
+INSTRUCTIONS = {
+    "ids": (
+        "\n\n **Instructions:**\n"
+        "- Select only the **most relevant** articles that meet the criteria above.\n"
+        "- Answer with a JSON object holding their numbers and a relevance score "
+        "between 0 and 1, like this:\n"
+        '{"relevant": [{"id": 3, "score": 0.92}, {"id": 7, "score": 0.71}]}\n'
+        '- Use {"relevant": []} if none qualify. Return JSON only.'
+    ),
+    "echo": (
         "\n\n **Instructions:**\n*"
         "- Returns only the **most relevant articles that meet the criteria above. \n"
         "-Keep the format **strictly as JSON** like this:\n"
@@ -46,35 +88,346 @@ def filter_relevant_articles(articles, api_key: str | None = None) -> list[dict]
         '[{"title": "Example Title", "url": "https://example.com","source":"Reuters"}]\n'
         "'''\n"
         "- Do **not** include any explainabtion, markdowns, or extra text. Return JSON only."
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def prompt_version(output: str) -> str:
+    """Hash of everything in the prompt except the articles; part of the cache key."""
+    h = hashlib.sha256()
+    for part in (
+        SYSTEM_PROMPT,
+        RELEVANCE_PROMPT,
+        INSTRUCTIONS[output],
+        str(_SUMMARY_CHARS),
+    ):
+        h.update(part.encode("utf-8") + b"\0")
+    return h.hexdigest()[:16]
+
+
+def estimate_tokens(text: str) -> int:
+    """Prompt-token count for the relevance model (tiktoken, or ~4 chars/token)."""
+    return count_tokens(text, OPENAI_RELEVANCE_MODEL)
+
+
+def _source_name(article: Dict) -> str:
+    source = article.get("source")
+    if isinstance(source, dict):
+        return source.get("name") or ""
+    return str(source or "")
+
+
+def format_article(article: Dict, number: int | None = None) -> str:
+    """Prompt block for one article: numbered with a summary, or with its URL (echo)."""
+    if number is None:
+        return (
+            f"Title: {article.get('title')}\nURL: {article.get('url')}\n"
+            f"Source: {_source_name(article)}\n"
+        )
+    summary = " ".join((article.get("description") or "").split())[:_SUMMARY_CHARS]
+    return (
+        f"[{number}] Title: {article.get('title')}\n"
+        f"Source: {_source_name(article)}\nSummary: {summary}\n"
     )
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY not provided.")
 
-    client = OpenAI(api_key=api_key)
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an AI financial news assistant with expertise in markets, investments and global economny.",
-            },
+
+def chunk_articles(
+    articles: List[Dict],
+    budget_tokens: int | None = None,
+    max_articles: int | None = None,
+) -> List[List[int]]:
+    """Greedy split into index lists whose formatted text fits budget_tokens."""
+    budget_tokens = budget_tokens or RELEVANCE_CHUNK_TOKENS
+    max_articles = max_articles or RELEVANCE_CHUNK_ARTICLES
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for i, article in enumerate(articles):
+        cost = estimate_tokens(format_article(article, i + 1))
+        if current and (used + cost > budget_tokens or len(current) >= max_articles):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_request(
+    articles: List[Dict], company: str | None, model: str, output: str = "ids"
+) -> Dict:
+    """Chat-completion arguments judging one chunk of articles."""
+    prompt = RELEVANCE_PROMPT.format(
+        relevant_stock=company or "the company in question"
+    )
+    if output == "ids":
+        blocks = [format_article(a, n) for n, a in enumerate(articles, 1)]
+    else:
+        blocks = [format_article(a) for a in articles]
+    prompt += "\n" + "\n".join(blocks) + INSTRUCTIONS[output]
+    request = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ],
-        max_tokens=600,
-    )
+        "max_tokens": max(
+            100 if output == "ids" else 600,
+            _OUTPUT_TOKENS_PER_ARTICLE[output] * len(articles),
+        ),
+    }
+    if output == "ids":
+        request["response_format"] = {"type": "json_object"}
+    return request
 
-    response_text = response.choices[0].message.content.strip()
 
+def _strip_fences(text: str) -> str:
+    text = text.strip()
     # 🛠 Strip Markdown formatting before parsing JSON
-    if response_text.startswith("```json"):
-        response_text = response_text.replace("```json", "").replace("```", "").strip()
-
-    # 🛠 Try to parse JSON response
-    try:
-        filtered_articles_new = json.loads(response_text)
-    except json.JSONDecodeError:
-        print("Error: Failed to parse OpenAI response as JSON!")
-        print(f"Response Text: {response_text}")  # Debugging
-        filtered_articles_new = []
-
-    return filtered_articles_new  # Returns parsed articles
+    if text.startswith("```"):
+        text = text.replace("```json", "").replace("```", "").strip()
+    return text
+
+
+def parse_selection(
+    response_text: str, articles: List[Dict], output: str = "ids"
+) -> Dict[int, float | None]:
+    """
+    {position within `articles`: score or None} for every article the model
+    kept. ids replies look like {"relevant": [{"id": n, "score": s}, ...]}
+    (1-based n; bare numbers are accepted too); echo replies are matched
+    back by URL, then title. Raises ValueError on any other shape.
+    """
+    selected = json.loads(_strip_fences(response_text))
+    picked: Dict[int, float | None] = {}
+    if output == "ids":
+        items = selected.get("relevant") if isinstance(selected, dict) else None
+        if not isinstance(items, list):
+            raise ValueError('expected {"relevant": [...]}')
+        for item in items:
+            raw_id, score = item, None
+            if isinstance(item, dict):
+                raw_id, score = item.get("id"), item.get("score")
+            try:
+                i = int(raw_id) - 1
+                score = None if score is None else float(score)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= i < len(articles):
+                picked[i] = score
+        return picked
+
+    if not isinstance(selected, list):
+        raise ValueError(f"expected a JSON list, got {type(selected).__name__}")
+    by_url = {a.get("url"): i for i, a in enumerate(articles)}
+    by_title = {a.get("title"): i for i, a in enumerate(articles)}
+    for item in selected:
+        if not isinstance(item, dict):
+            continue
+        i = by_url.get(item.get("url"), by_title.get(item.get("title")))
+        if i is not None:
+            picked[i] = None
+    return picked
+
+
+def _add(stats: Dict[str, Any] | None, **values):
+    if stats is not None:
+        for k, v in values.items():
+            stats[k] = stats.get(k, 0) + v
+
+
+@lru_cache(maxsize=1)
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Background loop that owns every AsyncOpenAI client in the process."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="openai-loop", daemon=True).start()
+    return loop
+
+
+@lru_cache(maxsize=16)
+def _async_client(api_key: str | None, base_url: str | None):
+    from openai import AsyncOpenAI  # deferred: heavy import, only needed on this path
+
+    return AsyncOpenAI(api_key=api_key or "replay", base_url=base_url)
+
+
+async def _judge_chunk(
+    articles: List[Dict],
+    company: str | None,
+    api_key: str | None,
+    model: str,
+    output: str,
+    semaphore: asyncio.Semaphore,
+    stats: Dict[str, Any] | None,
+) -> Dict[int, float | None]:
+    request = build_request(articles, company, model, output)
+    queued = time.perf_counter()
+
+    async def complete() -> str:
+        client = _async_client(api_key, OPENAI_BASE_URL)
+        limiter = get_rate_limiter()
+        t0 = time.perf_counter()
+        reservation = await limiter.acquire(request_tokens(request))
+        t1 = time.perf_counter()
+        try:
+            response = await client.chat.completions.create(**request)
+        except Exception:
+            limiter.settle(reservation)  # failed: keep the estimate
+            raise
+        text = response.choices[0].message.content or ""
+        usage = response.usage
+        limiter.settle(reservation, getattr(usage, "total_tokens", None))
+        _add(
+            stats,
+            requests=1,
+            queue_seconds=t1 - queued,
+            rate_limit_seconds=t1 - t0,
+            call_seconds=time.perf_counter() - t1,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        )
+        parse_selection(text, articles, output)  # never record an unparseable reply
+        return text
+
+    async with semaphore:
+        # recorded / replayed per HTTP_CACHE_MODE, keyed by base URL, model + exact messages
+        response_text = await cached_acall(
+            "openai", request, complete, url=OPENAI_BASE_URL or _OPENAI_DEFAULT_URL
+        )
+    return parse_selection(response_text, articles, output)
+
+
+async def afilter_relevant_articles(
+    articles: List[Dict],
+    api_key: str | None = None,
+    company: str | None = None,
+    *,
+    model: str | None = None,
+    output: str | None = None,
+    concurrency: int | None = None,
+    chunk_tokens: int | None = None,
+    chunk_size: int | None = None,
+    use_cache: bool = True,
+    stats: Dict[str, Any] | None = None,
+) -> List[Dict]:
+    """Coroutine behind filter_relevant_articles; must run on _event_loop()."""
+    if not articles:
+        return []
+    output = output or RELEVANCE_OUTPUT
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown relevance output '{output}'. Use one of {OUTPUT_FORMATS}."
+        )
+    model = model or OPENAI_RELEVANCE_MODEL
+    t0 = time.perf_counter()
+
+    keep: Dict[int, float | None] = {}
+    keys: Dict[int, str] = {}
+    if use_cache:
+        version = prompt_version(output)
+        keys = {
+            i: decision_key(
+                a.get("url") or a.get("title") or "", company, version, model
+            )
+            for i, a in enumerate(articles)
+            if a.get("url") or a.get("title")
+        }
+        cached = get_relevance_cache().get_many(keys.values())
+        for i, k in keys.items():
+            if k in cached and cached[k]["keep"]:
+                keep[i] = cached[k]["score"]
+        todo = [i for i in range(len(articles)) if keys.get(i) not in cached]
+        _add(stats, cache_hits=len(articles) - len(todo), cache_misses=len(todo))
+    else:
+        todo = list(range(len(articles)))
+
+    # only articles without a cached decision go to the model
+    pending = [articles[i] for i in todo]
+    chunks = [
+        [todo[j] for j in c] for c in chunk_articles(pending, chunk_tokens, chunk_size)
+    ]
+    semaphore = asyncio.Semaphore(max(1, concurrency or RELEVANCE_CONCURRENCY))
+    results = await asyncio.gather(
+        *(
+            _judge_chunk(
+                [articles[i] for i in chunk],
+                company,
+                api_key,
+                model,
+                output,
+                semaphore,
+                stats,
+            )
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+    decided: Dict[str, Any] = {}
+    failed = 0
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            logger.warning(
+                f"Relevance chunk of {len(chunk)} articles failed ({result!r}); "
+                f"{'keeping' if RELEVANCE_ON_ERROR == 'keep' else 'dropping'} them"
+            )
+            if RELEVANCE_ON_ERROR == "keep":
+                keep.update((i, None) for i in chunk)
+            continue  # not cached: judged again next run
+        keep.update((chunk[j], score) for j, score in result.items())
+        for j, i in enumerate(chunk):
+            if i in keys:
+                decided[keys[i]] = {"keep": j in result, "score": result.get(j)}
+    if decided:
+        get_relevance_cache().put_many(decided)
+    _add(
+        stats,
+        chunks=len(chunks),
+        failed_chunks=failed,
+        wall_seconds=time.perf_counter() - t0,
+    )
+
+    # join decisions back onto the original article dicts, in input order
+    out = []
+    for i in sorted(keep):
+        article = articles[i]
+        if keep[i] is not None:
+            article = {**article, "relevance_score": keep[i]}
+        out.append(article)
+    return out
+
+
+def filter_relevant_articles(
+    articles,
+    api_key: str | None = None,
+    company: str | None = None,
+    *,
+    stats: Dict[str, Any] | None = None,
+    **kwargs,
+) -> list[dict]:
+    """
+    This functions sends the articles to OpenAI in concurrent chunks and
+    filters only the most relevant ones. Returns the kept input dicts, in
+    input order, with "relevance_score" (0..1) added when the model gave one.
+
+    Decisions already in the relevance cache are reused; pass
+    use_cache=False to judge everything again.
+
+    stats, if given, collects cache_hits, cache_misses, chunks,
+    failed_chunks, requests (live API calls), prompt_tokens,
+    completion_tokens, call_seconds, queue_seconds (chunk ready -> request
+    sent), rate_limit_seconds (the part of it spent in the rate limiter) and
+    wall_seconds. Per-call seconds are summed over calls.
+    """
+    articles = list(articles)
+    if not api_key and http_cache.HTTP_CACHE_MODE != "replay":
+        raise RuntimeError("OPENAI_API_KEY not provided.")
+    if not articles:
+        return []
+    future = asyncio.run_coroutine_threadsafe(
+        afilter_relevant_articles(articles, api_key, company, stats=stats, **kwargs),
+        _event_loop(),
+    )
+    return future.result()
@@ -0,0 +1,155 @@
+"""
+Process-wide pacing for OpenAI calls.
+
+Every relevance request asks the shared RateLimiter for room before it goes
+out. The limiter keeps the requests and tokens sent during the last minute (a
+sliding window) and makes a request wait until it fits under
+OPENAI_RPM_LIMIT / OPENAI_TPM_LIMIT, so concurrent pipeline runs in one
+process queue up instead of failing with 429s. Tokens are counted with the
+model's tiktoken encoding when tiktoken is installed (roughly 4 characters
+per token otherwise); OpenAI charges max_tokens against TPM up front, so the
+reservation includes it and is corrected to the reported usage afterwards.
+"""
+
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List
+
+# 0 = no limit
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "0"))
+OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", "0"))
+# ChatML framing per message / per reply (OpenAI cookbook numbers)
+_TOKENS_PER_MESSAGE = 3
+_TOKENS_PER_REPLY = 3
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """tiktoken encoding for `model`, or None if tiktoken is not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """Token count of `text` for `model` (chars / 4 without tiktoken)."""
+    enc = _encoding(model)
+    if enc is None:
+        return max(1, len(text) // 4)
+    return max(1, len(enc.encode(text, disallowed_special=())))
+
+
+def request_tokens(request: Dict[str, Any]) -> int:
+    """Tokens a chat request counts against TPM: prompt + max_tokens."""
+    model = request.get("model", "gpt-4o-mini")
+    prompt = sum(
+        _TOKENS_PER_MESSAGE + count_tokens(m.get("content") or "", model)
+        for m in request.get("messages", [])
+    )
+    return prompt + _TOKENS_PER_REPLY + int(request.get("max_tokens") or 0)
+
+
+class RateLimiter:
+    """
+    Sliding-window requests/tokens-per-window limiter for asyncio callers.
+
+    acquire() returns a reservation (a mutable [sent_at, tokens] entry) once
+    the request fits; settle() replaces its token estimate with the real
+    usage. The window is kept sorted by send time. Entries are held for
+    window * (1 + slack), because the API counts a request when it arrives,
+    which is a little after it was let through here. A request larger than
+    the whole token limit is let through when the window is empty rather
+    than waiting forever. All callers must share one event loop
+    (openai._event_loop()); metrics() may be called from any thread, so the
+    window itself is guarded by a threading lock.
+    """
+
+    def __init__(
+        self, rpm: int = 0, tpm: int = 0, window: float = 60.0, slack: float = 0.05
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window * (1 + slack)
+        self._sent: Deque[List[float]] = deque()
+        self._lock: asyncio.Lock | None = None
+        self._guard = threading.Lock()  # _sent and the counters
+        self.requests = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+
+    def _expire(self, now: float):
+        while self._sent and self._sent[0][0] <= now - self.window:
+            self._sent.popleft()
+
+    def _delay(self, tokens: int, now: float) -> float:
+        """Seconds until a request of `tokens` fits (0 = now)."""
+        self._expire(now)
+        if not self._sent:
+            return 0.0
+        delay = 0.0
+        if self.rpm and len(self._sent) >= self.rpm:
+            delay = self._sent[len(self._sent) - self.rpm][0] + self.window - now
+        if self.tpm:
+            used = sum(t for _, t in self._sent)
+            for sent_at, t in self._sent:
+                if used + tokens <= self.tpm:
+                    break
+                used -= t
+                delay = max(delay, sent_at + self.window - now)
+        return max(delay, 0.0)
+
+    async def acquire(self, tokens: int) -> List[float]:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        t0 = time.monotonic()
+        # one waiter at a time keeps the queue first-come, first-served
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                with self._guard:
+                    delay = self._delay(tokens, now)
+                    if delay <= 0:
+                        entry = [now, float(tokens)]
+                        self._sent.append(entry)
+                        break
+                await asyncio.sleep(delay)
+        waited = time.monotonic() - t0
+        with self._guard:
+            self.requests += 1
+            if waited > 0.001:
+                self.waited += 1
+                self.wait_seconds += waited
+        return entry
+
+    def settle(self, entry: List[float], tokens: int | None = None):
+        """Replace the reservation's token estimate with the reported usage."""
+        if tokens:
+            with self._guard:
+                entry[1] = float(tokens)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Counters and current window usage; safe to call from any thread."""
+        with self._guard:
+            self._expire(time.monotonic())
+            return {
+                "requests": self.requests,
+                "waited": self.waited,
+                "wait_seconds": round(self.wait_seconds, 4),
+                "window_requests": len(self._sent),
+                "window_tokens": int(sum(t for _, t in self._sent)),
+            }
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter; every API key in the process shares the org limits."""
+    return RateLimiter(rpm=OPENAI_RPM_LIMIT, tpm=OPENAI_TPM_LIMIT)
@@ -0,0 +1,112 @@
+"""
+Vectorized statistics for many date windows over one PriceSeries.
+
+All windows are resolved with np.searchsorted in one call, returns and
+squared returns come from cumulative sums, and max drawdown uses a single
+segmented running maximum over the concatenated windows. N windows cost a
+handful of array operations instead of N filter/aggregate passes.
+"""
+
+import datetime
+import numpy as np
+from typing import Dict, Iterable, List, Tuple
+from src.service.ohlcv import PriceSeries, to_day
+
+TRADING_DAYS = 252
+
+
+def calendar_windows(
+    start, end, days: int = 7
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """Consecutive [start, end] buckets of `days` calendar days (weekly by default)."""
+    lo, hi = to_day(start), to_day(end)
+    starts = np.arange(lo, hi + 1, days)
+    ends = np.minimum(starts + (days - 1), hi)
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def window_stats(series: PriceSeries, windows: Iterable[Tuple]) -> List[Dict]:
+    """
+    For each (start, end) window over the trading days inside it:
+      first_day / last_day, start_price / end_price (close),
+      percentage_change, max_drawdown (percent, <= 0) and volatility
+      (annualized stdev of daily log returns, percent).
+    Days with a missing (non-positive) close, which parse_av_daily stores as
+    0, are left out, so one bad row cannot turn a window's log returns into
+    -inf/NaN. Windows without trading days get None values.
+    """
+    windows = list(windows)
+    if not windows:
+        return []
+    starts = np.array([to_day(w[0]) for w in windows], dtype="datetime64[D]")
+    ends = np.array([to_day(w[1]) for w in windows], dtype="datetime64[D]")
+    dates, close = series.dates, series.close
+    priced = np.isfinite(close) & (close > 0)
+    if not priced.all():
+        dates, close = dates[priced], close[priced]
+    lo = np.searchsorted(dates, starts, side="left")
+    hi = np.searchsorted(dates, ends, side="right") - 1
+    valid = (hi >= lo) & (lo < len(dates))
+    lo_v, hi_v = lo[valid], hi[valid]
+
+    out = [
+        {
+            "start": w[0],
+            "end": w[1],
+            "first_day": None,
+            "last_day": None,
+            "start_price": None,
+            "end_price": None,
+            "percentage_change": None,
+            "max_drawdown": None,
+            "volatility": None,
+            "days": 0,
+        }
+        for w in windows
+    ]
+    if not len(lo_v):
+        return out
+
+    start_price, end_price = close[lo_v], close[hi_v]
+    pct = (end_price / start_price - 1.0) * 100.0
+
+    # daily log returns; window [lo, hi] covers returns lo+1 .. hi
+    logp = np.log(close)
+    r = np.diff(logp)
+    cs = np.concatenate(([0.0], np.cumsum(r)))
+    cs2 = np.concatenate(([0.0], np.cumsum(r * r)))
+    n = (hi_v - lo_v).astype(np.float64)
+    s1 = cs[hi_v] - cs[lo_v]
+    s2 = cs2[hi_v] - cs2[lo_v]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = (s2 - s1 * s1 / n) / (n - 1)
+    vol = np.sqrt(np.clip(var, 0.0, None)) * np.sqrt(TRADING_DAYS) * 100.0
+
+    # segmented running max: shift each window by group * span so a plain
+    # maximum.accumulate never carries a value across window boundaries
+    lengths = hi_v - lo_v + 1
+    group = np.repeat(np.arange(len(lo_v)), lengths)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    idx = np.repeat(lo_v, lengths) + (np.arange(lengths.sum()) - offsets)
+    span = float(logp.max() - logp.min()) + 1.0
+    shifted = logp[idx] + group * span
+    peak = np.maximum.accumulate(shifted)
+    dd = np.expm1(shifted - peak)
+    max_dd = np.minimum.reduceat(dd, np.cumsum(lengths) - lengths) * 100.0
+
+    first_days = dates[lo_v].tolist()
+    last_days = dates[hi_v].tolist()
+    for k, i in enumerate(np.flatnonzero(valid)):
+        out[i].update(
+            {
+                "first_day": first_days[k],
+                "last_day": last_days[k],
+                "start_price": float(start_price[k]),
+                "end_price": float(end_price[k]),
+                "percentage_change": round(float(pct[k]), 2),
+                "max_drawdown": round(float(max_dd[k]), 2),
+                "volatility": round(float(vol[k]), 2) if n[k] >= 2 else None,
+                "days": int(lengths[k]),
+            }
+        )
+    return out
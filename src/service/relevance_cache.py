@@ -0,0 +1,34 @@
+"""
+Persistent cache for OpenAI relevance decisions.
+
+Keys are sha256(article URL + target company + prompt version + model), so an
+article judged once for a company is never sent to the model again until the
+prompt template or the model changes. Values are {"keep": bool, "score": float
+| None}.
+"""
+
+import os
+import hashlib
+from functools import lru_cache
+from src.service.tiered_cache import TieredCache
+
+RELEVANCE_CACHE_PATH = os.getenv(
+    "RELEVANCE_CACHE_PATH", os.path.join(".cache", "relevance_cache.sqlite")
+)
+RELEVANCE_CACHE_SIZE = int(os.getenv("RELEVANCE_CACHE_SIZE", "10000"))
+
+
+def decision_key(url: str, company: str | None, prompt_version: str, model: str) -> str:
+    h = hashlib.sha256()
+    h.update(f"{model}@{prompt_version}\0".encode("utf-8"))
+    h.update(f"{(company or '').strip().lower()}\0".encode("utf-8"))
+    h.update(hashlib.sha256(url.encode("utf-8")).digest())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_relevance_cache() -> TieredCache:
+    """Process-wide cache instance (memory-only if RELEVANCE_CACHE_PATH is empty)."""
+    return TieredCache(
+        RELEVANCE_CACHE_PATH or None, maxsize=RELEVANCE_CACHE_SIZE, table="relevance"
+    )
@@ -0,0 +1,142 @@
+"""
+Local embedding prefilter in front of the OpenAI relevance filter.
+
+Every article (title + description) is embedded with a small sentence
+transformer (all-MiniLM-L6-v2, as sketched in store_faiss.py) and compared to
+a prototype vector for "<company> as an investment": the normalized mean of a
+few company/finance phrases. Articles at/above the accept threshold are kept
+without asking the LLM, articles below the reject threshold are dropped, and
+only the uncertain band in between goes to filter_relevant_articles.
+"""
+
+import os
+from functools import lru_cache
+from typing import Callable, Dict, List
+
+import numpy as np
+from logging_config import logger
+
+# sentence_transformers (and torch) are imported in _load_embedder, so the
+# pipeline only pays for them when the prefilter is switched on.
+
+EMBED_MODEL = os.getenv(
+    "RELEVANCE_EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2"
+)
+# cosine similarity thresholds (unset = that side is off; both unset = no prefilter)
+_accept_env = os.getenv("RELEVANCE_PREFILTER_ACCEPT")
+_reject_env = os.getenv("RELEVANCE_PREFILTER_REJECT")
+RELEVANCE_PREFILTER_ACCEPT = float(_accept_env) if _accept_env else None
+RELEVANCE_PREFILTER_REJECT = float(_reject_env) if _reject_env else None
+
+PROTOTYPE_PHRASES = [
+    "{company} stock price, shares and market value",
+    "{company} earnings, revenue, guidance and profit",
+    "{company} investors, analysts, rating upgrade or downgrade",
+    "financial markets news about {company} for investors",
+]
+
+Embedder = Callable[[List[str]], np.ndarray]
+
+
+@lru_cache(maxsize=1)
+def _load_embedder():
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(EMBED_MODEL)
+
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    """Unit-length embeddings, one row per text."""
+    emb = _load_embedder().encode(texts, normalize_embeddings=True)
+    return np.asarray(emb, dtype="float32")
+
+
+def article_text(article: Dict) -> str:
+    return (
+        (article.get("title") or "")
+        + " "
+        + (article.get("summary") or article.get("description") or "")
+    ).strip()
+
+
+def similarities(
+    articles: List[Dict], company: str | None, embed: Embedder | None = None
+) -> np.ndarray:
+    """Cosine similarity of each article to the company/finance prototype."""
+    embed = embed or embed_texts
+    phrases = [p.format(company=company or "the company") for p in PROTOTYPE_PHRASES]
+    texts = phrases + [article_text(a) for a in articles]
+    vecs = np.asarray(embed(texts), dtype="float32")
+    vecs = vecs / np.maximum(np.linalg.norm(vecs, axis=1, keepdims=True), 1e-12)
+    prototype = vecs[: len(phrases)].mean(axis=0)
+    prototype /= max(float(np.linalg.norm(prototype)), 1e-12)
+    return vecs[len(phrases) :] @ prototype
+
+
+def prefilter_relevant_articles(
+    articles: List[Dict],
+    company: str | None,
+    llm_filter: Callable[[List[Dict]], List[Dict]],
+    accept: float | None = None,
+    reject: float | None = None,
+    embed: Embedder | None = None,
+    stats: Dict | None = None,
+) -> List[Dict]:
+    """
+    Keep articles with similarity >= accept, drop those < reject and send the
+    rest through `llm_filter(articles)`. Returns the kept articles in input
+    order; prefilter-accepted ones carry "relevance_similarity".
+
+    If `stats` is given it accumulates total/accepted/rejected/forwarded
+    counts, the thresholds and call_reduction (share of articles the LLM
+    never saw).
+    """
+    accept = accept if accept is not None else RELEVANCE_PREFILTER_ACCEPT
+    reject = reject if reject is not None else RELEVANCE_PREFILTER_REJECT
+    if not articles or (accept is None and reject is None):
+        kept = llm_filter(articles)
+        forwarded, accepted, rejected = list(range(len(articles))), [], []
+    else:
+        sims = similarities(articles, company, embed)
+        accepted, rejected, forwarded = [], [], []
+        for i, s in enumerate(sims):
+            if accept is not None and s >= accept:
+                accepted.append(i)
+            elif reject is not None and s < reject:
+                rejected.append(i)
+            else:
+                forwarded.append(i)
+        logger.debug(
+            f"Relevance prefilter: {len(accepted)} accepted, {len(rejected)} rejected, "
+            f"{len(forwarded)} sent to the LLM"
+        )
+
+        judged = llm_filter([articles[i] for i in forwarded]) if forwarded else []
+        # join the LLM's picks back to input positions by identity / URL
+        by_id = {id(articles[i]): i for i in forwarded}
+        by_url = {articles[i].get("url"): i for i in forwarded}
+        by_title = {articles[i].get("title"): i for i in forwarded}
+        picked = {}
+        for a in judged:
+            i = by_id.get(id(a), by_url.get(a.get("url"), by_title.get(a.get("title"))))
+            if i is not None:
+                picked[i] = a
+        for i in accepted:
+            picked[i] = {
+                **articles[i],
+                "relevance_similarity": round(float(sims[i]), 4),
+            }
+        kept = [picked[i] for i in sorted(picked)]
+
+    if stats is not None:
+        stats["accept"], stats["reject"] = accept, reject
+        for k, n in (
+            ("total", len(articles)),
+            ("accepted", len(accepted)),
+            ("rejected", len(rejected)),
+            ("forwarded", len(forwarded)),
+        ):
+            stats[k] = stats.get(k, 0) + n
+        total = stats["total"] or 1
+        stats["call_reduction"] = round(1 - stats["forwarded"] / total, 4)
+    return kept
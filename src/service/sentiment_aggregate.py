@@ -0,0 +1,218 @@
+"""
+NumPy-backed sentiment aggregation.
+
+Articles are encoded once into label-code / confidence / timestamp arrays;
+the 0..100 score, label counts and weighted shares then come from a single
+np.bincount pass. SentimentAggregator keeps running sums so articles can be
+added or removed without recomputing, and rolling_sentiment produces one
+aggregate per day (or hour) of a range in one call.
+
+Semantics match the original aggregate_sentiment: weight = confidence,
+signed value = +/-confidence, unknown labels count as neutral weight but
+are not counted as positive/neutral/negative.
+"""
+
+import re
+import datetime as dt
+import numpy as np
+from typing import Dict, Iterable, List, Tuple
+
+LABELS = ["negative", "neutral", "positive"]
+_CODES = {label: i for i, label in enumerate(LABELS)}
+_OTHER = 3  # missing / unknown label
+_SIGN = np.array([-1.0, 0.0, 1.0, 0.0])
+_FREQ_UNITS = {"D": "D", "day": "D", "h": "h", "H": "h", "hour": "h"}
+_UTC_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ][\d:.]+)?Z?")
+
+
+def _parse_time(value) -> np.datetime64:
+    """published_at (ISO string / datetime / None) -> naive UTC datetime64[s] or NaT."""
+    if value is None or value == "":
+        return np.datetime64("NaT", "s")
+    try:
+        if isinstance(value, dt.datetime):
+            ts = value
+        elif isinstance(value, dt.date):
+            ts = dt.datetime(value.year, value.month, value.day)
+        else:
+            ts = dt.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(dt.timezone.utc).replace(tzinfo=None)
+        return np.datetime64(ts, "s")
+    except (TypeError, ValueError):
+        return np.datetime64("NaT", "s")
+
+
+def _parse_times(values: List) -> np.ndarray:
+    """
+    Bulk-parse published_at values. NewsAPI's "...Z" strings go through one
+    numpy conversion; anything else (offsets, datetimes) falls back per item.
+    """
+    utc_strings = all(
+        v is None or (isinstance(v, str) and _UTC_ISO_RE.fullmatch(v)) for v in values
+    )
+    if utc_strings:
+        try:
+            return np.array(
+                [v[:-1] if v and v.endswith("Z") else (v or "NaT") for v in values],
+                dtype="datetime64[s]",
+            )
+        except ValueError:
+            pass
+    return np.array([_parse_time(v) for v in values], dtype="datetime64[s]")
+
+
+def encode_articles(
+    articles: Iterable[Dict],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(label codes int8, confidences float64, published_at datetime64[s]) arrays."""
+    codes, confs, times = [], [], []
+    for a in articles:
+        codes.append(_CODES.get(a.get("sentiment_label"), _OTHER))
+        confs.append(float(a.get("sentiment_conf", 0.0) or 0.0))
+        times.append(a.get("published_at"))
+    return (
+        np.asarray(codes, dtype=np.int8),
+        np.asarray(confs, dtype=np.float64),
+        _parse_times(times),
+    )
+
+
+def _sums(codes: np.ndarray, confs: np.ndarray) -> np.ndarray:
+    """Row of 9 sums: weight per code (4), count per code (4), sum of w * signed."""
+    codes = codes.astype(np.intp, copy=False)
+    out = np.empty(9)
+    out[:4] = np.bincount(codes, weights=confs, minlength=4)
+    out[4:8] = np.bincount(codes, minlength=4)
+    out[8] = np.dot(_SIGN[codes] * confs, confs)
+    return out
+
+
+def summarize(sums: np.ndarray) -> Dict:
+    """aggregate_sentiment-shaped result from a _sums row."""
+    w = sums[:4]
+    counts = sums[4:8].astype(int)
+    total = int(counts.sum())
+    sum_w = float(w.sum())
+    if sum_w <= 1e-9:
+        return {
+            "score_0_100": 50.0,
+            "overall_tag": "Neutral",
+            "counts": {"positive": 0, "neutral": 0, "negative": 0, "total": total},
+            "weighted_share": {"positive": 0.0, "neutral": 1.0, "negative": 0.0},
+        }
+
+    score_0_100 = (float(sums[8]) / sum_w + 1) * 50  # map -1..1 -> 0..100
+    if score_0_100 >= 60:
+        tag = "Bullish"
+    elif score_0_100 <= 40:
+        tag = "Bearish"
+    else:
+        tag = "Neutral"
+    return {
+        "score_0_100": round(score_0_100, 1),
+        "overall_tag": tag,
+        "counts": {
+            "positive": int(counts[2]),
+            "neutral": int(counts[1]),
+            "negative": int(counts[0]),
+            "total": total,
+        },
+        "weighted_share": {
+            "positive": round(float(w[2]) / sum_w, 3),
+            "neutral": round(float(w[1] + w[_OTHER]) / sum_w, 3),
+            "negative": round(float(w[0]) / sum_w, 3),
+        },
+    }
+
+
+class SentimentAggregator:
+    """
+    Running ticker-level sentiment.
+
+    Usage:
+        agg = SentimentAggregator.from_articles(articles)
+        agg.add(new_articles); agg.remove(stale_articles)
+        agg.result()  # same dict as aggregate_sentiment
+    """
+
+    def __init__(self):
+        self._sums = np.zeros(9)
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Dict]) -> "SentimentAggregator":
+        agg = cls()
+        agg.add(articles)
+        return agg
+
+    def add_arrays(self, codes: np.ndarray, confs: np.ndarray):
+        self._sums += _sums(codes, confs)
+
+    def remove_arrays(self, codes: np.ndarray, confs: np.ndarray):
+        self._sums -= _sums(codes, confs)
+        self._sums[4:8] = np.maximum(self._sums[4:8], 0)
+
+    def add(self, articles: Iterable[Dict]):
+        codes, confs, _ = encode_articles(articles)
+        self.add_arrays(codes, confs)
+
+    def remove(self, articles: Iterable[Dict]):
+        codes, confs, _ = encode_articles(articles)
+        self.remove_arrays(codes, confs)
+
+    def result(self) -> Dict:
+        return summarize(self._sums)
+
+
+def rolling_sentiment(
+    articles: Iterable[Dict],
+    freq: str = "D",
+    window: int = 1,
+    start=None,
+    end=None,
+) -> List[Dict]:
+    """
+    One aggregate per period ("D" day or "h" hour) between start and end
+    (default: first/last published_at), each covering the trailing `window`
+    periods. Articles without a parseable published_at are left out.
+
+    Returns [{"period": "YYYY-MM-DD" | "YYYY-MM-DDTHH", **aggregate}, ...].
+    """
+    unit = _FREQ_UNITS.get(freq)
+    if unit is None:
+        raise ValueError(f"Unknown freq '{freq}'. Use 'D' or 'h'.")
+    codes, confs, times = encode_articles(articles)
+    known = ~np.isnat(times)
+    codes, confs = codes[known], confs[known]
+    buckets = times[known].astype(f"datetime64[{unit}]")
+
+    lo = _parse_time(start).astype(f"datetime64[{unit}]") if start is not None else None
+    hi = _parse_time(end).astype(f"datetime64[{unit}]") if end is not None else None
+    if lo is None or np.isnat(lo):
+        lo = buckets.min() if buckets.size else None
+    if hi is None or np.isnat(hi):
+        hi = buckets.max() if buckets.size else None
+    if lo is None or hi is None or hi < lo:
+        return []
+
+    n = int((hi - lo).astype(int)) + 1
+    idx = (buckets - lo).astype(np.int64)
+    inside = (idx >= 0) & (idx < n)
+    idx, codes, confs = idx[inside], codes[inside].astype(np.intp), confs[inside]
+
+    # per-period sums, one bincount per column over period*4 + code
+    cells = idx * 4 + codes
+    per = np.zeros((n, 9))
+    per[:, :4] = np.bincount(cells, weights=confs, minlength=n * 4).reshape(n, 4)
+    per[:, 4:8] = np.bincount(cells, minlength=n * 4).reshape(n, 4)
+    per[:, 8] = np.bincount(idx, weights=_SIGN[codes] * confs * confs, minlength=n)
+
+    cum = np.vstack([np.zeros((1, 9)), np.cumsum(per, axis=0)])
+    w = max(1, window)
+    rolled = cum[1:] - cum[np.maximum(np.arange(1, n + 1) - w, 0)]
+
+    periods = np.arange(lo, hi + 1)
+    fmt = 10 if unit == "D" else 13
+    return [
+        {"period": str(p)[:fmt], **summarize(row)} for p, row in zip(periods, rolled)
+    ]
@@ -0,0 +1,164 @@
+"""
+Micro-batching front end for FinBERT shared by every thread in the process.
+
+Concurrent callers (Streamlit sessions, asyncio tasks) submit small lists of
+texts; one background thread coalesces them into a batch bounded by
+max_batch_size texts or max_wait_ms, runs a single scoring pass on the cached
+model and fans the results back out through futures.
+"""
+
+import os
+import time
+import queue
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from functools import lru_cache, partial
+from typing import Callable, Dict, List
+
+SENTIMENT_QUEUE_MAX_BATCH = int(os.getenv("SENTIMENT_QUEUE_MAX_BATCH", "32"))
+SENTIMENT_QUEUE_WAIT_MS = float(os.getenv("SENTIMENT_QUEUE_WAIT_MS", "10"))
+
+
+def _bucket(size: int) -> int:
+    """Upper power-of-two bound used as the histogram bucket for a batch size."""
+    return 1 << max(0, size - 1).bit_length()
+
+
+class MicroBatcher:
+    """
+    Thread-safe request coalescer around a batch scorer.
+
+    `scorer(texts) -> results` must return one result per text, in order.
+    """
+
+    def __init__(
+        self,
+        scorer: Callable[[List[str]], List[Dict]],
+        max_batch_size: int = SENTIMENT_QUEUE_MAX_BATCH,
+        max_wait_ms: float = SENTIMENT_QUEUE_WAIT_MS,
+    ):
+        self.scorer = scorer
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pending_texts = 0
+        self._requests = 0
+        self._texts = 0
+        self._batches = 0
+        self._hist: Counter = Counter()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="sentiment-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, texts: List[str]) -> Future:
+        """Queue texts for scoring; the future resolves to their results."""
+        fut: Future = Future()
+        if not texts:
+            fut.set_result([])
+            return fut
+        self._ensure_started()
+        with self._lock:
+            self._pending_texts += len(texts)
+        self._queue.put((list(texts), fut))
+        return fut
+
+    def score(self, texts: List[str], timeout: float | None = None) -> List[Dict]:
+        """Blocking helper for threads."""
+        return self.submit(texts).result(timeout)
+
+    async def ascore(self, texts: List[str]) -> List[Dict]:
+        """Awaitable helper for coroutines."""
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def _run(self):
+        carry = None
+        while True:
+            first = carry if carry is not None else self._queue.get()
+            carry = None
+            if first is None:
+                return
+            batch = [first]
+            size = len(first[0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)  # stop after flushing this batch
+                    break
+                if size + len(item[0]) > self.max_batch_size:
+                    carry = item
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._flush(batch, size)
+
+    def _flush(self, batch, size: int):
+        with self._lock:
+            self._pending_texts -= size
+            self._requests += len(batch)
+            self._texts += size
+            self._batches += 1
+            self._hist[_bucket(size)] += 1
+
+        live = [
+            (texts, fut) for texts, fut in batch if fut.set_running_or_notify_cancel()
+        ]
+        if not live:
+            return
+        try:
+            results = self.scorer([t for texts, _ in live for t in texts])
+        except Exception as e:
+            for _, fut in live:
+                fut.set_exception(e)
+            return
+        i = 0
+        for texts, fut in live:
+            fut.set_result(results[i : i + len(texts)])
+            i += len(texts)
+
+    def metrics(self) -> Dict:
+        """Queue depth, throughput counters and a power-of-two batch-size histogram."""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "pending_texts": self._pending_texts,
+                "requests": self._requests,
+                "texts": self._texts,
+                "batches": self._batches,
+                "mean_batch_size": (
+                    round(self._texts / self._batches, 2) if self._batches else 0.0
+                ),
+                "batch_size_histogram": dict(sorted(self._hist.items())),
+            }
+
+    def close(self, timeout: float | None = None):
+        """Flush whatever is queued, then stop the worker thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+
+@lru_cache(maxsize=2)
+def get_batcher(backend: str | None = None) -> MicroBatcher:
+    """Process-wide batcher over sentiment_finBERT.score_texts (cached _load model)."""
+    from src.service.sentiment_finBERT import score_texts
+
+    return MicroBatcher(
+        partial(score_texts, batch_size=SENTIMENT_QUEUE_MAX_BATCH, backend=backend)
+    )
@@ -0,0 +1,32 @@
+"""
+Content-addressed cache for FinBERT results.
+
+Keys are sha256(model id + revision + exact model input text), so the same
+headline scored by the same checkpoint is only ever run through the model once,
+across processes and restarts.
+"""
+
+import os
+import hashlib
+from functools import lru_cache
+from src.service.tiered_cache import TieredCache
+
+SENTIMENT_CACHE_PATH = os.getenv(
+    "SENTIMENT_CACHE_PATH", os.path.join(".cache", "sentiment_cache.sqlite")
+)
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+
+
+def cache_key(text: str, model_id: str, revision: str) -> str:
+    h = hashlib.sha256()
+    h.update(f"{model_id}@{revision}\0".encode("utf-8"))
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_sentiment_cache() -> TieredCache:
+    """Process-wide cache instance (memory-only if SENTIMENT_CACHE_PATH is empty)."""
+    return TieredCache(
+        SENTIMENT_CACHE_PATH or None, maxsize=SENTIMENT_CACHE_SIZE, table="sentiment"
+    )
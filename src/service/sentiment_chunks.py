@@ -0,0 +1,130 @@
+"""
+Body-level FinBERT sentiment from the NewsAPI `content` field.
+
+Each article becomes its headline (title + description) plus sentence-aligned
+chunks of its body. The chunks of *all* articles are scored together in one
+call to the batch scorer, so they share length-bucketed padded batches, and
+the per-chunk results are pooled back into one result per article.
+"""
+
+import os
+import re
+from typing import Callable, Dict, List
+from src.service.sentiment_finBERT import _neutral, _to_result, label_to_score
+
+SENTIMENT_CHUNK_CHARS = int(os.getenv("SENTIMENT_CHUNK_CHARS", "600"))
+POOLING = ("mean", "max_abs", "confidence")
+
+# NewsAPI truncates content and appends e.g. "… [+3120 chars]"
+_TRUNCATION_RE = re.compile(r"\s*(?:…|\.\.\.)?\s*\[\+\d+ chars\]\s*$")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[\"'A-Z0-9])")
+_PLACEHOLDERS = {"", "No content available"}
+
+
+def clean_content(content: str | None) -> str:
+    """Body text without NewsAPI's truncation marker (empty for placeholders)."""
+    content = (content or "").strip()
+    if content in _PLACEHOLDERS:
+        return ""
+    return _TRUNCATION_RE.sub("", content).strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_RE.split(text) if s.strip()]
+
+
+def chunk_text(text: str, max_chars: int = SENTIMENT_CHUNK_CHARS) -> List[str]:
+    """
+    Greedily pack whole sentences into chunks of at most max_chars; a single
+    sentence longer than that is hard-split.
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in split_sentences(text):
+        while len(sentence) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:max_chars])
+            sentence = sentence[max_chars:].lstrip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def headline_text(article: Dict) -> str:
+    """Title + description only; the body is chunked separately."""
+    title = (article.get("title") or "").strip()
+    description = (article.get("summary") or article.get("description") or "").strip()
+    return ". ".join(p for p in (title, description) if p)
+
+
+def article_chunks(article: Dict, max_chars: int = SENTIMENT_CHUNK_CHARS) -> List[str]:
+    """Headline text followed by the body chunks (body = content or body)."""
+    head = headline_text(article)
+    body = clean_content(article.get("content") or article.get("body"))
+    chunks = [head] if head else []
+    if body and not head.endswith(body):
+        chunks.extend(chunk_text(body, max_chars))
+    return chunks
+
+
+def pool_results(results: List[Dict], method: str = "mean") -> Dict:
+    """
+    Pool chunk results into one result:
+      mean       -> average of the chunk probabilities
+      max_abs    -> the chunk with the strongest signed score
+      confidence -> probabilities weighted by each chunk's confidence
+    """
+    if method not in POOLING:
+        raise ValueError(f"Unknown pooling '{method}'. Use one of {POOLING}.")
+    if not results:
+        return _neutral()
+    if method == "max_abs":
+        return max(
+            results, key=lambda r: abs(label_to_score(r["label"], r["confidence"]))
+        )
+    weights = [1.0 if method == "mean" else r["confidence"] for r in results]
+    total = sum(weights)
+    if total <= 1e-9:
+        return _neutral()
+    probs = [
+        sum(w * r["probs"][j] for w, r in zip(weights, results)) / total
+        for j in range(3)
+    ]
+    return _to_result(probs)
+
+
+def score_articles_chunked(
+    articles: List[Dict],
+    scorer: Callable[[List[str]], List[Dict]],
+    pooling: str = "mean",
+    max_chars: int = SENTIMENT_CHUNK_CHARS,
+    stats: Dict | None = None,
+) -> List[Dict]:
+    """
+    One pooled result per article. `scorer(texts)` is called once for every
+    chunk of every article. If `stats` is given, stats["content"] accumulates
+    the pooling method and the article/chunk counts (kept apart from the
+    scorer's own cache counters, which may share the dict).
+    """
+    per_article = [article_chunks(a, max_chars) for a in articles]
+    flat = [c for chunks in per_article for c in chunks]
+    scored = scorer(flat) if flat else []
+    if stats is not None:
+        cs = stats.setdefault(
+            "content", {"pooling": pooling, "articles": 0, "chunks": 0}
+        )
+        cs["articles"] += len(articles)
+        cs["chunks"] += len(flat)
+
+    results, i = [], 0
+    for chunks in per_article:
+        results.append(pool_results(scored[i : i + len(chunks)], pooling))
+        i += len(chunks)
+    return results
@@ -1,47 +1,470 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+import os
+import threading
 from functools import lru_cache
-import torch
-from typing import List
+from typing import Callable, List
 from typing import Dict
+from logging_config import logger
+from src.service.sentiment_cache import cache_key, get_sentiment_cache
+
+# torch / transformers / onnxruntime are imported inside the loaders below, so
+# importing this module (and the pipeline) stays cheap until a headline is scored.
 
 MODEL_ID = "ProsusAI/finbert"
+MODEL_REVISION = os.getenv("FINBERT_REVISION", "main")
 LABELS = ["negative", "neutral", "positive"]
+MAX_CHARS = 2000
+DEFAULT_BATCH_SIZE = 32
+# "torch" (eager PyTorch) or "onnx" (int8-quantized ONNX Runtime, CPU)
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "torch")
+BACKENDS = ("torch", "onnx")
+# where cache misses are scored: "local" (this thread), "pool" (process pool),
+# "queue" (micro-batching queue shared by every thread in the process),
+# "server" (sentiment_server daemon over a Unix socket, local fallback) or
+# "auto" (the daemon if its socket exists, otherwise local)
+SENTIMENT_MODE = os.getenv("SENTIMENT_MODE", "auto")
+MODES = ("auto", "local", "pool", "queue", "server")
+# cheap-first cascade: lexicon results at/above this confidence skip FinBERT
+# (unset = off, every article goes through FinBERT)
+_cascade_env = os.getenv("SENTIMENT_CASCADE_THRESHOLD")
+SENTIMENT_CASCADE_THRESHOLD = float(_cascade_env) if _cascade_env else None
+# score the article body in chunks and pool them: "mean" | "max_abs" |
+# "confidence" (unset = headline text only), see sentiment_chunks
+SENTIMENT_CONTENT_POOLING = os.getenv("SENTIMENT_CONTENT_POOLING") or None
+
+
+def _snapshot_path() -> str | None:
+    """FINBERT_SNAPSHOT_DIR if it holds a snapshot of MODEL_ID@MODEL_REVISION."""
+    from src.service.finbert_snapshot import FINBERT_SNAPSHOT_DIR, snapshot_ready
+
+    if FINBERT_SNAPSHOT_DIR and snapshot_ready(
+        FINBERT_SNAPSHOT_DIR, MODEL_ID, MODEL_REVISION
+    ):
+        return FINBERT_SNAPSHOT_DIR
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_tokenizer():
+    from transformers import AutoTokenizer
+    from src.service.finbert_snapshot import load_snapshot_tokenizer
+
+    snapshot = _snapshot_path()
+    if snapshot:
+        return load_snapshot_tokenizer(snapshot)
+    return AutoTokenizer.from_pretrained(MODEL_ID, revision=MODEL_REVISION)
 
 
 @lru_cache(maxsize=1)
 def _load():
-    tok = AutoTokenizer.from_pretrained(MODEL_ID)
-    mdl = AutoModelForSequenceClassification.from_pretrained(MODEL_ID)
+    """
+    Load tokenizer + model once per process. Uses the local safetensors
+    snapshot when present; otherwise loads from the hub and writes the
+    snapshot so the next process starts from it.
+    """
+    import torch
+    from transformers import AutoModelForSequenceClassification
+    from src.service import finbert_snapshot as snap
+
+    tok = _load_tokenizer()
+    snapshot = _snapshot_path()
+    if snapshot:
+        mdl = snap.load_snapshot_model(snapshot)
+    else:
+        mdl = AutoModelForSequenceClassification.from_pretrained(
+            MODEL_ID, revision=MODEL_REVISION
+        )
+        if snap.FINBERT_SNAPSHOT_DIR:
+            try:
+                snap.save_snapshot(
+                    mdl, tok, snap.FINBERT_SNAPSHOT_DIR, MODEL_ID, MODEL_REVISION
+                )
+            except OSError as e:
+                logger.warning(f"Could not write FinBERT snapshot: {e}")
     device = "cuda" if torch.cuda.is_available() else "cpu"
     mdl.to(device).eval()
     return tok, mdl, device
 
 
-def score_text(text: str) -> Dict:
-    """Return {'label','confidence','probs'} using FinBERT on title/snippet."""
-    if not text:
-        return {"label": "neutral", "confidence": 0.0, "probs": [0.33, 0.34, 0.33]}
+@lru_cache(maxsize=1)
+def _load_onnx():
+    """Tokenizer + ONNX Runtime session; exports the checkpoint on first use."""
+    from src.service.finbert_onnx import export_onnx, load_session, onnx_model_path
+
+    path = onnx_model_path()
+    if not os.path.exists(path):
+        tok, mdl, _ = _load()
+        path = export_onnx(mdl, tok)
+    return _load_tokenizer(), load_session(path)
+
+
+def _resolve_backend(backend: str | None) -> str:
+    name = (backend or SENTIMENT_BACKEND).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown sentiment backend '{name}'. Use one of {BACKENDS}.")
+    return name
+
+
+def _get_backend(backend: str | None = None):
+    """Return (tokenizer, predict) where predict(features) -> list of prob rows."""
+    if _resolve_backend(backend) == "onnx":
+        from src.service.finbert_onnx import predict_probs
+
+        tok, session = _load_onnx()
+
+        def predict(features):
+            return predict_probs(
+                session, tok.pad(features, return_tensors="np")
+            ).tolist()
+
+        return tok, predict
+
+    import torch
+
     tok, mdl, device = _load()
-    inputs = tok(text[:2000], truncation=True, return_tensors="pt").to(device)
-    with torch.no_grad():
-        logits = mdl(**inputs).logits
-        probs = torch.softmax(logits, dim=-1).cpu().numpy().squeeze().tolist()
+
+    def predict(features):
+        inputs = tok.pad(features, return_tensors="pt").to(device)
+        with torch.no_grad():
+            logits = mdl(**inputs).logits
+            return torch.softmax(logits, dim=-1).cpu().tolist()
+
+    return tok, predict
+
+
+_warmup_lock = threading.Lock()
+_warmup_thread: threading.Thread | None = None
+
+
+def warm_up(backend: str | None = None, background: bool = True):
+    """
+    Preload the tokenizer and model so the first scored headline does not pay
+    for it. With background=True this returns immediately (idempotent) and the
+    load happens on a daemon thread, e.g. while the Streamlit UI renders.
+    """
+    global _warmup_thread
+    if not background:
+        _get_backend(backend)
+        return None
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(
+                target=_get_backend, args=(backend,), name="finbert-warmup", daemon=True
+            )
+            _warmup_thread.start()
+        return _warmup_thread
+
+
+def _neutral() -> Dict:
+    return {"label": "neutral", "confidence": 0.0, "probs": [0.33, 0.34, 0.33]}
+
+
+def _to_result(probs: List[float]) -> Dict:
     idx = int(max(range(3), key=lambda i: probs[i]))
     return {"label": LABELS[idx], "confidence": float(probs[idx]), "probs": probs}
 
 
+def score_text(text: str, backend: str | None = None) -> Dict:
+    """Return {'label','confidence','probs'} using FinBERT on title/snippet."""
+    return score_texts([text], batch_size=1, backend=backend)[0]
+
+
+def score_texts(
+    texts: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    backend: str | None = None,
+) -> List[Dict]:
+    """
+    Batched version of score_text.
+
+    Texts are tokenized once, sorted by token length and cut into buckets of
+    `batch_size`, so each forward pass only pads up to the longest text in its
+    bucket. Results come back in the same order as `texts`.
+    `backend` overrides SENTIMENT_BACKEND ("torch" | "onnx").
+    """
+    results: List[Dict] = [_neutral() for _ in texts]
+    todo = [(i, t[:MAX_CHARS]) for i, t in enumerate(texts) if t]
+    if not todo:
+        return results
+
+    tok, predict = _get_backend(backend)
+    enc = tok([t for _, t in todo], truncation=True)
+    order = sorted(range(len(todo)), key=lambda k: len(enc["input_ids"][k]))
+
+    for start in range(0, len(order), max(1, batch_size)):
+        bucket = order[start : start + max(1, batch_size)]
+        features = [{key: enc[key][k] for key in enc.keys()} for k in bucket]
+        for k, p in zip(bucket, predict(features)):
+            results[todo[k][0]] = _to_result(p)
+    return results
+
+
 def label_to_score(label: str, conf: float) -> float:
     """Map to [-1,1] numeric sentiment for scoring."""
     base = {"positive": 1.0, "neutral": 0.0, "negative": -1.0}.get(label, 0.0)
     return base * float(conf)
 
 
-def enrich_with_sentiment(articles: List[Dict]) -> List[Dict]:
-    """Mutates each article adding sentiment_label/conf/score."""
-    for a in articles:
-        title = a.get("title", "")
-        description = a.get("summary") or a.get("description") or a.get("body") or ""
-        res = score_text((title + ". " + description).strip())
+def _article_text(a: Dict) -> str:
+    title = a.get("title", "")
+    description = a.get("summary") or a.get("description") or a.get("body") or ""
+    return (title + ". " + description).strip()
+
+
+def _resolve_mode(mode: str | None, workers: int | None) -> str:
+    mode = (mode or ("pool" if workers and workers > 1 else SENTIMENT_MODE)).lower()
+    if mode not in MODES:
+        raise ValueError(f"Unknown sentiment mode '{mode}'. Use one of {MODES}.")
+    return mode
+
+
+def _cache_revision(backend: str, revision: str = MODEL_REVISION) -> str:
+    # quantized ONNX outputs differ slightly from eager torch, so key them apart
+    return revision if backend == "torch" else f"{revision}+{backend}-int8"
+
+
+def _server_revision(mode: str) -> str | None:
+    """Cache revision of the daemon that `mode` would score on, None if local."""
+    if mode not in ("server", "auto"):
+        return None
+    from src.service.sentiment_server import SentimentServerError, get_client
+
+    client = get_client()
+    if mode == "auto" and not client.available():
+        return None
+    try:
+        info = client.info()
+    except SentimentServerError:
+        return None  # scoring will fall back to in-process
+    if not info.get("backend"):
+        return None  # old daemon: assume it matches the local setup
+    return _cache_revision(info["backend"], info.get("revision") or MODEL_REVISION)
+
+
+def _score_uncached(
+    texts: List[str],
+    batch_size: int,
+    backend: str | None,
+    workers: int | None,
+    mode: str | None = None,
+    origin: Dict | None = None,
+) -> List[Dict]:
+    """
+    Dispatch to in-process scoring, the process pool, the shared queue or the
+    daemon. If `origin` is given, origin["remote"] tells whether the daemon
+    produced the results (False after a fallback to in-process scoring).
+    """
+    mode = _resolve_mode(mode, workers)
+    if origin is not None:
+        origin["remote"] = False
+    if mode == "pool":
+        from src.service.sentiment_pool import get_pool, physical_cores
+
+        pool = get_pool(workers or physical_cores(), backend)
+        return pool.score_texts(texts, batch_size=batch_size)
+    if mode == "queue":
+        from src.service.sentiment_batcher import get_batcher
+
+        return get_batcher(backend).score(texts)
+    if mode in ("server", "auto"):
+        from src.service.sentiment_server import SentimentServerError, get_client
+
+        client = get_client()
+        if mode == "server" or client.available():
+            try:
+                results = client.score_texts(texts)
+                if origin is not None:
+                    origin["remote"] = True
+                return results
+            except SentimentServerError as e:
+                logger.warning(f"Sentiment server failed ({e}); scoring in-process")
+    return score_texts(texts, batch_size=batch_size, backend=backend)
+
+
+def score_texts_cached(
+    texts: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stats: Dict | None = None,
+    backend: str | None = None,
+    workers: int | None = None,
+    mode: str | None = None,
+) -> List[Dict]:
+    """
+    score_texts behind the persistent sentiment cache.
+
+    The whole batch is looked up at once; only the misses (deduplicated) go
+    through the model. If `stats` is given, 'hits'/'misses' counts are added.
+    """
+    results: List[Dict] = [_neutral() for _ in texts]
+    name = _resolve_backend(backend)
+    mode = _resolve_mode(mode, workers)
+    local_revision = _cache_revision(name)
+    # results from the daemon are keyed by the backend/revision it reports
+    remote_revision = _server_revision(mode)
+    revision = remote_revision or local_revision
+    keys = {
+        i: cache_key(t[:MAX_CHARS], MODEL_ID, revision)
+        for i, t in enumerate(texts)
+        if t
+    }
+    cache = get_sentiment_cache()
+    cached = cache.get_many(keys.values())
+
+    to_score: Dict[str, str] = {}
+    for i, k in keys.items():
+        if k not in cached:
+            to_score.setdefault(k, texts[i])
+    scored: Dict[str, Dict] = {}
+    if to_score:  # a full hit never starts a pool or calls the daemon
+        origin: Dict = {}
+        scored = dict(
+            zip(
+                to_score,
+                _score_uncached(
+                    list(to_score.values()), batch_size, name, workers, mode, origin
+                ),
+            )
+        )
+        if origin.get("remote") or revision == local_revision:
+            cache.put_many(scored)
+        else:
+            # the daemon failed and the misses were scored locally: key them as local
+            cache.put_many(
+                {
+                    cache_key(to_score[k][:MAX_CHARS], MODEL_ID, local_revision): r
+                    for k, r in scored.items()
+                }
+            )
+
+    for i, k in keys.items():
+        results[i] = cached.get(k) or scored[k]
+
+    if stats is not None:
+        misses = sum(1 for k in keys.values() if k not in cached)
+        stats["hits"] = stats.get("hits", 0) + len(keys) - misses
+        stats["misses"] = stats.get("misses", 0) + misses
+    return results
+
+
+def score_texts_cascade(
+    texts: List[str],
+    threshold: float,
+    finbert: Callable[[List[str]], List[Dict]],
+    stats: Dict | None = None,
+    audit: bool = False,
+) -> List[Dict]:
+    """
+    Lexicon first, FinBERT (`finbert(texts)`) only for results whose lexicon
+    confidence is below `threshold` and for texts with no lexicon hits at
+    all, which go to FinBERT whatever the threshold.
+
+    If `stats` is given, stats["cascade"] accumulates total/routed counts and
+    the routed fraction. With audit=True the lexicon-accepted texts are also
+    scored by FinBERT and the label agreement is reported; that costs a full
+    pass, so it is meant for picking a threshold, not for production runs.
+    """
+    from src.service.sentiment_lexicon import score_texts_lexicon
+
+    results = score_texts_lexicon(texts)
+    routed, accepted = [], []
+    for i, (t, r) in enumerate(zip(texts, results)):
+        evidence = r.pop("evidence")
+        if not t:
+            results[i] = _neutral()
+        elif not evidence or r["confidence"] < threshold:
+            routed.append(i)
+        else:
+            accepted.append(i)
+
+    if routed:
+        for i, r in zip(routed, finbert([texts[i] for i in routed])):
+            results[i] = r
+    agreed = 0
+    if audit and accepted:
+        reference = finbert([texts[i] for i in accepted])
+        agreed = sum(
+            1 for i, r in zip(accepted, reference) if r["label"] == results[i]["label"]
+        )
+
+    if stats is not None:
+        cs = stats.setdefault(
+            "cascade",
+            {
+                "threshold": threshold,
+                "total": 0,
+                "routed": 0,
+                "audited": 0,
+                "agreed": 0,
+            },
+        )
+        cs["total"] += len(routed) + len(accepted)
+        cs["routed"] += len(routed)
+        total = cs["total"] or 1
+        cs["routed_fraction"] = round(cs["routed"] / total, 4)
+        if audit:
+            cs["audited"] += len(accepted)
+            cs["agreed"] += agreed
+            # routed items are FinBERT's own labels, so they agree by construction
+            cs["agreement"] = round((cs["agreed"] + cs["routed"]) / total, 4)
+    return results
+
+
+def enrich_with_sentiment(
+    articles: List[Dict],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    *,
+    use_cache: bool = True,
+    stats: Dict | None = None,
+    backend: str | None = None,
+    workers: int | None = None,
+    mode: str | None = None,
+    cascade_threshold: float | None = None,
+    cascade_audit: bool = False,
+    content_pooling: str | None = None,
+) -> List[Dict]:
+    """
+    Mutates each article adding sentiment_label/conf/score.
+    Pass a dict as `stats` to collect cache hit/miss counts.
+    `mode` picks where scoring runs (see MODES); workers > 1 implies "pool".
+    `cascade_threshold` (default SENTIMENT_CASCADE_THRESHOLD) turns on the
+    lexicon-first cascade, see score_texts_cascade.
+    `content_pooling` (default SENTIMENT_CONTENT_POOLING) scores headline +
+    body chunks and pools them per article, see sentiment_chunks.
+    """
+
+    def finbert(batch: List[str]) -> List[Dict]:
+        if use_cache:
+            return score_texts_cached(
+                batch,
+                batch_size=batch_size,
+                stats=stats,
+                backend=backend,
+                workers=workers,
+                mode=mode,
+            )
+        return _score_uncached(batch, batch_size, backend, workers, mode)
+
+    threshold = (
+        cascade_threshold
+        if cascade_threshold is not None
+        else SENTIMENT_CASCADE_THRESHOLD
+    )
+    if threshold is None:
+        scorer = finbert
+    else:
+
+        def scorer(batch: List[str]) -> List[Dict]:
+            return score_texts_cascade(
+                batch, threshold, finbert, stats=stats, audit=cascade_audit
+            )
+
+    pooling = content_pooling or SENTIMENT_CONTENT_POOLING
+    if pooling:
+        from src.service.sentiment_chunks import score_articles_chunked
+
+        results = score_articles_chunked(articles, scorer, pooling, stats=stats)
+    else:
+        results = scorer([_article_text(a) for a in articles])
+    for a, res in zip(articles, results):
         a["sentiment_label"] = res["label"]
         a["sentiment_conf"] = res["confidence"]
         a["sentiment_score"] = label_to_score(res["label"], res["confidence"])
@@ -61,6 +484,7 @@ Aggregate sentiment (simple version).
 - No recency weighting
 - No source weighting
 - Final score in [0, 100] (0 = fully bearish, 50 = neutral, 100 = fully bullish)
+- Vectorized / incremental / rolling-window versions live in sentiment_aggregate
 """
 
 
@@ -94,77 +518,6 @@ def aggregate_sentiment(articles: List[Dict]) -> Dict:
           "weighted_share": {...}   # share by weight
         }
     """
-    if not articles:
-        return {
-            "score_0_100": 50.0,
-            "overall_tag": "Neutral",
-            "counts": {"positive": 0, "neutral": 0, "negative": 0, "total": 0},
-            "weighted_share": {"positive": 0.0, "neutral": 1.0, "negative": 0.0},
-        }
-
-    pos_w = neu_w = neg_w = 0.0
-    sum_w = 0.0
-    sum_wsigned = 0.0
-
-    for a in articles:
-        label = a.get("sentiment_label")
-        conf = float(a.get("sentiment_conf", 0.0) or 0.0)
-
-        signed = label_to_signed(label, conf)  # [-1,1]
-        w = conf  # weight = confidence only
-
-        sum_w += w
-        sum_wsigned += w * signed
-
-        if label == "positive":
-            pos_w += w
-        elif label == "negative":
-            neg_w += w
-        else:
-            neu_w += w
-
-    if sum_w <= 1e-9:
-        return {
-            "score_0_100": 50.0,
-            "overall_tag": "Neutral",
-            "counts": {
-                "positive": 0,
-                "neutral": 0,
-                "negative": 0,
-                "total": len(articles),
-            },
-            "weighted_share": {"positive": 0.0, "neutral": 1.0, "negative": 0.0},
-        }
+    from src.service.sentiment_aggregate import SentimentAggregator
 
-    avg_signed = sum_wsigned / sum_w  # [-1,1]
-    score_0_100 = (avg_signed + 1) * 50  # map -1..1 → 0..100
-
-    # decide tag
-    if score_0_100 >= 60:
-        tag = "Bullish"
-    elif score_0_100 <= 40:
-        tag = "Bearish"
-    else:
-        tag = "Neutral"
-
-    return {
-        "score_0_100": round(score_0_100, 1),
-        "overall_tag": tag,
-        "counts": {
-            "positive": sum(
-                1 for a in articles if a.get("sentiment_label") == "positive"
-            ),
-            "neutral": sum(
-                1 for a in articles if a.get("sentiment_label") == "neutral"
-            ),
-            "negative": sum(
-                1 for a in articles if a.get("sentiment_label") == "negative"
-            ),
-            "total": len(articles),
-        },
-        "weighted_share": {
-            "positive": round(pos_w / sum_w, 3),
-            "neutral": round(neu_w / sum_w, 3),
-            "negative": round(neg_w / sum_w, 3),
-        },
-    }
+    return SentimentAggregator.from_articles(articles).result()
@@ -0,0 +1,232 @@
+"""
+Cheap finance-lexicon sentiment scorer (first stage of the FinBERT cascade).
+
+A small linear model over a hand-curated finance lexicon: every text becomes
+a bag of unigram/bigram hits, the weights are summed with one np.bincount
+over the whole batch, and the margin between positive and negative evidence
+is turned into FinBERT-shaped {'label','confidence','probs'} results.
+Tokenizing is one regex findall per text; the batch's tokens are then
+flattened into one array and the lexicon lookup, bigram-first matching and
+negation run as array operations (only distinct tokens / token pairs are
+looked up in Python dicts).
+Confident items keep the lexicon label; everything else goes to FinBERT.
+"""
+
+import re
+import numpy as np
+from typing import Dict, List
+
+LABELS = ["negative", "neutral", "positive"]
+
+# weight > 0 bullish, < 0 bearish; bigrams take precedence over their unigrams
+LEXICON: Dict[str, float] = {
+    # --- bullish ---
+    "beat": 1.5,
+    "beats": 1.5,
+    "beat estimates": 2.5,
+    "beats estimates": 2.5,
+    "tops estimates": 2.5,
+    "record high": 2.0,
+    "record profit": 2.5,
+    "surge": 2.0,
+    "surges": 2.0,
+    "soar": 2.0,
+    "soars": 2.0,
+    "jump": 1.5,
+    "jumps": 1.5,
+    "rally": 1.5,
+    "rallies": 1.5,
+    "gain": 1.0,
+    "gains": 1.0,
+    "rise": 1.0,
+    "rises": 1.0,
+    "climb": 1.0,
+    "climbs": 1.0,
+    "upgrade": 2.0,
+    "upgrades": 2.0,
+    "upgraded": 2.0,
+    "outperform": 1.5,
+    "raises guidance": 2.5,
+    "raises outlook": 2.5,
+    "raised guidance": 2.5,
+    "boost": 1.0,
+    "boosts": 1.0,
+    "strong": 1.0,
+    "growth": 0.5,
+    "profit": 0.5,
+    "buyback": 1.0,
+    "raises dividend": 2.0,
+    "bullish": 1.5,
+    "rebound": 1.0,
+    "rebounds": 1.0,
+    "expands": 0.5,
+    "wins": 1.0,
+    "approval": 1.0,
+    "approved": 1.0,
+    # --- bearish ---
+    "miss": -1.5,
+    "misses": -1.5,
+    "missed": -1.5,
+    "misses estimates": -2.5,
+    "plunge": -2.5,
+    "plunges": -2.5,
+    "plummet": -2.5,
+    "plummets": -2.5,
+    "tumble": -2.0,
+    "tumbles": -2.0,
+    "slump": -2.0,
+    "slumps": -2.0,
+    "sink": -1.5,
+    "sinks": -1.5,
+    "fall": -1.0,
+    "falls": -1.0,
+    "drop": -1.0,
+    "drops": -1.0,
+    "decline": -1.0,
+    "declines": -1.0,
+    "slide": -1.0,
+    "slides": -1.0,
+    "downgrade": -2.0,
+    "downgrades": -2.0,
+    "downgraded": -2.0,
+    "underperform": -1.5,
+    "cuts guidance": -2.5,
+    "cuts outlook": -2.5,
+    "lowers guidance": -2.5,
+    "slashes": -2.0,
+    "loss": -1.0,
+    "losses": -1.0,
+    "weak": -1.0,
+    "probe": -1.5,
+    "investigation": -1.5,
+    "lawsuit": -1.5,
+    "sued": -1.5,
+    "recall": -1.5,
+    "recalls": -1.5,
+    "layoffs": -1.5,
+    "bankruptcy": -3.0,
+    "default": -2.0,
+    "fraud": -3.0,
+    "bearish": -1.5,
+    "warning": -1.0,
+    "warns": -1.5,
+    "halts": -1.0,
+    "crash": -2.0,
+}
+NEGATORS = {"not", "no", "never", "without", "fails", "failed"}
+_TOKEN_RE = re.compile(r"[a-z]+")
+_TERMS = list(LEXICON)
+_INDEX = {term: i for i, term in enumerate(_TERMS)}
+_WEIGHTS = np.array([LEXICON[t] for t in _TERMS], dtype=np.float64)
+
+
+def _hits(text: str) -> List[tuple[int, float]]:
+    """
+    Lexicon hits of one text as (term index, sign) with bigram-first matching
+    and negation; the per-text definition lexicon_scores() reproduces.
+    """
+    toks = _TOKEN_RE.findall(text.lower())
+    out = []
+    i = 0
+    while i < len(toks):
+        sign = -1.0 if i > 0 and toks[i - 1] in NEGATORS else 1.0
+        if i + 1 < len(toks):
+            j = _INDEX.get(f"{toks[i]} {toks[i + 1]}")
+            if j is not None:
+                out.append((j, sign))
+                i += 2
+                continue
+        j = _INDEX.get(toks[i])
+        if j is not None:
+            out.append((j, sign))
+        i += 1
+    return out
+
+
+def _lookup(keys: List[str]) -> np.ndarray:
+    """Lexicon index per key (-1 when absent)."""
+    return np.fromiter(
+        (_INDEX.get(k, -1) for k in keys), dtype=np.intp, count=len(keys)
+    )
+
+
+def lexicon_scores(texts: List[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Positive / negative evidence per text (two float arrays). Same hits as
+    _hits(), computed for the whole batch at once.
+    """
+    n = len(texts)
+    token_lists = [_TOKEN_RE.findall((t or "").lower()) for t in texts]
+    lengths = np.fromiter((len(t) for t in token_lists), dtype=np.intp, count=n)
+    if not lengths.sum():
+        return np.zeros(n), np.zeros(n)
+    rows = np.repeat(np.arange(n), lengths)
+    # token -> id for the distinct tokens of the batch
+    ids: Dict[str, int] = {}
+    tok = np.fromiter(
+        (ids.setdefault(w, len(ids)) for toks in token_lists for w in toks),
+        dtype=np.intp,
+        count=int(lengths.sum()),
+    )
+    vocab = list(ids)
+    unigram = _lookup(vocab)[tok]
+    negator = np.array([w in NEGATORS for w in vocab], dtype=bool)[tok]
+
+    # bigram starting at each position (-1 at a text's last token / no term)
+    bigram = np.full(len(tok), -1, dtype=np.intp)
+    same = rows[:-1] == rows[1:]
+    if same.any():
+        pos = np.flatnonzero(same)
+        pairs, pair_idx = np.unique(
+            tok[pos] * len(vocab) + tok[pos + 1], return_inverse=True
+        )
+        first, second = np.divmod(pairs, len(vocab))
+        terms = _lookup([f"{vocab[a]} {vocab[b]}" for a, b in zip(first, second)])
+        bigram[pos] = terms[pair_idx]
+
+    # greedy left-to-right: in a run of consecutive bigram starts every other
+    # one is taken (the previous one consumed its first token)
+    is_bi = bigram >= 0
+    idx = np.arange(len(tok))
+    run_start = np.maximum.accumulate(
+        np.where(is_bi & ~np.concatenate(([False], is_bi[:-1])), idx, 0)
+    )
+    take_bi = is_bi & ((idx - run_start) % 2 == 0)
+    consumed = np.concatenate(([False], take_bi[:-1]))
+    take_uni = ~take_bi & ~consumed & (unigram >= 0)
+
+    negated = np.concatenate(([False], negator[:-1] & same))
+    hit = take_bi | take_uni
+    cols = np.where(take_bi, bigram, unigram)[hit]
+    contrib = _WEIGHTS[cols] * np.where(negated[hit], -1.0, 1.0)
+    pos_ev = np.bincount(rows[hit], weights=np.clip(contrib, 0, None), minlength=n)
+    neg_ev = np.bincount(rows[hit], weights=np.clip(-contrib, 0, None), minlength=n)
+    return pos_ev, neg_ev
+
+
+def score_texts_lexicon(texts: List[str]) -> List[Dict]:
+    """
+    FinBERT-shaped results from the lexicon. Confidence grows with the net
+    evidence and shrinks when positive and negative terms are mixed. Each
+    result also carries "evidence" (summed |weight| of its hits); texts with
+    no hits have evidence 0 and come back neutral at 0.5, and the cascade
+    always routes them on whatever its threshold.
+    """
+    pos, neg = lexicon_scores(texts)
+    margin = pos - neg
+    total = pos + neg
+    strength = 1.0 - np.exp(-np.abs(margin) / 2.0)
+    purity = np.divide(np.abs(margin), total, out=np.zeros_like(total), where=total > 0)
+    conf = np.where(margin == 0, np.where(total > 0, 0.4, 0.5), strength * purity)
+    label_idx = np.where(margin > 0, 2, np.where(margin < 0, 0, 1))
+
+    results = []
+    for k, c, e in zip(label_idx.tolist(), conf.tolist(), total.tolist()):
+        c = max(c, 1 / 3)  # never below uniform
+        rest = (1.0 - c) / 2.0
+        probs = [rest, rest, rest]
+        probs[k] = c
+        results.append(
+            {"label": LABELS[k], "confidence": float(c), "probs": probs, "evidence": e}
+        )
+    return results
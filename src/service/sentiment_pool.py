@@ -0,0 +1,158 @@
+"""
+Multi-process FinBERT scoring for watchlist-wide runs.
+
+Workers are started with "forkserver" ("spawn" where that is unavailable),
+never by forking the caller: forking a process that already ran torch, or a
+multithreaded one like Streamlit, can deadlock the child in OpenMP/MKL thread
+pools. Each worker loads the model in its initializer (from the safetensors
+snapshot when present, which is memory-mapped, so the weights' pages are
+shared through the page cache) and pins torch to physical_cores // workers
+intra-op threads so the pool does not oversubscribe the box. Shards are
+contiguous slices and results are merged back in input order.
+"""
+
+import os
+import atexit
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List
+from logging_config import logger
+from src.service import sentiment_finBERT as sf
+
+
+def physical_cores() -> int:
+    """Physical core count (Linux /proc/cpuinfo), falling back to logical CPUs."""
+    try:
+        cores = set()
+        phys = None
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("physical id"):
+                    phys = line.split(":", 1)[1].strip()
+                elif line.startswith("core id"):
+                    cores.add((phys, line.split(":", 1)[1].strip()))
+        if cores:
+            return len(cores)
+    except OSError:
+        pass
+    return os.cpu_count() or 1
+
+
+def _init_worker(threads: int, backend: str | None, load_model: bool = True):
+    # set before torch is imported so OpenMP / MKL size their pools from it
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    if not load_model:
+        return
+    import torch
+
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # already fixed in this process
+    sf._get_backend(backend)  # load once per worker, before the first shard
+
+
+def _score_shard(
+    texts: List[str],
+    batch_size: int,
+    backend: str | None,
+    scorer: Callable[..., List[Dict]] | None = None,
+) -> List[Dict]:
+    return (scorer or sf.score_texts)(texts, batch_size=batch_size, backend=backend)
+
+
+def _start_context():
+    methods = mp.get_all_start_methods()
+    return mp.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class SentimentPool:
+    """
+    Process pool that scores texts with FinBERT in parallel.
+
+    Usage:
+        with SentimentPool(workers=8) as pool:
+            results = pool.score_texts(texts)
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        backend: str | None = None,
+        batch_size: int = sf.DEFAULT_BATCH_SIZE,
+        scorer: Callable[..., List[Dict]] | None = None,
+    ):
+        """
+        `scorer` replaces sentiment_finBERT.score_texts in the workers (same
+        signature; must be picklable, i.e. a module-level function); workers
+        then skip loading FinBERT.
+        """
+        self.workers = max(1, workers or physical_cores())
+        self.backend = backend
+        self.batch_size = batch_size
+        self.scorer = scorer
+        self.threads_per_worker = max(1, physical_cores() // self.workers)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> "SentimentPool":
+        if self._executor is not None:
+            return self
+        ctx = _start_context()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker, self.backend, self.scorer is None),
+        )
+        logger.debug(
+            f"SentimentPool started: {self.workers} workers x {self.threads_per_worker} threads ({ctx.get_start_method()})"
+        )
+        return self
+
+    def score_texts(
+        self, texts: List[str], batch_size: int | None = None
+    ) -> List[Dict]:
+        """Same contract as sentiment_finBERT.score_texts, sharded across workers."""
+        if not texts:
+            return []
+        bs = batch_size or self.batch_size
+        n_shards = min(self.workers, -(-len(texts) // bs))
+        if n_shards <= 1 and self._executor is None:
+            # not worth starting workers; safe because the pool never forks
+            scorer = self.scorer or sf.score_texts
+            return scorer(texts, batch_size=bs, backend=self.backend)
+
+        self.start()
+        n_shards = max(1, n_shards)
+        step = -(-len(texts) // n_shards)
+        shards = [texts[i : i + step] for i in range(0, len(texts), step)]
+        futures = [
+            self._executor.submit(_score_shard, shard, bs, self.backend, self.scorer)
+            for shard in shards
+        ]
+        results: List[Dict] = []
+        for fut in futures:
+            results.extend(fut.result())
+        return results
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@lru_cache(maxsize=4)
+def get_pool(workers: int, backend: str | None = None) -> SentimentPool:
+    """Process-wide pool per (workers, backend), shut down at interpreter exit."""
+    pool = SentimentPool(workers=workers, backend=backend)
+    atexit.register(pool.close)
+    return pool
@@ -0,0 +1,281 @@
+"""
+Standalone FinBERT daemon over a Unix domain socket.
+
+One process owns the model; Streamlit workers and CLI runs send it batches of
+texts instead of each loading their own copy. Requests from concurrent
+clients are coalesced through the MicroBatcher.
+
+Run it with:
+    python -m src.service.sentiment_server [--socket PATH] [--backend torch|onnx]
+
+Wire format (little-endian), one request/response pair at a time per connection:
+    request:  b"FB" u8 version  u32 count, then count x (u32 nbytes, utf-8 text)
+    response: b"FB" u8 status   u32 count, then
+              status 0 -> count x 3 float32 probs (negative, neutral, positive)
+              status 1 -> count bytes of utf-8 error message
+              status 2 -> count bytes of utf-8 JSON {"backend", "revision"},
+                          the answer to a request with count 0
+"""
+
+import os
+import sys
+import json
+import socket
+import struct
+import tempfile
+import argparse
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, List
+from logging_config import logger
+from src.service.sentiment_finBERT import MODEL_REVISION, _resolve_backend, _to_result
+
+SENTIMENT_SOCKET = os.getenv(
+    "SENTIMENT_SOCKET", os.path.join(tempfile.gettempdir(), "finbert.sock")
+)
+MAGIC = b"FB"
+VERSION = 1
+STATUS_OK = 0
+STATUS_ERROR = 1
+STATUS_INFO = 2
+_HEADER = struct.Struct("<2sBI")
+_LEN = struct.Struct("<I")
+
+
+class SentimentServerError(RuntimeError):
+    """The daemon could not be reached, failed to score, or sent a bad reply."""
+
+
+def _recv_exact(conn: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = conn.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("sentiment socket closed mid-message")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def encode_request(texts: List[str]) -> bytes:
+    parts = [_HEADER.pack(MAGIC, VERSION, len(texts))]
+    for t in texts:
+        raw = (t or "").encode("utf-8")
+        parts.append(_LEN.pack(len(raw)))
+        parts.append(raw)
+    return b"".join(parts)
+
+
+def read_request(conn: socket.socket) -> List[str]:
+    magic, version, count = _HEADER.unpack(_recv_exact(conn, _HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"bad request header {magic!r} v{version}")
+    texts = []
+    for _ in range(count):
+        (n,) = _LEN.unpack(_recv_exact(conn, _LEN.size))
+        texts.append(_recv_exact(conn, n).decode("utf-8"))
+    return texts
+
+
+def encode_response(results: List[Dict]) -> bytes:
+    flat = [float(p) for r in results for p in r["probs"]]
+    return _HEADER.pack(MAGIC, STATUS_OK, len(results)) + struct.pack(
+        f"<{len(flat)}f", *flat
+    )
+
+
+def encode_error(message: str) -> bytes:
+    raw = message.encode("utf-8")
+    return _HEADER.pack(MAGIC, STATUS_ERROR, len(raw)) + raw
+
+
+def encode_info(info: Dict) -> bytes:
+    raw = json.dumps(info).encode("utf-8")
+    return _HEADER.pack(MAGIC, STATUS_INFO, len(raw)) + raw
+
+
+def read_info(conn: socket.socket) -> Dict:
+    magic, status, count = _HEADER.unpack(_recv_exact(conn, _HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"bad response header {magic!r}")
+    if status == STATUS_OK:
+        return {}  # daemon predates the info request
+    if status != STATUS_INFO:
+        raise ValueError(f"unexpected status {status} for an info request")
+    return json.loads(_recv_exact(conn, count).decode("utf-8"))
+
+
+def read_response(conn: socket.socket) -> List[Dict]:
+    magic, status, count = _HEADER.unpack(_recv_exact(conn, _HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"bad response header {magic!r}")
+    if status != STATUS_OK:
+        message = _recv_exact(conn, count).decode("utf-8")
+        raise SentimentServerError(f"sentiment server error: {message}")
+    probs = struct.unpack(f"<{count * 3}f", _recv_exact(conn, count * 12))
+    return [_to_result(list(probs[i * 3 : i * 3 + 3])) for i in range(count)]
+
+
+class SentimentServer:
+    """Accepts client connections and scores their batches through one batcher."""
+
+    def __init__(
+        self,
+        socket_path: str = SENTIMENT_SOCKET,
+        scorer: Callable[[List[str]], List[Dict]] | None = None,
+        backend: str | None = None,
+    ):
+        self.socket_path = socket_path
+        # what the results are computed with; clients key their cache by it
+        self.info = {"backend": _resolve_backend(backend), "revision": MODEL_REVISION}
+        if scorer is None:
+            from src.service.sentiment_batcher import get_batcher
+
+            scorer = get_batcher(backend).score
+        self.scorer = scorer
+        self._sock: socket.socket | None = None
+        self._stop = threading.Event()
+
+    def bind(self) -> "SentimentServer":
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # stale socket from a previous run
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        sock.listen(64)
+        self._sock = sock
+        return self
+
+    def serve_forever(self):
+        if self._sock is None:
+            self.bind()
+        logger.info(f"Sentiment server listening on {self.socket_path}")
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                break  # socket closed by shutdown()
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket):
+        with conn:
+            while True:
+                try:
+                    texts = read_request(conn)
+                except (ConnectionError, ValueError, struct.error):
+                    return
+                if not texts:
+                    try:
+                        conn.sendall(encode_info(self.info))
+                    except OSError:
+                        return
+                    continue
+                try:
+                    payload = encode_response(self.scorer(texts))
+                except Exception as e:
+                    logger.error(f"Sentiment server scoring failed: {e}")
+                    payload = encode_error(str(e))
+                try:
+                    conn.sendall(payload)
+                except OSError:
+                    return
+
+    def shutdown(self):
+        self._stop.set()
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)  # wakes a blocked accept()
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class SentimentClient:
+    """Thread-safe client holding one persistent connection to the daemon."""
+
+    def __init__(self, socket_path: str = SENTIMENT_SOCKET, timeout: float = 60.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn: socket.socket | None = None
+        self._info: Dict | None = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """Cheap check: the socket file exists (connect errors surface on use)."""
+        return os.path.exists(self.socket_path)
+
+    def _connect(self) -> socket.socket:
+        if self._conn is None:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.settimeout(self.timeout)
+            conn.connect(self.socket_path)
+            self._conn = conn
+        return self._conn
+
+    def _call(self, request: bytes, read):
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.sendall(request)
+                return read(conn)
+            except SentimentServerError:
+                raise  # scoring failed on the daemon; the connection is still good
+            except (OSError, ValueError, struct.error, UnicodeDecodeError) as e:
+                self.close()
+                raise SentimentServerError(
+                    f"sentiment server unavailable: {e!r}"
+                ) from e
+
+    def info(self) -> Dict:
+        """{"backend", "revision"} the daemon scores with ({} for old daemons)."""
+        if self._info is None:
+            self._info = self._call(encode_request([]), read_info)
+        return self._info
+
+    def score_texts(self, texts: List[str]) -> List[Dict]:
+        """Score texts on the daemon. Raises SentimentServerError on any failure."""
+        if not texts:
+            return []
+        results = self._call(encode_request(texts), read_response)
+        if len(results) != len(texts):
+            raise SentimentServerError(
+                f"sentiment server returned {len(results)} results for {len(texts)} texts"
+            )
+        return results
+
+    def close(self):
+        self._info = None  # a reconnect may reach a restarted daemon
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            finally:
+                self._conn = None
+
+
+@lru_cache(maxsize=4)
+def get_client(socket_path: str = SENTIMENT_SOCKET) -> SentimentClient:
+    return SentimentClient(socket_path)
+
+
+def main(argv: List[str] | None = None):
+    parser = argparse.ArgumentParser(description="FinBERT sentiment daemon")
+    parser.add_argument("--socket", default=SENTIMENT_SOCKET)
+    parser.add_argument("--backend", default=None, help="torch | onnx")
+    args = parser.parse_args(argv)
+
+    from src.service.sentiment_finBERT import _get_backend
+
+    _get_backend(args.backend)  # load the model before accepting clients
+    server = SentimentServer(args.socket, backend=args.backend).bind()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
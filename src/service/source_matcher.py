@@ -0,0 +1,150 @@
+"""
+Trusted-source matching built once, used for every article.
+
+Lookups go cheapest first:
+  1. exact hit on the normalized source name ("The Wall Street Journal" ->
+     "wall street journal"),
+  2. exact hit on the article's URL domain or one of its parent domains,
+  3. fuzzy match (fuzzywuzzy) of the normalized name, done once per distinct
+     name and memoized, so repeated sources never pay for it again.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import urlparse
+
+# WRatio false positives ("Economic Times" ~ "The Times (UK)") score 86;
+# regional editions of a trusted outlet ("CNBC TV18", "Forbes India") score 90+
+TRUSTED_SOURCE_THRESHOLD = int(os.getenv("TRUSTED_SOURCE_THRESHOLD", "90"))
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+# "Reuters.com" / "Gold.org" / "Telegraph.co.uk" -> "reuters" / "gold" / "telegraph"
+_WEB_SUFFIX_RE = re.compile(r"\.(?:com|org|net|io|co)(?:\.[a-z]{2})?$")
+_DOMAIN_PREFIXES = ("www.", "m.", "amp.")
+
+
+def normalize_source(name: str | None) -> str:
+    """Lowercase, drop punctuation, a trailing web suffix and a leading 'the'."""
+    name = _WEB_SUFFIX_RE.sub("", (name or "").strip().lower())
+    name = _NON_WORD_RE.sub(" ", name).strip()
+    if name.startswith("the "):
+        name = name[4:]
+    return name
+
+
+def normalize_domain(url_or_domain: str | None) -> str:
+    """Host part of a URL (or a bare domain) without www./m./amp. prefixes."""
+    value = (url_or_domain or "").strip().lower()
+    if "//" in value:
+        value = urlparse(value).netloc
+    value = value.split("/", 1)[0].split(":", 1)[0]
+    for pref in _DOMAIN_PREFIXES:
+        if value.startswith(pref):
+            value = value[len(pref) :]
+    return value
+
+
+class SourceMatcher:
+    """
+    Compiled trusted-source index.
+
+    `names` are the canonical source names; `domains` maps a canonical name
+    to its web domains and `weights` to its weight. match() returns the
+    canonical name or None; weight() the name's weight (default 1.0).
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        domains: Dict[str, List[str]] | None = None,
+        threshold: int = TRUSTED_SOURCE_THRESHOLD,
+        weights: Dict[str, float] | None = None,
+    ):
+        self.threshold = threshold
+        self._weights: Dict[str, float] = dict(weights or {})
+        self._names: Dict[str, str] = {}
+        for name in names:
+            self._names.setdefault(normalize_source(name), name)
+        self._domains: Dict[str, str] = {}
+        for name, doms in (domains or {}).items():
+            for d in doms:
+                self._domains[normalize_domain(d)] = name
+        self._choices = list(self._names)
+        # normalized name -> (canonical, fuzzy score); decisions are reused
+        self._memo: Dict[str, Tuple[str | None, int]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"name": 0, "domain": 0, "memo": 0, "fuzzy": 0, "miss": 0}
+
+    def _count(self, outcome: str):
+        # one matcher is shared by every thread (see source_registry)
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def _domain_lookup(self, domain: str) -> str | None:
+        parts = domain.split(".")
+        for i in range(len(parts) - 1):
+            hit = self._domains.get(".".join(parts[i:]))
+            if hit:
+                return hit
+        return None
+
+    def _fuzzy(self, key: str) -> Tuple[str | None, int]:
+        with self._lock:
+            if key in self._memo:
+                self.stats["memo"] += 1
+                return self._memo[key]
+        from fuzzywuzzy import process
+
+        best = None
+        if self._choices:
+            best = process.extractOne(key, self._choices, processor=None)
+        decision = (self._names[best[0]], int(best[1])) if best else (None, 0)
+        with self._lock:
+            self._memo[key] = decision
+            self.stats["fuzzy"] += 1
+        return decision
+
+    def match(
+        self,
+        source: str | None = None,
+        url: str | None = None,
+        threshold: int | None = None,
+    ) -> str | None:
+        """Canonical trusted name for a source name and/or article URL/domain."""
+        key = normalize_source(source)
+        hit = self._names.get(key) if key else None
+        if hit:
+            self._count("name")
+            return hit
+        domain = normalize_domain(url)
+        hit = self._domain_lookup(domain) if domain else None
+        if hit:
+            self._count("domain")
+            return hit
+        if key:
+            name, score = self._fuzzy(key)
+            if name and score >= (self.threshold if threshold is None else threshold):
+                return name
+        self._count("miss")
+        return None
+
+    def weight(self, name: str | None, default: float = 1.0) -> float:
+        """Configured weight of a canonical source name (see match())."""
+        return self._weights.get(name, default) if name else default
+
+    def is_trusted(
+        self,
+        source: str | None = None,
+        url: str | None = None,
+        threshold: int | None = None,
+    ) -> bool:
+        return self.match(source, url, threshold) is not None
+
+
+def get_matcher() -> SourceMatcher:
+    """Current matcher of the shared, hot-reloaded trusted-source registry."""
+    from src.service.source_registry import get_registry
+
+    return get_registry().matcher()
@@ -0,0 +1,120 @@
+"""
+Hot-reloadable trusted-source registry.
+
+The registry file (TRUSTED_SOURCES_PATH, JSON) maps each trusted source to
+its web domains and an optional weight (default 1.0, exposed as
+SourceMatcher.weight(name) for downstream weighting):
+
+    {"sources": {"Reuters": {"domains": ["reuters.com"], "weight": 1.0}, ...}}
+
+One SourceRegistry per process holds the compiled SourceMatcher. Every
+lookup stats the file (at most once per check_interval seconds); when its
+mtime or size changes the file is re-parsed, a new matcher is built and
+swapped in with a single assignment, so running pipelines and Streamlit
+workers see the new list on their next call without a restart. A broken
+edit is logged once and the previous list stays in use until the file
+changes again.
+"""
+
+import os
+import json
+import time
+import threading
+from functools import lru_cache
+from typing import Dict, Tuple
+from logging_config import logger
+from resources.trusted_sources import TRUSTED_SOURCES_FILE
+from src.service.source_matcher import SourceMatcher
+
+TRUSTED_SOURCES_PATH = os.getenv("TRUSTED_SOURCES_PATH", TRUSTED_SOURCES_FILE)
+
+
+def load_registry_file(path: str) -> Tuple[Dict[str, list], Dict[str, float]]:
+    """
+    Parse a registry file into (name -> domains, name -> weight). Raises
+    ValueError on anything that does not follow the schema.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    sources = data.get("sources", data) if isinstance(data, dict) else None
+    if not isinstance(sources, dict):
+        raise ValueError(f"{path}: expected an object of sources")
+    domains, weights = {}, {}
+    for name, entry in sources.items():
+        entry = {} if entry is None else entry
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: source {name!r} must be an object")
+        doms = entry.get("domains", [])
+        if not isinstance(doms, list) or not all(isinstance(d, str) for d in doms):
+            raise ValueError(f"{path}: domains of {name!r} must be a list of strings")
+        weight = entry.get("weight", 1.0)
+        if (
+            isinstance(weight, bool)
+            or not isinstance(weight, (int, float))
+            or weight < 0
+        ):
+            raise ValueError(f"{path}: weight of {name!r} must be a number >= 0")
+        domains[name] = doms
+        weights[name] = float(weight)
+    return domains, weights
+
+
+class SourceRegistry:
+    """File-backed trusted-source index, reloaded when the file changes."""
+
+    def __init__(self, path: str = TRUSTED_SOURCES_PATH, check_interval: float = 1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature: Tuple[int, int] | None = None
+        # signature of a file that failed to parse, so it is reported once
+        self._bad_signature: Tuple[int, int] | None = None
+        self._checked_at = 0.0
+        self._matcher = SourceMatcher([])
+        self.reloads = 0
+        self.refresh(force=True)
+
+    def _stat(self) -> Tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def refresh(self, force: bool = False) -> bool:
+        """Reload if the file changed since the last load. True if it reloaded."""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+        with self._lock:
+            self._checked_at = now
+            signature = self._stat()
+            if signature is None:
+                if force:
+                    logger.warning(f"Trusted-source registry {self.path} not found")
+                return False
+            if not force and signature in (self._signature, self._bad_signature):
+                return False
+            try:
+                domains, weights = load_registry_file(self.path)
+            except (OSError, ValueError) as e:
+                if signature != self._bad_signature:
+                    logger.warning(f"Keeping previous trusted-source list; {e}")
+                self._bad_signature = signature
+                return False
+            self._matcher = SourceMatcher(domains, domains, weights=weights)
+            self._signature = signature
+            self._bad_signature = None
+            self.reloads += 1
+        logger.info(f"Loaded {len(domains)} trusted sources from {self.path}")
+        return True
+
+    def matcher(self) -> SourceMatcher:
+        self.refresh()
+        return self._matcher
+
+
+@lru_cache(maxsize=1)
+def get_registry() -> SourceRegistry:
+    """The one registry instance shared by everything in the process."""
+    return SourceRegistry()
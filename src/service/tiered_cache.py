@@ -0,0 +1,127 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+_SQLITE_MAX_VARS = 500
+
+
+class TieredCache:
+    """
+    Two-tier key/value cache: an in-process LRU in front of a SQLite table.
+
+    Values must be JSON-serializable. The SQLite file is opened in WAL mode so
+    several processes (Streamlit workers, CLI runs) can read and write it at
+    the same time. Pass path=None for a memory-only cache. Lookups can pass
+    max_age (seconds) to ignore entries written longer ago than that.
+    """
+
+    def __init__(self, path: Optional[str], maxsize: int = 4096, table: str = "cache"):
+        self.path = path
+        self.maxsize = maxsize
+        self.table = table
+        self._lru: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        if not self.path:
+            return None
+        # one connection per thread, and never reuse one across a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _remember(self, key: str, value: Any, created_at: float):
+        # caller holds self._lock
+        self._lru[key] = (value, created_at)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def get_many(
+        self, keys: Iterable[str], max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Return {key: value} for every key found in either tier (and fresh enough)."""
+        oldest = time.time() - max_age if max_age is not None else float("-inf")
+        found: Dict[str, Any] = {}
+        missing = []
+        with self._lock:
+            for k in dict.fromkeys(keys):
+                entry = self._lru.get(k)
+                if entry is not None and entry[1] >= oldest:
+                    self._lru.move_to_end(k)
+                    found[k] = entry[0]
+                else:
+                    missing.append(k)
+
+        conn = self._conn()
+        if not missing or conn is None:
+            return found
+
+        from_disk = {}
+        for i in range(0, len(missing), _SQLITE_MAX_VARS):
+            chunk = missing[i : i + _SQLITE_MAX_VARS]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, value, created_at FROM {self.table} WHERE key IN ({marks})",
+                chunk,
+            ).fetchall()
+            for k, v, created_at in rows:
+                if created_at >= oldest:
+                    from_disk[k] = (json.loads(v), created_at)
+
+        with self._lock:
+            for k, (v, created_at) in from_disk.items():
+                self._remember(k, v, created_at)
+        found.update({k: v for k, (v, _) in from_disk.items()})
+        return found
+
+    def put_many(self, items: Dict[str, Any]):
+        """Store every (key, value) pair in both tiers."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            for k, v in items.items():
+                self._remember(k, v, now)
+
+        conn = self._conn()
+        if conn is None:
+            return
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)",
+                [(k, json.dumps(v), now) for k, v in items.items()],
+            )
+
+    def get(
+        self, key: str, default: Any = None, max_age: Optional[float] = None
+    ) -> Any:
+        return self.get_many([key], max_age=max_age).get(key, default)
+
+    def put(self, key: str, value: Any):
+        self.put_many({key: value})
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._lru.clear()
+        conn = self._conn()
+        if conn is not None:
+            with conn:
+                conn.execute(f"DELETE FROM {self.table}")
@@ -20,6 +20,8 @@ logger.setLevel(logging.DEBUG)  # Keep DEBUG for your application-specific logs
 
 from src.pipeline.run_pipeline import run_pipeline
 from src.service.pre_processing import aggregate_price_change
+from src.service.sentiment_server import get_client as get_sentiment_client
+from src.service.sentiment_finBERT import warm_up as warm_up_sentiment
 
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 ALPHA_VINTAGE_API_KEY = os.getenv("ALPHA_VINTAGE_API_KEY")
@@ -33,6 +35,11 @@ st.set_page_config(
     layout="wide",
 )
 
+# Load FinBERT on a background thread while the page renders (no-op after the
+# first call, and skipped when the sentiment_server daemon owns the model).
+if not get_sentiment_client().available():
+    warm_up_sentiment()
+
 # minimal styles (optional)
 st.markdown("""
 <style>
@@ -155,8 +162,15 @@ def _run(query_str: str, date_from, date_to, openai_key: str) -> dict:
     if date_from > date_to:
         date_from = date_to
 
-    # Run your pipeline
-    result = run_pipeline(query_str, date_from=date_from, date_to=date_to, openai_api_key=openai_key)
+    # Run your pipeline. FinBERT runs in the sentiment_server daemon when it is up;
+    # otherwise concurrent sessions share one micro-batching queue in this process.
+    result = run_pipeline(
+        query_str,
+        date_from=date_from,
+        date_to=date_to,
+        openai_api_key=openai_key,
+        sentiment_mode="server" if get_sentiment_client().available() else "queue",
+    )
 
     # Try to get structured stock data first
     stock_data = result.get("stock_data", [])
@@ -12,7 +12,7 @@ load_dotenv()
 ALPHA_VINTAGE_API_KEY = os.getenv("ALPHA_VINTAGE_API_KEY")  # Replace with a default for testing
 ALPHA_VINTAGE_API_URL = os.getenv("ALPHA_VINTAGE_API_URL")  # Replace with a default for testing
 
-@patch("src.models.alpha_vintage_api.requests.get")
+@patch("src.models.alpha_vintage_api.http_get")
 def test_av_symbol_search(mock_get):
     """
     Test the av_symbol_search function with mocked API responses.
@@ -0,0 +1,132 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+import src.models.http_cache as hc
+from src.service.tiered_cache import TieredCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    c = TieredCache(str(tmp_path / "http.sqlite"))
+    monkeypatch.setattr(hc, "get_http_cache", lambda: c)
+    return c
+
+
+class Upstream:
+    def __init__(self, value=None, error=None):
+        self.value, self.error, self.calls = value, error, 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.value
+
+
+def test_key_ignores_api_key_and_param_order():
+    a = hc.request_key("newsapi", {"q": "Tesla", "apiKey": "one", "from": "2025-09-01"})
+    b = hc.request_key("newsapi", {"from": "2025-09-01", "q": " Tesla ", "apiKey": "two"})
+    assert a == b
+    assert a != hc.request_key("newsapi", {"q": "Tesla", "from": "2025-09-02"})
+    assert a != hc.request_key("av_search", {"q": "Tesla", "from": "2025-09-01"})
+
+
+def test_key_includes_the_base_url():
+    params = {"q": "Tesla", "apiKey": "k"}
+    prod = hc.request_key("newsapi", params, "https://newsapi.org/v2/everything")
+    assert prod == hc.request_key("newsapi", params, "https://NewsAPI.org/v2/everything/")
+    assert prod != hc.request_key("newsapi", params, "http://newsapi.org/v2/everything")
+    assert prod != hc.request_key("newsapi", params, "https://sandbox.example/v2/everything")
+    assert prod != hc.request_key("newsapi", params)
+
+
+def test_off_mode_always_calls(cache):
+    up = Upstream({"n": 1})
+    hc.cached_call("newsapi", {"q": "x"}, up, mode="off")
+    hc.cached_call("newsapi", {"q": "x"}, up, mode="off")
+    assert up.calls == 2
+
+
+def test_record_serves_fresh_and_refetches_after_ttl(cache, monkeypatch):
+    import src.service.tiered_cache as tc
+
+    now = [1000.0]
+    monkeypatch.setattr(tc.time, "time", lambda: now[0])
+    monkeypatch.setitem(hc.HTTP_CACHE_TTLS, "newsapi", 60)
+    up = Upstream({"n": 1})
+    assert hc.cached_call("newsapi", {"q": "x", "apiKey": "k"}, up, mode="record") == {"n": 1}
+    assert hc.cached_call("newsapi", {"q": "x", "apiKey": "z"}, up, mode="record") == {"n": 1}
+    assert up.calls == 1
+    now[0] += 61
+    up.value = {"n": 2}
+    assert hc.cached_call("newsapi", {"q": "x"}, up, mode="record") == {"n": 2}
+    assert up.calls == 2
+
+
+def test_record_falls_back_to_stale_on_failure(cache, monkeypatch):
+    monkeypatch.setitem(hc.HTTP_CACHE_TTLS, "av_daily", -1)  # everything is stale
+    hc.cached_call("av_daily", {"symbol": "AAPL"}, Upstream({"ok": 1}), mode="record")
+    down = Upstream(error=RuntimeError("HTTP 503"))
+    assert hc.cached_call("av_daily", {"symbol": "AAPL"}, down, mode="record") == {"ok": 1}
+    with pytest.raises(RuntimeError):
+        hc.cached_call("av_daily", {"symbol": "MSFT"}, down, mode="record")
+
+
+def test_replay_never_calls(cache, monkeypatch):
+    monkeypatch.setitem(hc.HTTP_CACHE_TTLS, "openai", -1)
+    hc.cached_call("openai", {"model": "m", "messages": [1]}, Upstream("[]"), mode="record")
+    up = Upstream("fresh")
+    assert hc.cached_call("openai", {"model": "m", "messages": [1]}, up, mode="replay") == "[]"
+    with pytest.raises(hc.ReplayMiss):
+        hc.cached_call("openai", {"model": "m", "messages": [2], "api_key": "secret"}, up, mode="replay")
+    assert up.calls == 0
+
+
+def test_replay_miss_message_hides_key(cache):
+    with pytest.raises(hc.ReplayMiss) as err:
+        hc.cached_call("newsapi", {"q": "x", "apiKey": "sk-secret"}, Upstream(), mode="replay")
+    assert "sk-secret" not in str(err.value)
+
+
+def test_news_api_replays_without_network(cache, monkeypatch):
+    import src.models.http_client as client
+    from src.models.news_api import get_news_articles_urls
+
+    payload = {"status": "ok", "totalResults": 1, "articles": [{"title": "t"}]}
+
+    class Resp:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return payload
+
+    calls = []
+    monkeypatch.setattr(client, "http_get", lambda url, **kw: calls.append(url) or Resp())
+    monkeypatch.setattr(hc, "HTTP_CACHE_MODE", "record")
+    assert get_news_articles_urls("Tesla", "2025-09-01", "2025-09-02", api_key="a") == payload
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("network used in replay mode")
+
+    monkeypatch.setattr(client, "http_get", no_network)
+    monkeypatch.setattr(hc, "HTTP_CACHE_MODE", "replay")
+    assert get_news_articles_urls("Tesla", "2025-09-01", "2025-09-02", api_key="b") == payload
+    assert len(calls) == 1
+
+
+def test_av_rate_limit_delay_is_skipped_on_replay(cache, monkeypatch):
+    import src.models.alpha_vintage_api as av
+
+    payload = {"Time Series (Daily)": {"2025-09-26": {"4. close": "1"}}}
+    url = "https://www.alphavantage.co/query"
+    params = {"function": "TIME_SERIES_DAILY", "symbol": "AAPL"}
+    hc.cached_call("av_daily", params, Upstream(payload), mode="record", url=url)
+    slept = []
+    monkeypatch.setattr(av.time, "sleep", slept.append)
+    monkeypatch.setattr(hc, "HTTP_CACHE_MODE", "replay")
+    assert av.get_av_daily_data("AAPL", url, "k", delay=5) == payload
+    assert slept == []
@@ -0,0 +1,113 @@
+import os
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+pytest.importorskip("requests")
+from src.models.http_client import HttpClient, backoff_delay, retry_after_seconds
+
+
+class FlakyServer:
+    """Keep-alive server answering `statuses` in order, then 200 forever."""
+
+    def __init__(self, statuses=(), retry_after=None):
+        self.statuses = list(statuses)
+        self.retry_after = retry_after
+        self.hits = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server.hits += 1
+                status = server.statuses.pop(0) if server.statuses else 200
+                payload = json.dumps({"status": status}).encode()
+                self.send_response(status)
+                if status != 200 and server.retry_after is not None:
+                    self.send_header("Retry-After", server.retry_after)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/q"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_connections_are_reused():
+    with FlakyServer() as srv:
+        client = HttpClient()
+        for _ in range(5):
+            assert client.get(srv.url).status_code == 200
+        m = client.metrics()
+        client.close()
+    assert m["requests"] == 5 and m["retries"] == 0
+    assert m["connections_opened"] == 1
+    assert m["connections_reused"] == 4
+
+
+def test_retries_5xx_and_honours_retry_after():
+    with FlakyServer([503, 429], retry_after="0") as srv:
+        client = HttpClient(retries=3)
+        resp = client.get(srv.url)
+        m = client.metrics()
+        client.close()
+    assert resp.status_code == 200
+    assert srv.hits == 3
+    assert m["retries"] == 2 and m["failures"] == 0
+
+
+def test_gives_up_after_retries():
+    with FlakyServer([500] * 10, retry_after="0") as srv:
+        client = HttpClient(retries=2)
+        resp = client.get(srv.url)
+        m = client.metrics()
+        client.close()
+    assert resp.status_code == 500
+    assert srv.hits == 3 and m["failures"] == 1
+
+
+def test_deadline_stops_long_retry_after():
+    with FlakyServer([503] * 10, retry_after="30") as srv:
+        client = HttpClient(retries=5)
+        t0 = time.perf_counter()
+        resp = client.get(srv.url, deadline=1.0)
+        elapsed = time.perf_counter() - t0
+        client.close()
+    assert resp.status_code == 503
+    assert srv.hits == 1 and elapsed < 1.0
+
+
+def test_connection_error_is_raised():
+    import requests
+
+    client = HttpClient(retries=1)
+    with pytest.raises(requests.ConnectionError):
+        client.get("http://127.0.0.1:9/unreachable", deadline=2.0)
+    assert client.metrics()["retries"] == 1
+
+
+def test_backoff_and_retry_after_parsing():
+    for attempt in range(6):
+        assert 0.0 <= backoff_delay(attempt, base=0.5, cap=4.0) <= min(4.0, 0.5 * 2**attempt)
+    assert retry_after_seconds("7") == 7.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("garbage") is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,144 @@
+import os
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.models.news_api import iter_news_articles, get_all_news_articles
+
+pytest.importorskip("requests")
+
+
+class StandInNewsAPI:
+    """Local NewsAPI /everything stand-in: `total` articles, slow later pages."""
+
+    def __init__(self, total, delay=0.0, fail_pages=()):
+        self.total = total
+        self.delay = delay
+        self.fail_pages = set(fail_pages)
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query)
+                page = int(params.get("page", ["1"])[0])
+                size = int(params.get("pageSize", ["100"])[0])
+                with lock:
+                    api.requests.append(page)
+                    api.in_flight += 1
+                    api.max_in_flight = max(api.max_in_flight, api.in_flight)
+                try:
+                    if page > 1:
+                        time.sleep(api.delay)
+                    if page in api.fail_pages:
+                        body = {"status": "error", "code": "maximumResultsReached"}
+                        self._send(426, body)
+                        return
+                    lo = (page - 1) * size
+                    hi = min(lo + size, api.total)
+                    articles = [
+                        {"title": f"a{i}", "url": f"https://x.com/{i}"}
+                        for i in range(lo, hi)
+                    ]
+                    body = {"status": "ok", "totalResults": api.total, "articles": articles}
+                    self._send(200, body)
+                finally:
+                    with lock:
+                        api.in_flight -= 1
+
+            def _send(self, code, body):
+                payload = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v2/everything"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_fetches_every_page_once():
+    status = {}
+    with StandInNewsAPI(total=45) as api:
+        titles = [
+            a["title"]
+            for a in iter_news_articles(
+                "tesla", api_key="k", base_url=api.url, page_size=10, concurrency=3,
+                status=status,
+            )
+        ]
+    assert sorted(titles) == sorted(f"a{i}" for i in range(45))
+    assert status == {"total_results": 45, "fetched": 45, "skipped_pages": [], "complete": True}
+    assert sorted(api.requests) == [1, 2, 3, 4, 5]
+    assert api.max_in_flight <= 3
+
+
+def test_respects_max_results():
+    with StandInNewsAPI(total=1000) as api:
+        out = get_all_news_articles(
+            "tesla", api_key="k", base_url=api.url, page_size=20, max_results=50
+        )
+    assert out["totalResults"] == 50
+    assert len(out["articles"]) == 50
+    assert out["complete"] is False
+    assert sorted(api.requests) == [1, 2, 3]
+
+
+def test_streams_before_last_page():
+    with StandInNewsAPI(total=30, delay=0.5) as api:
+        gen = iter_news_articles(
+            "tesla", api_key="k", base_url=api.url, page_size=10, concurrency=2
+        )
+        t0 = time.perf_counter()
+        first = next(gen)
+        first_latency = time.perf_counter() - t0
+        rest = list(gen)
+    assert first["title"] == "a0"
+    assert first_latency < 0.4  # page 1 is yielded before slow pages 2-3 land
+    assert len(rest) == 29
+
+
+def test_failed_later_page_is_skipped_and_reported():
+    status = {}
+    with StandInNewsAPI(total=30, fail_pages={3}) as api:
+        articles = list(
+            iter_news_articles(
+                "tesla", api_key="k", base_url=api.url, page_size=10, status=status
+            )
+        )
+    assert len(articles) == 20
+    assert status["skipped_pages"] == [3] and status["complete"] is False
+
+
+def test_default_max_results_is_the_plan_cap():
+    with StandInNewsAPI(total=250) as api:
+        out = get_all_news_articles("tesla", api_key="k", base_url=api.url)
+    assert len(out["articles"]) == 100 and out["complete"] is False
+    assert api.requests == [1]
+
+
+def test_failed_first_page_raises():
+    with StandInNewsAPI(total=30, fail_pages={1}) as api:
+        with pytest.raises(RuntimeError):
+            list(iter_news_articles("tesla", api_key="k", base_url=api.url))
@@ -0,0 +1,27 @@
+import os
+import sys
+import subprocess
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+HEAVY = ["torch", "transformers", "onnxruntime", "openai", "fuzzywuzzy", "requests"]
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "src.pipeline.run_pipeline",
+        "src.pipeline.price_pipeline",
+        "src.service.sentiment_finBERT",
+        "src.service.sentiment_server",
+    ],
+)
+def test_entry_points_do_not_import_heavy_dependencies(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
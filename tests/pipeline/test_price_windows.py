@@ -0,0 +1,50 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.pipeline import price_pipeline as pp
+
+PAYLOAD = {
+    "Meta Data": {"2. Symbol": "AAPL"},
+    "Time Series (Daily)": {
+        "2025-09-26": {"4. close": "110", "5. volume": "1"},
+        "2025-09-25": {"4. close": "90", "5. volume": "1"},
+        "2025-09-24": {"4. close": "120", "5. volume": "1"},
+        "2025-09-23": {"4. close": "100", "5. volume": "1"},
+    },
+}
+
+
+def test_price_windows_fetch_once(monkeypatch):
+    calls = []
+
+    def fake_fetch(symbol, url, key, delay=0.0):
+        calls.append(symbol)
+        return PAYLOAD
+
+    import src.models.alpha_vintage_api as av
+
+    monkeypatch.setattr(av, "get_av_daily_data", fake_fetch)
+    monkeypatch.setattr(pp, "resolve_ticker", lambda t: {"ticker": "aapl"})
+    monkeypatch.setattr(pp.time, "sleep", lambda s: None)
+    monkeypatch.setattr(pp, "_series_cache", {})
+
+    out = pp.price_windows(
+        "Apple",
+        [
+            ("2025-09-23", "2025-09-26"),
+            ("2025-09-25", "2025-09-26"),
+            ("2025-01-01", "2025-01-02"),
+        ],
+        api_key="k",
+        api_url="u",
+    )
+    assert out[0]["percentage_change"] == 10.0
+    assert out[0]["max_drawdown"] == -25.0
+    assert out[1]["start_price"] == 90.0 and out[1]["end_price"] == 110.0
+    assert out[2]["first_day"] is None
+
+    res = pp.price_pipeline("Apple", "2025-09-24", "2025-09-25", api_key="k", api_url="u")
+    assert res["first_price"] == 120.0 and res["last_price"] == 90.0
+    assert res["percentage_change"] == -25.0
+    assert calls == ["AAPL"]  # one fetch served every window and the pipeline
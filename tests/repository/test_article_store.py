@@ -0,0 +1,132 @@
+import os
+import sys
+import datetime as dt
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.repository.article_store import ArticleStore, normalize_query, published_day
+
+TODAY = dt.date(2025, 9, 30)
+
+
+def make_articles(start: dt.date, end: dt.date, per_day: int = 2):
+    out = []
+    day = start
+    while day <= end:
+        for i in range(per_day):
+            out.append(
+                {
+                    "title": f"{day} #{i}",
+                    "url": f"https://news.example/{day}/{i}",
+                    "publishedAt": f"{day.isoformat()}T1{i}:00:00Z",
+                }
+            )
+        day += dt.timedelta(days=1)
+    return out
+
+
+class FakeNews:
+    def __init__(self, complete=True):
+        self.calls = []
+        self.complete = complete
+
+    def __call__(self, query, lo, hi, status):
+        self.calls.append((lo, hi))
+        yield from make_articles(dt.date.fromisoformat(lo), dt.date.fromisoformat(hi))
+        status["complete"] = self.complete
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArticleStore(str(tmp_path / "articles.sqlite"))
+
+
+def test_overlapping_window_fetches_only_missing_days(store):
+    news = FakeNews()
+    stats = {}
+    first = list(store.iter_range("Tesla", "2025-09-20", "2025-09-26", news, today=TODAY, stats=stats))
+    assert news.calls == [("2025-09-20", "2025-09-26")]
+    assert len(first) == 14
+    assert stats == {"cached_days": 0, "fetched_days": 7, "fetches": 1, "incomplete_fetches": 0}
+
+    stats = {}
+    second = list(store.iter_range(" tesla ", "2025-09-17", "2025-09-26", news, today=TODAY, stats=stats))
+    assert news.calls[1:] == [("2025-09-17", "2025-09-19")]
+    assert len(second) == 20
+    assert len({a["url"] for a in second}) == 20
+    assert stats == {"cached_days": 7, "fetched_days": 3, "fetches": 1, "incomplete_fetches": 0}
+
+
+def test_fully_covered_range_never_fetches(store):
+    list(store.iter_range("Tesla", "2025-09-20", "2025-09-26", FakeNews(), today=TODAY))
+
+    def offline(*args):
+        raise RuntimeError("network is down")
+
+    out = list(store.iter_range("TESLA", "2025-09-21", "2025-09-23", offline, today=TODAY))
+    assert [a["title"][:10] for a in out] == ["2025-09-21"] * 2 + ["2025-09-22"] * 2 + ["2025-09-23"] * 2
+
+
+def test_today_and_grace_days_stay_open_and_are_refetched(store):
+    news = FakeNews()
+    list(store.iter_range("Tesla", "2025-09-26", "2025-09-30", news, today=TODAY))
+    # late indexing: the two days before today are not sealed yet
+    assert store.missing_days("Tesla", "2025-09-26", "2025-09-30") == [
+        "2025-09-28", "2025-09-29", "2025-09-30"
+    ]
+    out = list(store.iter_range("Tesla", "2025-09-26", "2025-09-30", news, today=TODAY))
+    assert news.calls == [("2025-09-26", "2025-09-30"), ("2025-09-28", "2025-09-30")]
+    assert len(out) == 10  # stored copies of open days are not yielded twice
+
+    late = ArticleStore(store.path, grace_days=0)
+    list(late.iter_range("Tesla", "2025-09-28", "2025-09-30", news, today=TODAY))
+    assert late.missing_days("Tesla", "2025-09-26", "2025-09-30") == ["2025-09-30"]
+
+
+def test_truncated_fetch_leaves_days_missing(store):
+    truncated = FakeNews(complete=False)
+    stats = {}
+    out = list(store.iter_range("Tesla", "2025-09-10", "2025-09-14", truncated, today=TODAY, stats=stats))
+    assert len(out) == 10  # what was fetched is still served
+    assert stats["incomplete_fetches"] == 1
+    assert store.missing_days("Tesla", "2025-09-10", "2025-09-14") == [
+        "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-13", "2025-09-14"
+    ]
+
+    # several gaps fetched concurrently: only the exhaustive one is sealed
+    news = FakeNews()
+    list(store.iter_range("Tesla", "2025-09-12", "2025-09-12", news, today=TODAY))
+    list(store.iter_range("Tesla", "2025-09-10", "2025-09-14", truncated, today=TODAY))
+    assert store.missing_days("Tesla", "2025-09-10", "2025-09-14") == [
+        "2025-09-10", "2025-09-11", "2025-09-13", "2025-09-14"
+    ]
+
+    # a later exhaustive fetch seals them, and the range is served offline
+    list(store.iter_range("Tesla", "2025-09-10", "2025-09-14", news, today=TODAY))
+    assert store.missing_days("Tesla", "2025-09-10", "2025-09-14") == []
+
+
+def test_gap_in_the_middle_is_one_fetch(store):
+    news = FakeNews()
+    list(store.iter_range("Tesla", "2025-09-01", "2025-09-03", news, today=TODAY))
+    list(store.iter_range("Tesla", "2025-09-07", "2025-09-09", news, today=TODAY))
+    list(store.iter_range("Tesla", "2025-09-01", "2025-09-09", news, today=TODAY))
+    assert news.calls[-1] == ("2025-09-04", "2025-09-06")
+    assert store.missing_days("Tesla", "2025-09-01", "2025-09-09") == []
+
+
+def test_helpers():
+    assert normalize_query("  Tesla   Inc ") == "tesla inc"
+    assert published_day({"publishedAt": "2025-09-20T23:30:00-02:00"}) == "2025-09-21"
+    assert published_day({"publishedAt": None}) is None
+
+
+def test_separate_gaps_are_all_fetched(store):
+    news = FakeNews()
+    list(store.iter_range("Tesla", "2025-09-24", "2025-09-30", news, today=TODAY))
+    stats = {}
+    out = list(store.iter_range("Tesla", "2025-09-20", "2025-09-30", news, today=TODAY, stats=stats))
+    assert sorted(news.calls[1:]) == [("2025-09-20", "2025-09-23"), ("2025-09-28", "2025-09-30")]
+    assert len(out) == 22 and len({a["url"] for a in out}) == 22
+    assert stats == {"cached_days": 4, "fetched_days": 7, "fetches": 2, "incomplete_fetches": 0}
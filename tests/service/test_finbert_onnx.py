@@ -0,0 +1,80 @@
+import os
+import sys
+import pytest
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.finbert_onnx import softmax, load_session, predict_probs
+
+# Headlines with an unambiguous FinBERT label; both backends must agree on them.
+FIXTURE_HEADLINES = [
+    ("Shares plunge after company slashes full-year outlook", "negative"),
+    ("Regulator widens probe into fatal crashes, stock falls", "negative"),
+    ("Profit beats estimates as revenue jumps 25%", "positive"),
+    ("Company raises dividend and announces record buyback", "positive"),
+    ("Annual shareholder meeting scheduled for June 12", "neutral"),
+    ("The company will report quarterly results on Thursday", "neutral"),
+]
+
+
+def _tiny_model(path):
+    """ONNX graph with FinBERT's I/O names: logits = [n_tokens, 0, -n_tokens] / 4."""
+    onnx = pytest.importorskip("onnx")
+    from onnx import helper, TensorProto
+
+    nodes = [
+        helper.make_node("Cast", ["attention_mask"], ["mask_f"], to=TensorProto.FLOAT),
+        helper.make_node("ReduceSum", ["mask_f", "axes"], ["n"], keepdims=1),
+        helper.make_node("MatMul", ["n", "w"], ["logits"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        "tiny",
+        [
+            helper.make_tensor_value_info("input_ids", TensorProto.INT64, ["b", "s"]),
+            helper.make_tensor_value_info("attention_mask", TensorProto.INT64, ["b", "s"]),
+        ],
+        [helper.make_tensor_value_info("logits", TensorProto.FLOAT, ["b", 3])],
+        initializer=[
+            helper.make_tensor("axes", TensorProto.INT64, [1], [1]),
+            helper.make_tensor("w", TensorProto.FLOAT, [1, 3], [0.25, 0.0, -0.25]),
+        ],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 14)])
+    model.ir_version = 8  # readable by older onnxruntime releases
+    onnx.save(model, path)
+    return path
+
+
+def test_softmax_rows_sum_to_one():
+    probs = softmax(np.array([[1000.0, 0.0, -1000.0], [0.0, 0.0, 0.0]]))
+    assert probs.shape == (2, 3)
+    assert np.allclose(probs.sum(axis=-1), 1.0)
+    assert probs[0, 0] == pytest.approx(1.0)
+    assert np.allclose(probs[1], 1 / 3)
+
+
+def test_predict_probs_feeds_only_session_inputs(tmp_path):
+    pytest.importorskip("onnxruntime")
+    session = load_session(_tiny_model(str(tmp_path / "tiny.onnx")), intra_op_threads=1)
+    batch = {
+        "input_ids": np.array([[101, 7, 102, 0], [101, 7, 8, 102]], dtype=np.int32),
+        "attention_mask": np.array([[1, 1, 1, 0], [1, 1, 1, 1]], dtype=np.int32),
+        "token_type_ids": np.zeros((2, 4), dtype=np.int32),  # not a graph input
+    }
+    probs = predict_probs(session, batch)
+    assert probs.shape == (2, 3)
+    assert np.allclose(probs.sum(axis=-1), 1.0)
+    assert (probs.argmax(axis=-1) == 0).all()
+    assert probs[1, 0] > probs[0, 0]
+
+
+@pytest.mark.skip(reason="Integration test - downloads ProsusAI/finbert and exports it to ONNX")
+def test_onnx_backend_matches_torch_labels_on_fixture_set():
+    from src.service.sentiment_finBERT import score_texts
+
+    texts = [t for t, _ in FIXTURE_HEADLINES]
+    torch_res = score_texts(texts, backend="torch")
+    onnx_res = score_texts(texts, backend="onnx")
+    assert [r["label"] for r in onnx_res] == [r["label"] for r in torch_res]
+    assert [r["label"] for r in torch_res] == [label for _, label in FIXTURE_HEADLINES]
@@ -0,0 +1,101 @@
+import os
+import sys
+import json
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.finbert_snapshot import (
+    snapshot_ready,
+    save_snapshot,
+    load_snapshot_model,
+    load_snapshot_tokenizer,
+)
+
+
+def _write_manifest(path, model_id="ProsusAI/finbert", revision="main", weights=True):
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "snapshot.json"), "w") as f:
+        json.dump({"model_id": model_id, "revision": revision}, f)
+    if weights:
+        open(os.path.join(path, "model.safetensors"), "wb").close()
+
+
+def test_snapshot_ready_checks_manifest_and_weights(tmp_path):
+    path = str(tmp_path / "snap")
+    assert not snapshot_ready(path, "ProsusAI/finbert", "main")
+
+    _write_manifest(path)
+    assert snapshot_ready(path, "ProsusAI/finbert", "main")
+    assert not snapshot_ready(path, "ProsusAI/finbert", "v2")
+    assert not snapshot_ready(path, "other/model", "main")
+
+    os.remove(os.path.join(path, "model.safetensors"))
+    assert not snapshot_ready(path, "ProsusAI/finbert", "main")
+
+
+class _Saves:
+    """Stand-in for a model/tokenizer: save_pretrained writes one file."""
+
+    def __init__(self, name, fail=False):
+        self.name, self.fail = name, fail
+
+    def save_pretrained(self, path, **kwargs):
+        os.makedirs(path, exist_ok=True)
+        if self.fail:
+            raise OSError("disk full")
+        open(os.path.join(path, self.name), "wb").close()
+
+
+def test_save_snapshot_replaces_an_existing_snapshot(tmp_path):
+    path = str(tmp_path / "snap")
+    _write_manifest(path, revision="v1")
+    save_snapshot(_Saves("model.safetensors"), _Saves("vocab.txt"), path, "ProsusAI/finbert", "v2")
+    assert snapshot_ready(path, "ProsusAI/finbert", "v2")
+    assert os.path.exists(os.path.join(path, "vocab.txt"))
+    assert os.listdir(tmp_path) == ["snap"]  # no temp or backup dirs left
+
+
+def test_failed_save_keeps_the_old_snapshot(tmp_path, monkeypatch):
+    path = str(tmp_path / "snap")
+    _write_manifest(path, revision="v1")
+    with pytest.raises(OSError):
+        save_snapshot(_Saves("model.safetensors"), _Saves("vocab.txt", fail=True), path, "m", "v2")
+    assert snapshot_ready(path, "ProsusAI/finbert", "v1")
+
+    # the final rename fails after the old snapshot was moved aside: put it back
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if src.endswith(".tmp"):
+            raise OSError("rename failed")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace)
+    save_snapshot(_Saves("model.safetensors"), _Saves("vocab.txt"), path, "ProsusAI/finbert", "v2")
+    assert snapshot_ready(path, "ProsusAI/finbert", "v1")
+    assert os.listdir(tmp_path) == ["snap"]
+
+
+def test_save_and_load_snapshot_roundtrip(tmp_path):
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    from transformers import BertConfig, BertForSequenceClassification
+
+    vocab = tmp_path / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "shares", "rise"]))
+    tok = transformers.BertTokenizerFast(vocab_file=str(vocab))
+    config = BertConfig(
+        vocab_size=7, hidden_size=8, num_hidden_layers=1, num_attention_heads=2,
+        intermediate_size=16, num_labels=3,
+    )
+    model = BertForSequenceClassification(config).eval()
+
+    path = str(tmp_path / "snap")
+    save_snapshot(model, tok, path, "tiny/bert", "main")
+    assert snapshot_ready(path, "tiny/bert", "main")
+
+    loaded = load_snapshot_model(path).eval()
+    tok2 = load_snapshot_tokenizer(path)
+    inputs = tok2(["shares rise"], return_tensors="pt")
+    with torch.no_grad():
+        assert torch.allclose(model(**inputs).logits, loaded(**inputs).logits)
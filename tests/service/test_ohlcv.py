@@ -0,0 +1,107 @@
+import os
+import sys
+import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.ohlcv import parse_av_daily, rows_to_columns
+from src.service.pre_processing import format_av_daily_data
+
+PAYLOAD = {
+    "Meta Data": {"2. Symbol": "AAPL"},
+    "Time Series (Daily)": {
+        "2025-09-26": {
+            "1. open": "150.0",
+            "2. high": "155.0",
+            "3. low": "149.0",
+            "4. close": "154.0",
+            "5. volume": "1000000",
+        },
+        "2025-09-25": {
+            "1. open": "151.0",
+            "2. high": "156.0",
+            "3. low": "150.0",
+            "4. close": "155.5",
+            "5. volume": "2000000",
+        },
+    },
+}
+
+
+def test_parse_av_daily_columns():
+    cols = parse_av_daily(PAYLOAD)
+    assert len(cols) == 2
+    assert cols.dates.dtype == np.dtype("datetime64[D]")
+    assert cols.dates.tolist() == [datetime.date(2025, 9, 26), datetime.date(2025, 9, 25)]
+    assert cols.close.tolist() == [154.0, 155.5]
+    assert cols.adjusted_close.tolist() == [0.0, 0.0]
+    assert cols.volume.dtype == np.int64 and cols.volume.tolist() == [1000000, 2000000]
+    assert len(parse_av_daily({})) == 0
+
+
+def test_dict_view_matches_legacy_shape():
+    rows = format_av_daily_data(PAYLOAD)
+    assert rows[0] == {
+        "date": datetime.date(2025, 9, 26),
+        "open": 150.0,
+        "high": 155.0,
+        "low": 149.0,
+        "close": 154.0,
+        "adjusted_close": 0.0,
+        "volume": 1000000,
+    }
+    assert type(rows[0]["volume"]) is int and type(rows[0]["open"]) is float
+    assert rows_to_columns(rows).rows() == rows
+
+
+def test_adjusted_payload_volume_key():
+    payload = {
+        "Time Series (Daily)": {
+            "2025-09-26": {"4. close": "10", "5. adjusted close": "9.5", "6. volume": "42"}
+        }
+    }
+    cols = parse_av_daily(payload)
+    assert cols.adjusted_close[0] == 9.5 and cols.volume[0] == 42
+
+
+def _series():
+    from src.service.ohlcv import PriceSeries
+
+    days = ["2025-09-22", "2025-09-23", "2025-09-25", "2025-09-26"]
+    payload = {
+        "Meta Data": {"2. Symbol": "AAPL"},
+        "Time Series (Daily)": {
+            d: {"4. close": str(100 + i), "5. volume": "1"}
+            for i, d in reversed(list(enumerate(days)))  # newest first, like AV
+        },
+    }
+    return PriceSeries.from_av(payload)
+
+
+def test_price_series_sorted_and_read_only():
+    s = _series()
+    assert s.symbol == "AAPL"
+    assert [str(d) for d in s.dates] == ["2025-09-22", "2025-09-23", "2025-09-25", "2025-09-26"]
+    assert not s.close.flags.writeable
+
+
+def test_price_series_range_and_nearest():
+    s = _series()
+    window = s.range(datetime.date(2025, 9, 23), "2025-09-25")
+    assert window.close.tolist() == [101.0, 102.0]
+    assert np.shares_memory(window.close, s.close)  # a view, not a copy
+    assert len(s.range("2025-09-24", "2025-09-24")) == 0
+
+    assert s.nearest_before("2025-09-24") == 1
+    assert s.nearest_after("2025-09-24") == 2
+    assert s.nearest_before("2025-09-22") is None
+    assert s.nearest_before("2025-09-22", inclusive=True) == 0
+    assert s.nearest_after("2025-09-26") is None
+
+    gap = s.range_or_nearest("2025-09-24", "2025-09-24")
+    assert [r["date"] for r in gap.rows()] == [
+        datetime.date(2025, 9, 23),
+        datetime.date(2025, 9, 25),
+    ]
+    assert s.row(-1)["close"] == 103.0
@@ -0,0 +1,174 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+pytest.importorskip("openai")
+import src.service.openai as oa
+from benchmarks.openai_standin import StandInOpenAI
+from src.service.tiered_cache import TieredCache
+
+
+def make_articles(n):
+    kinds = ["Tesla market rally", "Celebrity gossip", "Tesla stock market slump"]
+    return [
+        {
+            "title": f"{kinds[i % 3]} #{i}",
+            "url": f"https://news.example/{i}",
+            "source": {"id": None, "name": "Reuters"},
+            "description": f"description {i}",
+            "published_at": "2025-09-20T10:00:00Z",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def relevance_cache(monkeypatch):
+    cache = TieredCache(None, table="relevance")
+    monkeypatch.setattr(oa, "get_relevance_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    with StandInOpenAI(latency=0.05, per_output_token=0.0) as api:
+        monkeypatch.setattr(oa, "OPENAI_BASE_URL", api.url)
+        yield api
+
+
+def test_chunks_respect_budget_and_cap():
+    articles = make_articles(40)
+    chunks = oa.chunk_articles(articles, budget_tokens=100, max_articles=5)
+    assert [i for c in chunks for i in c] == list(range(40))
+    assert all(1 <= len(c) <= 5 for c in chunks)
+    for c in chunks:
+        cost = sum(oa.estimate_tokens(oa.format_article(articles[i], i + 1)) for i in c)
+        assert cost <= 100 or len(c) == 1
+
+
+def test_filters_in_input_order_with_original_dicts(standin):
+    articles = make_articles(50)
+    stats = {}
+    kept = oa.filter_relevant_articles(
+        articles, api_key="k", company="Tesla", stats=stats, concurrency=3, chunk_size=7
+    )
+    expected = [
+        {**a, "relevance_score": 0.9} for a in articles if "market" in a["title"]
+    ]
+    assert kept == expected  # original fields kept + score, input order
+    assert stats["chunks"] == standin.requests == 8
+    assert standin.max_in_flight <= 3
+    assert stats["failed_chunks"] == 0
+
+
+def test_failed_chunk_degrades_alone(standin, monkeypatch):
+    articles = make_articles(15)
+    articles[7]["title"] = "poison pill"
+    standin.garbage_if = "poison pill"
+    stats = {}
+    kept = oa.filter_relevant_articles(
+        articles, api_key="k", stats=stats, chunk_size=5
+    )
+    # chunk 5..9 failed -> kept whole; the other chunks were filtered normally
+    scored = lambda part: [
+        {**a, "relevance_score": 0.9} for a in part if "market" in a["title"]
+    ]
+    expected = scored(articles[:5]) + articles[5:10] + scored(articles[10:])
+    assert kept == expected
+    assert stats["failed_chunks"] == 1
+
+    monkeypatch.setattr(oa, "RELEVANCE_ON_ERROR", "drop")
+    kept = oa.filter_relevant_articles(articles, api_key="k", chunk_size=5)
+    assert not any(a in articles[5:10] for a in kept)
+
+
+def test_no_key_and_empty_input():
+    with pytest.raises(RuntimeError):
+        oa.filter_relevant_articles(make_articles(2), api_key=None)
+    assert oa.filter_relevant_articles([], api_key="k") == []
+
+
+def test_parse_selection_ids_and_echo():
+    articles = make_articles(3)
+    text = '{"relevant": [{"id": 3, "score": 0.8}, 1, {"id": 9}, {"id": "x"}]}'
+    assert oa.parse_selection(text, articles) == {2: 0.8, 0: None}
+    with pytest.raises(ValueError):
+        oa.parse_selection("[1, 2]", articles)
+
+    text = '```json\n[{"url": "https://news.example/2"}, {"title": "Celebrity gossip #1"}]\n```'
+    assert oa.parse_selection(text, articles, output="echo") == {2: None, 1: None}
+    with pytest.raises(ValueError):
+        oa.parse_selection('{"a": 1}', articles, output="echo")
+
+
+def test_ids_output_sends_numbered_articles_and_fewer_tokens(standin):
+    articles = make_articles(20)
+    request = oa.build_request(articles, "Tesla", "m")
+    assert request["response_format"] == {"type": "json_object"}
+    assert "https://news.example/" not in request["messages"][-1]["content"]
+
+    ids_stats, echo_stats = {}, {}
+    kept_ids = oa.filter_relevant_articles(articles, api_key="k", stats=ids_stats)
+    kept_echo = oa.filter_relevant_articles(
+        articles, api_key="k", stats=echo_stats, output="echo"
+    )
+    assert [a["url"] for a in kept_ids] == [a["url"] for a in kept_echo]
+    assert ids_stats["completion_tokens"] < echo_stats["completion_tokens"]
+    assert ids_stats["requests"] == ids_stats["chunks"] and ids_stats["call_seconds"] > 0
+
+
+def test_decisions_are_cached_per_company_prompt_and_model(standin, relevance_cache):
+    articles = make_articles(12)
+    stats = {}
+    first = oa.filter_relevant_articles(articles, api_key="k", company="Tesla", stats=stats)
+    assert stats["cache_misses"] == 12 and standin.requests == 1
+
+    stats = {}
+    again = oa.filter_relevant_articles(articles, api_key="k", company="tesla", stats=stats)
+    assert again == first
+    assert stats["cache_hits"] == 12 and stats["chunks"] == 0
+    assert standin.requests == 1  # fully cached: no round trip
+
+    # only the new articles are sent
+    more = make_articles(15)
+    stats = {}
+    kept = oa.filter_relevant_articles(more, api_key="k", company="Tesla", stats=stats)
+    assert stats["cache_hits"] == 12 and stats["cache_misses"] == 3
+    assert [a["url"] for a in kept] == [a["url"] for a in more if "market" in a["title"]]
+    assert standin.requests == 2
+
+    # another company, model or prompt version is a different key
+    oa.filter_relevant_articles(articles, api_key="k", company="Ford")
+    oa.filter_relevant_articles(articles, api_key="k", company="Tesla", model="other")
+    oa.filter_relevant_articles(articles, api_key="k", company="Tesla", output="echo")
+    assert standin.requests == 5
+
+
+def test_failed_chunks_are_not_cached(standin):
+    articles = make_articles(10)
+    standin.garbage_if = "market"
+    stats = {}
+    oa.filter_relevant_articles(articles, api_key="k", stats=stats, chunk_size=5)
+    assert stats["failed_chunks"] == 2
+
+    standin.garbage_if = None
+    stats = {}
+    oa.filter_relevant_articles(articles, api_key="k", stats=stats, chunk_size=5)
+    assert stats["cache_misses"] == 10 and stats["failed_chunks"] == 0
+
+
+def test_calls_are_paced_by_the_shared_rate_limiter(standin, monkeypatch):
+    from src.service.openai_scheduler import RateLimiter
+
+    limiter = RateLimiter(rpm=2, window=0.4)
+    monkeypatch.setattr(oa, "get_rate_limiter", lambda: limiter)
+    stats = {}
+    oa.filter_relevant_articles(
+        make_articles(20), api_key="k", stats=stats, chunk_size=5, concurrency=4
+    )
+    assert stats["requests"] == 4 and stats["failed_chunks"] == 0
+    assert limiter.metrics()["waited"] == 2
+    assert stats["rate_limit_seconds"] >= 0.6  # two calls waited ~0.4s each
+    assert stats["queue_seconds"] >= stats["rate_limit_seconds"]
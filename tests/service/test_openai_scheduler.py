@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service import openai_scheduler as sch
+
+
+def run_all(limiter, token_list):
+    async def go():
+        t0 = time.monotonic()
+        sent = []
+        for tokens in token_list:
+            await limiter.acquire(tokens)
+            sent.append(time.monotonic() - t0)
+        return sent
+
+    return asyncio.run(go())
+
+
+def test_rpm_paces_requests_into_the_window():
+    limiter = sch.RateLimiter(rpm=2, window=0.3)
+    sent = run_all(limiter, [1, 1, 1, 1])
+    assert sent[1] < 0.05
+    assert 0.28 <= sent[2] < 0.45 and sent[3] - sent[2] < 0.05
+    m = limiter.metrics()
+    assert m["requests"] == 4 and m["waited"] == 1 and m["wait_seconds"] >= 0.28
+
+
+def test_tpm_waits_for_enough_tokens_to_expire():
+    limiter = sch.RateLimiter(tpm=100, window=0.3)
+    sent = run_all(limiter, [60, 30, 50])
+    assert sent[1] < 0.05 and sent[2] >= 0.28
+    # a request above the whole limit still goes out once the window is empty
+    assert len(run_all(sch.RateLimiter(tpm=10, window=0.1), [500, 500])) == 2
+
+
+def test_settle_replaces_the_estimate():
+    limiter = sch.RateLimiter(tpm=100, window=0.3)
+
+    async def go():
+        entry = await limiter.acquire(90)
+        limiter.settle(entry, 20)
+        t0 = time.monotonic()
+        await limiter.acquire(70)
+        return time.monotonic() - t0
+
+    assert asyncio.run(go()) < 0.05
+    assert limiter.metrics()["window_tokens"] == 90
+
+
+def test_settle_keeps_the_window_in_send_order():
+    limiter = sch.RateLimiter(tpm=1000, window=5)
+
+    async def go():
+        first = await limiter.acquire(100)
+        second = await limiter.acquire(100)
+        sent_at = [first[0], second[0]]
+        # the earlier request finishing last must not move it in the window
+        limiter.settle(second, 50)
+        limiter.settle(first)
+        return sent_at
+
+    sent_at = asyncio.run(go())
+    assert [e[0] for e in limiter._sent] == sent_at == sorted(sent_at)
+    assert [e[1] for e in limiter._sent] == [100, 50]
+
+
+def test_metrics_from_another_thread_while_requests_go_out():
+    limiter = sch.RateLimiter(rpm=10**9, window=60)
+    done = threading.Event()
+
+    def requests():
+        async def go():
+            for i in range(20_000):
+                entry = await limiter.acquire(10)
+                limiter.settle(entry, 5)
+                if i % 100 == 0:
+                    await asyncio.sleep(0)
+
+        try:
+            asyncio.run(go())
+        finally:
+            done.set()
+
+    thread = threading.Thread(target=requests)
+    thread.start()
+    seen = 0
+    while not done.is_set():  # raised "deque mutated during iteration" unguarded
+        seen = max(seen, limiter.metrics()["window_requests"])
+    thread.join()
+    assert limiter.metrics()["window_requests"] == 20_000 and seen > 0
+
+
+def test_token_counts(monkeypatch):
+    request = {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": "word " * 40}],
+        "max_tokens": 100,
+    }
+    assert sch.request_tokens(request) > 100 + 30
+    monkeypatch.setattr(sch, "_encoding", lambda model: None)
+    assert sch.count_tokens("abcd" * 10) == 10
+    assert sch.request_tokens(request) == 3 + 50 + 3 + 100
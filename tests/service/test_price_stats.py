@@ -0,0 +1,91 @@
+import os
+import sys
+import math
+import random
+import datetime
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.ohlcv import PriceSeries
+from src.service.price_stats import calendar_windows, window_stats
+
+
+def _series(n=120, seed=0):
+    rnd = random.Random(seed)
+    day, price, rows = datetime.date(2025, 1, 1), 100.0, []
+    while len(rows) < n:
+        day += datetime.timedelta(days=1)
+        if day.weekday() >= 5:
+            continue
+        price *= 1 + rnd.gauss(0, 0.02)
+        rows.append({"date": day, "close": price, "volume": 1})
+    return PriceSeries.from_rows(rows[::-1])
+
+
+def _brute(series, start, end):
+    rows = [r for r in series.rows() if start <= r["date"] <= end]
+    if not rows:
+        return None
+    closes = [r["close"] for r in rows]
+    peak, mdd = closes[0], 0.0
+    for c in closes:
+        peak = max(peak, c)
+        mdd = min(mdd, c / peak - 1)
+    rets = [math.log(b / a) for a, b in zip(closes, closes[1:])]
+    vol = None
+    if len(rets) >= 2:
+        vol = np.std(rets, ddof=1) * math.sqrt(252) * 100
+    return {
+        "first_day": rows[0]["date"],
+        "last_day": rows[-1]["date"],
+        "percentage_change": round((closes[-1] / closes[0] - 1) * 100, 2),
+        "max_drawdown": round(mdd * 100, 2),
+        "volatility": None if vol is None else round(vol, 2),
+        "days": len(rows),
+    }
+
+
+def test_window_stats_match_brute_force():
+    s = _series()
+    rnd = random.Random(1)
+    windows = []
+    for _ in range(50):
+        a = datetime.date(2025, 1, 1) + datetime.timedelta(days=rnd.randint(0, 170))
+        windows.append((a, a + datetime.timedelta(days=rnd.randint(0, 40))))
+    windows.append((datetime.date(2024, 1, 1), datetime.date(2024, 2, 1)))  # no data
+    windows.append(("2025-01-04", "2025-01-05"))  # weekend only
+
+    for w, got in zip(windows, window_stats(s, windows)):
+        expected = _brute(s, *(datetime.date.fromisoformat(str(d)) for d in w))
+        if expected is None:
+            assert got["first_day"] is None and got["days"] == 0
+            continue
+        for key, value in expected.items():
+            assert got[key] == pytest.approx(value, abs=0.011), key
+
+
+def test_zero_close_is_left_out():
+    rows = _series(40).rows()
+    rows[10] = {**rows[10], "close": 0.0}  # a field parse_av_daily defaulted
+    s = PriceSeries.from_rows(rows)
+    clean = PriceSeries.from_rows([r for r in rows if r["close"] > 0])
+    windows = [
+        (rows[0]["date"], rows[-1]["date"]),
+        (rows[5]["date"], rows[15]["date"]),
+        (rows[10]["date"], rows[10]["date"]),  # only the bad day
+    ]
+    got, expected = window_stats(s, windows), window_stats(clean, windows)
+    assert got == expected
+    for key in ("percentage_change", "max_drawdown", "volatility"):
+        assert all(math.isfinite(w[key]) for w in got[:2]), key
+    assert got[2]["days"] == 0
+
+
+def test_calendar_windows_weekly():
+    weeks = calendar_windows("2025-03-03", "2025-03-20")
+    assert weeks[0] == (datetime.date(2025, 3, 3), datetime.date(2025, 3, 9))
+    assert weeks[-1] == (datetime.date(2025, 3, 17), datetime.date(2025, 3, 20))
+    assert len(weeks) == 3
+    assert window_stats(_series(), []) == []
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service import relevance_prefilter as rp
+
+VOCAB = ["stock", "shares", "earnings", "investors", "market", "football", "celebrity"]
+
+
+def bag_of_words(texts):
+    """Tiny deterministic embedder: word counts over VOCAB."""
+    out = np.zeros((len(texts), len(VOCAB)), dtype="float32")
+    for row, text in enumerate(texts):
+        words = text.lower().replace(",", " ").split()
+        for j, w in enumerate(VOCAB):
+            out[row, j] = words.count(w)
+    return out + 1e-3
+
+
+ARTICLES = [
+    {"title": "Tesla stock jumps as investors cheer earnings", "url": "u0"},
+    {"title": "Celebrity football star buys a car", "url": "u1"},
+    {"title": "Tesla showroom draws market and football crowds", "url": "u2"},
+    {"title": "Football celebrity gossip", "url": "u3"},
+    {"title": "Tesla shares and market reaction", "url": "u4"},
+]
+
+
+def test_similarities_rank_finance_above_gossip():
+    sims = rp.similarities(ARTICLES, "Tesla", embed=bag_of_words)
+    assert sims.shape == (5,)
+    assert sims[0] > sims[2] > sims[1]
+    assert sims[4] > sims[3]
+
+
+def test_only_uncertain_band_reaches_llm():
+    seen = []
+
+    def llm(arts):
+        seen.extend(a["url"] for a in arts)
+        return [{**a, "relevance_score": 0.8} for a in arts]
+
+    stats = {}
+    kept = rp.prefilter_relevant_articles(
+        ARTICLES, "Tesla", llm, accept=0.3, reject=0.1, embed=bag_of_words, stats=stats
+    )
+    assert seen == ["u2"]
+    assert [a["url"] for a in kept] == ["u0", "u2", "u4"]  # input order
+    assert "relevance_similarity" in kept[0] and kept[1]["relevance_score"] == 0.8
+    assert stats["accepted"] == 2 and stats["rejected"] == 2 and stats["forwarded"] == 1
+    assert stats["call_reduction"] == pytest.approx(0.8)
+
+
+def test_off_without_thresholds_and_never_loads_model(monkeypatch):
+    monkeypatch.setattr(rp, "RELEVANCE_PREFILTER_ACCEPT", None)
+    monkeypatch.setattr(rp, "RELEVANCE_PREFILTER_REJECT", None)
+    monkeypatch.setattr(rp, "_load_embedder", lambda: pytest.fail("model loaded"))
+    stats = {}
+    kept = rp.prefilter_relevant_articles(ARTICLES, "Tesla", lambda arts: arts[:1], stats=stats)
+    assert kept == ARTICLES[:1]
+    assert stats["forwarded"] == 5 and stats["call_reduction"] == 0
+
+
+def test_nothing_uncertain_skips_llm():
+    stats = {}
+    kept = rp.prefilter_relevant_articles(
+        ARTICLES, "Tesla", lambda arts: pytest.fail("LLM called"),
+        accept=0.3, reject=0.3, embed=bag_of_words, stats=stats,
+    )
+    assert [a["url"] for a in kept] == ["u0", "u4"]
+    assert stats["forwarded"] == 0 and stats["call_reduction"] == 1.0
@@ -0,0 +1,104 @@
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.sentiment_aggregate import SentimentAggregator, rolling_sentiment
+from src.service.sentiment_finBERT import aggregate_sentiment, label_to_signed
+
+
+def _reference(articles):
+    """The original per-article loop, kept here to pin the semantics."""
+    if not articles:
+        return aggregate_sentiment([])
+    pos_w = neu_w = neg_w = sum_w = sum_ws = 0.0
+    for a in articles:
+        label = a.get("sentiment_label")
+        conf = float(a.get("sentiment_conf", 0.0) or 0.0)
+        sum_w += conf
+        sum_ws += conf * label_to_signed(label, conf)
+        if label == "positive":
+            pos_w += conf
+        elif label == "negative":
+            neg_w += conf
+        else:
+            neu_w += conf
+    if sum_w <= 1e-9:
+        return aggregate_sentiment([]) | {
+            "counts": {"positive": 0, "neutral": 0, "negative": 0, "total": len(articles)}
+        }
+    score = (sum_ws / sum_w + 1) * 50
+    tag = "Bullish" if score >= 60 else "Bearish" if score <= 40 else "Neutral"
+    count = lambda lb: sum(1 for a in articles if a.get("sentiment_label") == lb)
+    return {
+        "score_0_100": round(score, 1),
+        "overall_tag": tag,
+        "counts": {
+            "positive": count("positive"),
+            "neutral": count("neutral"),
+            "negative": count("negative"),
+            "total": len(articles),
+        },
+        "weighted_share": {
+            "positive": round(pos_w / sum_w, 3),
+            "neutral": round(neu_w / sum_w, 3),
+            "negative": round(neg_w / sum_w, 3),
+        },
+    }
+
+
+def _articles(n, seed=0):
+    rnd = random.Random(seed)
+    labels = ["positive", "neutral", "negative", None, "weird"]
+    return [
+        {
+            "sentiment_label": rnd.choice(labels),
+            "sentiment_conf": rnd.random(),
+            "published_at": f"2025-03-{rnd.randint(1, 9):02d}T{rnd.randint(0, 23):02d}:00:00Z",
+        }
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 200])
+def test_aggregate_matches_reference_loop(n):
+    arts = _articles(n, seed=n)
+    assert aggregate_sentiment(arts) == _reference(arts)
+
+
+def test_zero_weight_keeps_total():
+    arts = [{"sentiment_label": "positive", "sentiment_conf": 0.0}] * 3
+    assert aggregate_sentiment(arts) == _reference(arts)
+
+
+def test_incremental_add_remove():
+    arts = _articles(50)
+    agg = SentimentAggregator.from_articles(arts[:30])
+    agg.add(arts[30:])
+    assert agg.result() == aggregate_sentiment(arts)
+    agg.remove(arts[:10])
+    assert agg.result() == aggregate_sentiment(arts[10:])
+
+
+def test_rolling_daily_and_hourly_windows():
+    arts = _articles(300)
+    daily = rolling_sentiment(arts, "D", start="2025-03-01", end="2025-03-10")
+    assert [d["period"] for d in daily][:2] == ["2025-03-01", "2025-03-02"]
+    assert len(daily) == 10
+    for d in daily:
+        day = [a for a in arts if a["published_at"].startswith(d["period"])]
+        assert {k: v for k, v in d.items() if k != "period"} == aggregate_sentiment(day)
+
+    three = rolling_sentiment(arts, "D", window=3)
+    days = ("2025-03-07", "2025-03-08", "2025-03-09")
+    last = [a for a in arts if a["published_at"][:10] in days]
+    assert three[-1]["period"] == "2025-03-09"
+    assert three[-1]["counts"] == aggregate_sentiment(last)["counts"]
+
+    hourly = rolling_sentiment(
+        arts, "h", start="2025-03-01T00:00", end="2025-03-01T23:00"
+    )
+    assert len(hourly) == 24 and hourly[5]["period"] == "2025-03-01T05"
+    assert rolling_sentiment([], "D") == []
@@ -0,0 +1,81 @@
+import os
+import sys
+import asyncio
+import threading
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.sentiment_batcher import MicroBatcher, _bucket
+
+
+class RecordingScorer:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return [{"label": t, "confidence": 1.0, "probs": []} for t in texts]
+
+
+def test_bucket_is_power_of_two_upper_bound():
+    assert [_bucket(n) for n in (1, 2, 3, 4, 5, 32, 33)] == [1, 2, 4, 4, 8, 32, 64]
+
+
+def test_concurrent_requests_are_coalesced_and_fanned_out():
+    scorer = RecordingScorer()
+    batcher = MicroBatcher(scorer, max_batch_size=64, max_wait_ms=200)
+    start = threading.Barrier(8)
+    out = {}
+
+    def worker(i):
+        start.wait()
+        out[i] = batcher.score([f"{i}-a", f"{i}-b"], timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+
+    for i in range(8):
+        assert [r["label"] for r in out[i]] == [f"{i}-a", f"{i}-b"]
+    assert len(scorer.batches) < 8
+    m = batcher.metrics()
+    assert m["requests"] == 8 and m["texts"] == 16
+    assert m["batches"] == len(scorer.batches)
+    assert sum(m["batch_size_histogram"].values()) == m["batches"]
+    assert m["queue_depth"] == 0 and m["pending_texts"] == 0
+
+
+def test_batches_respect_max_batch_size():
+    scorer = RecordingScorer()
+    batcher = MicroBatcher(scorer, max_batch_size=4, max_wait_ms=50)
+    futures = [batcher.submit([f"{i}-{j}" for j in range(3)]) for i in range(5)]
+    results = [f.result(timeout=5) for f in futures]
+    batcher.close()
+    assert all(len(b) <= 4 for b in scorer.batches)
+    assert [r["label"] for r in results[4]] == ["4-0", "4-1", "4-2"]
+
+
+def test_scorer_errors_reach_every_caller():
+    def broken(texts):
+        raise RuntimeError("model unavailable")
+
+    batcher = MicroBatcher(broken, max_wait_ms=1)
+    with pytest.raises(RuntimeError, match="model unavailable"):
+        batcher.score(["x"], timeout=5)
+    batcher.close()
+
+
+def test_ascore_from_coroutines():
+    scorer = RecordingScorer()
+    batcher = MicroBatcher(scorer, max_batch_size=16, max_wait_ms=50)
+
+    async def main():
+        return await asyncio.gather(*(batcher.ascore([str(i)]) for i in range(6)))
+
+    results = asyncio.run(main())
+    batcher.close()
+    assert [r[0]["label"] for r in results] == [str(i) for i in range(6)]
+    assert batcher.score([]) == []
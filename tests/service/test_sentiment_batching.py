@@ -0,0 +1,114 @@
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+torch = pytest.importorskip("torch")
+
+from src.service import sentiment_finBERT as sf
+from src.service.tiered_cache import TieredCache
+
+
+class _Batch(dict):
+    def to(self, device):
+        return self
+
+
+class FakeTokenizer:
+    """Word-level stand-in for the FinBERT tokenizer (ids = word lengths)."""
+
+    def __call__(self, texts, truncation=True):
+        ids = [[101] + [len(w) for w in t.split()] + [102] for t in texts]
+        return {"input_ids": ids, "attention_mask": [[1] * len(i) for i in ids]}
+
+    def pad(self, features, return_tensors="pt"):
+        width = max(len(f["input_ids"]) for f in features)
+        ids = [f["input_ids"] + [0] * (width - len(f["input_ids"])) for f in features]
+        mask = [
+            f["attention_mask"] + [0] * (width - len(f["attention_mask"]))
+            for f in features
+        ]
+        return _Batch(input_ids=torch.tensor(ids), attention_mask=torch.tensor(mask))
+
+
+class FakeModel:
+    """Logits depend only on unpadded tokens, like a real masked encoder."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input_ids, attention_mask):
+        self.calls.append(tuple(input_ids.shape))
+        n = attention_mask.sum(-1).float()
+        s = (input_ids * attention_mask).sum(-1).float()
+        logits = torch.stack([n / 4, torch.zeros_like(n), s / 20], dim=-1)
+        return SimpleNamespace(logits=logits)
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    mdl = FakeModel()
+    monkeypatch.setattr(sf, "_load", lambda: (FakeTokenizer(), mdl, "cpu"))
+    monkeypatch.setattr(sf, "SENTIMENT_MODE", "local")
+    memory_cache = TieredCache(None)
+    monkeypatch.setattr(sf, "get_sentiment_cache", lambda: memory_cache)
+    return mdl
+
+
+def test_score_texts_preserves_order_and_matches_single(fake_model):
+    texts = [
+        "Tesla beats expectations on deliveries this quarter",
+        "Probe widens",
+        "",
+        "Apple sets meeting date",
+        "Shares plunge after a long list of downgrades from several brokers",
+    ]
+    batched = sf.score_texts(texts, batch_size=2)
+    singles = [sf.score_text(t) for t in texts]
+    assert len(batched) == len(texts)
+    for b, s in zip(batched, singles):
+        assert b["label"] == s["label"]
+        assert b["probs"] == pytest.approx(s["probs"], abs=1e-6)
+    assert batched[2] == {"label": "neutral", "confidence": 0.0, "probs": [0.33, 0.34, 0.33]}
+
+
+def test_score_texts_buckets_by_length(fake_model):
+    texts = ["a " * 30, "b", "c " * 29, "d d"]
+    sf.score_texts(texts, batch_size=2)
+    # first bucket holds the two short texts, second the two long ones
+    assert fake_model.calls == [(2, 4), (2, 32)]
+
+
+def test_enrich_with_sentiment_uses_batches(fake_model):
+    arts = [
+        {"title": "Tesla beats expectations", "description": "Deliveries up y/y"},
+        {"title": "Regulatory probe widens", "description": "NHTSA expands review"},
+        {"title": "Apple sets meeting date"},
+    ]
+    out = sf.enrich_with_sentiment(arts, batch_size=8)
+    assert len(fake_model.calls) == 1
+    for a in out:
+        assert a["sentiment_label"] in {"positive", "neutral", "negative"}
+        assert 0.0 <= a["sentiment_conf"] <= 1.0
+        assert -1.0 <= a["sentiment_score"] <= 1.0
+
+
+def test_enrich_with_sentiment_scores_only_cache_misses(fake_model):
+    arts = [
+        {"title": "Tesla beats expectations", "description": "Deliveries up y/y"},
+        {"title": "Tesla beats expectations", "description": "Deliveries up y/y"},
+        {"title": "Regulatory probe widens"},
+    ]
+    stats = {}
+    first = [dict(a) for a in sf.enrich_with_sentiment(arts, stats=stats)]
+    assert stats == {"hits": 0, "misses": 3}
+    assert fake_model.calls == [(2, 8)]  # duplicate headline scored once
+
+    stats = {}
+    again = sf.enrich_with_sentiment([dict(a) for a in arts] + [{"title": "New one"}], stats=stats)
+    assert stats == {"hits": 3, "misses": 1}
+    assert len(fake_model.calls) == 2
+    for a, b in zip(first, again):
+        assert a["sentiment_label"] == b["sentiment_label"]
+        assert a["sentiment_conf"] == pytest.approx(b["sentiment_conf"])
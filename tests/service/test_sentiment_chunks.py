@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service import sentiment_chunks as sc
+from src.service import sentiment_finBERT as sf
+
+
+def test_clean_content_strips_newsapi_marker():
+    assert sc.clean_content("Shares fell sharply on Monday… [+3120 chars]") == (
+        "Shares fell sharply on Monday"
+    )
+    assert sc.clean_content("No content available") == ""
+    assert sc.clean_content(None) == ""
+
+
+def test_chunk_text_keeps_sentences_whole():
+    text = "First sentence here. Second one follows! Third one is last."
+    chunks = sc.chunk_text(text, max_chars=40)
+    assert chunks == ["First sentence here. Second one follows!", "Third one is last."]
+    assert all(len(c) <= 40 for c in sc.chunk_text("A" * 100, max_chars=40))
+
+
+def test_pooling_methods():
+    pos = sf._to_result([0.1, 0.1, 0.8])
+    neg = sf._to_result([0.6, 0.3, 0.1])
+    assert sc.pool_results([pos, neg], "mean")["probs"] == pytest.approx([0.35, 0.2, 0.45])
+    assert sc.pool_results([pos, neg], "max_abs") is pos
+    conf = sc.pool_results([pos, neg], "confidence")
+    assert conf["probs"][2] == pytest.approx((0.8 * 0.8 + 0.6 * 0.1) / 1.4)
+    assert sc.pool_results([], "mean") == sf._neutral()
+    with pytest.raises(ValueError):
+        sc.pool_results([pos], "median")
+
+
+def test_all_chunks_scored_in_one_call():
+    calls = []
+
+    def scorer(texts):
+        calls.append(list(texts))
+        return [sf._to_result([0.1, 0.1, 0.8]) for _ in texts]
+
+    articles = [
+        {"title": "A", "description": "d", "content": "One. Two. [+900 chars]"},
+        {"title": "B", "description": "d", "content": "No content available"},
+    ]
+    stats = {"hits": 0, "misses": 0}
+    out = sc.score_articles_chunked(articles, scorer, "mean", max_chars=5, stats=stats)
+    assert calls == [["A. d", "One.", "Two.", "B. d"]]
+    assert stats == {
+        "hits": 0,
+        "misses": 0,
+        "content": {"pooling": "mean", "articles": 2, "chunks": 4},
+    }
+    assert [r["label"] for r in out] == ["positive", "positive"]
+
+
+def test_headline_never_repeats_the_body():
+    # no description: the body is chunked once, not also glued onto the headline
+    article = {"title": "Acme beats", "content": "Profit rose. Sales rose. [+900 chars]"}
+    assert sc.article_chunks(article, max_chars=12) == ["Acme beats", "Profit rose.", "Sales rose."]
+    assert sc.article_chunks({"description": "Only this"}) == ["Only this"]
@@ -0,0 +1,92 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service import sentiment_lexicon as sl
+from src.service.sentiment_lexicon import score_texts_lexicon
+from src.service import sentiment_finBERT as sf
+
+
+def test_lexicon_labels_unambiguous_headlines():
+    out = score_texts_lexicon(
+        [
+            "Shares plunge after fraud probe",
+            "Nvidia beats estimates and raises guidance",
+            "Apple to hold annual shareholder meeting",
+            "Profit does not surge",
+        ]
+    )
+    assert [r["label"] for r in out] == ["negative", "positive", "neutral", "negative"]
+    assert out[0]["confidence"] > 0.9 and out[1]["confidence"] > 0.9
+    assert out[2]["confidence"] == 0.5
+    for r in out:
+        assert abs(sum(r["probs"]) - 1.0) < 1e-9
+        assert r["probs"][sf.LABELS.index(r["label"])] == r["confidence"]
+
+
+def test_batch_lookup_matches_per_text_matching():
+    texts = [
+        "Beats estimates, beats estimates and raises guidance",
+        "raises dividend raises guidance",  # overlapping bigram candidates
+        "Shares did not beat; no record high. Not",
+        "",
+        None,
+        "profit",
+        "Not",  # negator at the end of one text must not flip the next
+        "surges",
+    ]
+    pos, neg = sl.lexicon_scores(texts)
+    for r, text in enumerate(texts):
+        contrib = [sl._WEIGHTS[j] * sign for j, sign in sl._hits(text or "")]
+        assert pos[r] == sum(c for c in contrib if c > 0)
+        assert neg[r] == -sum(c for c in contrib if c < 0)
+    assert pos[-1] == sl.LEXICON["surges"]
+
+
+def test_cascade_routes_only_ambiguous_items():
+    calls = []
+
+    def finbert(texts):
+        calls.append(list(texts))
+        return [sf._to_result([0.05, 0.9, 0.05]) for _ in texts]
+
+    texts = ["Shares plunge after fraud probe", "Apple to hold annual meeting", ""]
+    stats = {}
+    out = sf.score_texts_cascade(texts, 0.8, finbert, stats=stats, audit=True)
+
+    assert calls[0] == ["Apple to hold annual meeting"]  # routed
+    assert calls[1] == ["Shares plunge after fraud probe"]  # audit pass
+    assert [r["label"] for r in out] == ["negative", "neutral", "neutral"]
+    assert out[2]["confidence"] == 0.0
+    cs = stats["cascade"]
+    assert (cs["total"], cs["routed"], cs["routed_fraction"]) == (2, 1, 0.5)
+    assert cs["agreement"] == 0.5  # the audited plunge headline disagreed
+
+
+def test_zero_hit_texts_are_routed_at_any_threshold():
+    def finbert(texts):
+        return [sf._to_result([0.1, 0.1, 0.8]) for _ in texts]
+
+    texts = ["Apple to hold annual meeting", "Shares plunge after fraud probe"]
+    assert score_texts_lexicon(texts)[0]["evidence"] == 0
+    for threshold in (0.5, 0.34, 0.0):
+        stats = {}
+        out = sf.score_texts_cascade(texts, threshold, finbert, stats=stats)
+        assert out[0]["label"] == "positive"  # FinBERT's answer, not the lexicon's
+        assert out[1]["label"] == "negative" and "evidence" not in out[1]
+        assert stats["cascade"]["routed"] == 1
+
+
+def test_enrich_with_cascade_keeps_schema(monkeypatch):
+    monkeypatch.setattr(
+        sf, "_score_uncached", lambda texts, *a, **k: [sf._neutral() for _ in texts]
+    )
+    articles = [{"title": "Stock soars to record high", "description": "Strong growth"}]
+    stats = {}
+    sf.enrich_with_sentiment(
+        articles, use_cache=False, stats=stats, cascade_threshold=0.6
+    )
+    a = articles[0]
+    assert a["sentiment_label"] == "positive"
+    assert a["sentiment_score"] == sf.label_to_score("positive", a["sentiment_conf"])
+    assert stats["cascade"]["routed"] == 0
@@ -0,0 +1,61 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.service.sentiment_pool import SentimentPool, physical_cores
+
+
+def _fake_score_texts(texts, batch_size=32, backend=None):
+    # label encodes the text so merge order can be checked; pid shows sharding;
+    # probs carry the worker's thread env and whether torch was imported
+    env = [os.environ.get("OMP_NUM_THREADS"), "torch" in sys.modules]
+    return [{"label": t, "confidence": float(os.getpid()), "probs": env} for t in texts]
+
+
+def test_physical_cores_is_positive():
+    assert physical_cores() >= 1
+
+
+def test_pool_merges_shards_in_input_order():
+    texts = [f"headline {i}" for i in range(50)]
+    with SentimentPool(workers=3, batch_size=4, scorer=_fake_score_texts) as pool:
+        out = pool.score_texts(texts)
+        assert pool._executor._mp_context.get_start_method() in ("forkserver", "spawn")
+    assert [r["label"] for r in out] == texts
+    pids = {r["confidence"] for r in out}
+    assert float(os.getpid()) not in pids  # scored in workers, not the parent
+    assert len(pids) <= 3
+    assert out[0]["probs"] == [str(pool.threads_per_worker), False]
+
+
+def test_pool_small_input_stays_in_process():
+    pool = SentimentPool(workers=4, batch_size=32, scorer=_fake_score_texts)
+    out = pool.score_texts(["a", "b"])
+    assert [r["label"] for r in out] == ["a", "b"]
+    assert out[0]["confidence"] == float(os.getpid())
+    assert pool._executor is None
+    assert pool.score_texts([]) == []
+
+
+def test_pool_starts_safely_from_a_threaded_parent():
+    # a busy thread in the parent (like Streamlit's) must not hang the workers
+    stop = threading.Event()
+    busy = threading.Thread(target=stop.wait, daemon=True)
+    busy.start()
+    try:
+        with SentimentPool(workers=2, batch_size=2, scorer=_fake_score_texts) as pool:
+            out = pool.score_texts(["a", "b", "c", "d"])
+            # once started, even a small batch goes to a worker
+            small = pool.score_texts(["e"])
+    finally:
+        stop.set()
+    assert [r["label"] for r in out] == ["a", "b", "c", "d"]
+    assert small[0]["confidence"] != float(os.getpid())
+
+
+def test_pool_threads_do_not_oversubscribe():
+    pool = SentimentPool(workers=physical_cores())
+    assert pool.threads_per_worker == 1
+    assert SentimentPool(workers=1).threads_per_worker == physical_cores()
@@ -0,0 +1,150 @@
+import os
+import sys
+import threading
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.service import sentiment_finBERT as sf
+from src.service.sentiment_cache import cache_key
+from src.service.sentiment_server import (
+    SentimentClient,
+    SentimentServer,
+    SentimentServerError,
+    get_client,
+)
+from src.service.tiered_cache import TieredCache
+
+
+def _fake_scorer(texts):
+    # probability mass on "positive" grows with text length
+    out = []
+    for t in texts:
+        p = min(len(t), 90) / 100.0
+        out.append(sf._to_result([(1 - p) / 2, (1 - p) / 2, p]))
+    return out
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = SentimentServer(str(tmp_path / "finbert.sock"), scorer=_fake_scorer).bind()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    thread.join(timeout=5)
+
+
+def test_client_roundtrip_matches_scorer(server):
+    client = SentimentClient(server.socket_path)
+    texts = ["Tesla beats expectations on deliveries", "", "Aktien stürzen ab — 株価急落"]
+    out = client.score_texts(texts)
+    expected = _fake_scorer(texts)
+    assert [r["label"] for r in out] == [r["label"] for r in expected]
+    for a, b in zip(out, expected):
+        assert a["probs"] == pytest.approx(b["probs"], abs=1e-6)
+    # the connection is reused for the next request
+    assert len(client.score_texts(["again"])) == 1
+    client.close()
+
+
+def test_server_reports_scoring_errors(tmp_path):
+    def broken(texts):
+        raise RuntimeError("model not loaded")
+
+    srv = SentimentServer(str(tmp_path / "s.sock"), scorer=broken).bind()
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    client = SentimentClient(srv.socket_path)
+    with pytest.raises(RuntimeError, match="model not loaded"):
+        client.score_texts(["x"])
+    srv.shutdown()
+
+
+def test_client_raises_server_error_when_daemon_is_down(tmp_path):
+    client = SentimentClient(str(tmp_path / "missing.sock"))
+    assert not client.available()
+    with pytest.raises(SentimentServerError):
+        client.score_texts(["x"])
+
+
+def test_server_mode_falls_back_to_in_process(monkeypatch, tmp_path):
+    monkeypatch.setattr(sf, "score_texts", lambda texts, batch_size=32, backend=None: ["local"] * len(texts))
+    monkeypatch.setattr(
+        "src.service.sentiment_server.get_client",
+        lambda: SentimentClient(str(tmp_path / "missing.sock")),
+    )
+    assert sf._score_uncached(["a", "b"], 32, None, None, "server") == ["local", "local"]
+    assert sf._score_uncached(["a"], 32, None, None, "auto") == ["local"]
+
+
+def _local(monkeypatch):
+    monkeypatch.setattr(
+        sf, "score_texts", lambda texts, batch_size=32, backend=None: ["local"] * len(texts)
+    )
+
+
+@pytest.mark.parametrize("mode", ["server", "auto"])
+def test_daemon_scoring_error_and_short_reply_fall_back(monkeypatch, tmp_path, mode):
+    _local(monkeypatch)
+
+    def broken(texts):
+        raise RuntimeError("CUDA out of memory")
+
+    for scorer in (broken, lambda texts: _fake_scorer(texts)[:-1]):
+        srv = SentimentServer(str(tmp_path / f"{mode}.sock"), scorer=scorer).bind()
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        client = SentimentClient(srv.socket_path)
+        monkeypatch.setattr("src.service.sentiment_server.get_client", lambda: client)
+        assert sf._score_uncached(["a", "b"], 32, None, None, mode) == ["local", "local"]
+        srv.shutdown()
+
+
+def test_cache_is_keyed_by_the_daemon_backend(monkeypatch, tmp_path):
+    srv = SentimentServer(str(tmp_path / "onnx.sock"), scorer=_fake_scorer, backend="onnx")
+    srv.bind()
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    client = SentimentClient(srv.socket_path)
+    assert client.info() == {"backend": "onnx", "revision": sf.MODEL_REVISION}
+    monkeypatch.setattr("src.service.sentiment_server.get_client", lambda: client)
+    cache = TieredCache(None, table="sentiment")
+    monkeypatch.setattr(sf, "get_sentiment_cache", lambda: cache)
+
+    sf.score_texts_cached(["Tesla beats"], backend="torch", mode="server")
+    onnx_key = cache_key("Tesla beats", sf.MODEL_ID, sf._cache_revision("onnx"))
+    torch_key = cache_key("Tesla beats", sf.MODEL_ID, sf._cache_revision("torch"))
+    assert cache.get(onnx_key) is not None and cache.get(torch_key) is None
+
+    # the daemon reports onnx but fails to score: the in-process fallback
+    # results are cached under the local (torch) key, not the daemon's
+    def broken(texts):
+        raise RuntimeError("model crashed")
+
+    srv.scorer = broken
+    monkeypatch.setattr(
+        sf, "score_texts", lambda texts, batch_size=32, backend=None: _fake_scorer(texts)
+    )
+    sf.score_texts_cached(["Tesla misses"], backend="torch", mode="server")
+    assert cache.get(cache_key("Tesla misses", sf.MODEL_ID, sf._cache_revision("torch")))
+    assert cache.get(cache_key("Tesla misses", sf.MODEL_ID, sf._cache_revision("onnx"))) is None
+    srv.shutdown()
+
+
+@pytest.mark.parametrize("mode", ["local", "pool", "queue", "server"])
+def test_full_cache_hit_touches_no_backend(monkeypatch, mode):
+    cache = TieredCache(None, table="sentiment")
+    monkeypatch.setattr(sf, "get_sentiment_cache", lambda: cache)
+    monkeypatch.setattr(sf, "_server_revision", lambda mode: None)
+    texts = ["Tesla beats", "Apple misses"]
+    revision = sf._cache_revision(sf._resolve_backend(None))
+    cache.put_many(
+        {cache_key(t, sf.MODEL_ID, revision): r for t, r in zip(texts, _fake_scorer(texts))}
+    )
+
+    def no_backend(*args, **kwargs):
+        raise AssertionError("scored although every text was cached")
+
+    monkeypatch.setattr(sf, "_score_uncached", no_backend)
+    stats = {}
+    out = sf.score_texts_cached(texts + [""], mode=mode, stats=stats)
+    assert out[:2] == _fake_scorer(texts) and out[2] == sf._neutral()
+    assert stats == {"hits": 2, "misses": 0}
@@ -0,0 +1,46 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.source_matcher import SourceMatcher, normalize_domain, normalize_source
+from src.service.pre_processing import filtered_articles
+
+NAMES = ["Reuters", "The Wall Street Journal", "CNBC", "The Times (UK)", "Gold.org"]
+DOMAINS = {"Reuters": ["reuters.com"], "The Wall Street Journal": ["wsj.com"]}
+
+
+def test_normalization():
+    assert normalize_source("The Wall Street Journal") == "wall street journal"
+    assert normalize_source("Reuters.com") == "reuters"
+    assert normalize_source("Telegraph.co.uk") == "telegraph"
+    assert normalize_domain("https://www.uk.Reuters.com/markets?x=1") == "uk.reuters.com"
+    assert normalize_domain("amp.cnbc.com") == "cnbc.com"
+
+
+def test_exact_domain_and_fuzzy_matching_with_memo():
+    m = SourceMatcher(NAMES, DOMAINS, threshold=90)
+    assert m.match("Wall Street Journal") == "The Wall Street Journal"
+    assert m.match("Reuters.com") == "Reuters"
+    assert m.match("Some Aggregator", "https://uk.reuters.com/article/1") == "Reuters"
+    assert m.stats["fuzzy"] == 0
+
+    assert m.match("CNBC TV18") == "CNBC"  # fuzzy, above threshold
+    assert m.match("Economic Times") is None  # fuzzy, below threshold
+    assert m.match("Slashdot.org") is None
+    assert m.stats["fuzzy"] == 3
+    m.match("CNBC TV18")
+    m.match("Economic Times", threshold=0)  # memoized score, new threshold
+    assert m.stats["fuzzy"] == 3 and m.stats["memo"] == 2
+
+
+def test_filtered_articles_applies_threshold():
+    arts = [
+        {"source": {"id": None, "name": "Reuters"}, "url": "https://reuters.com/a"},
+        {"source": {"id": None, "name": "Yahoo Entertainment"}, "url": "https://yahoo.com/b"},
+        {"source": "Biztoc.com", "url": "https://biztoc.com/c"},
+        {"source": "Unknown", "domain": "wsj.com"},
+        "not-an-article",
+    ]
+    kept = filtered_articles(arts)
+    assert kept == [arts[0], arts[3]]
+    assert len(filtered_articles(arts, threshold=0)) == 4
@@ -0,0 +1,117 @@
+import os
+import sys
+import json
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+import src.service.source_registry as sr
+from src.service.source_registry import SourceRegistry, get_registry
+from src.service.source_matcher import SourceMatcher, get_matcher
+
+
+def _write(path, sources, mtime):
+    path.write_text(json.dumps({"sources": sources}), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_registry_hot_reload(tmp_path):
+    path = tmp_path / "trusted.json"
+    _write(path, {"Reuters": {"domains": ["reuters.com"], "weight": 2}}, 1_000_000_000)
+    reg = SourceRegistry(str(path), check_interval=0)
+    assert reg.matcher().match("Reuters") == "Reuters"
+    assert reg.matcher().match(None, "https://www.reuters.com/x") == "Reuters"
+    assert reg.matcher().weight("Reuters") == 2.0
+    assert reg.matcher().weight("Other") == reg.matcher().weight(None) == 1.0
+    assert reg.matcher().match("Electrek") is None
+
+    _write(path, {"Electrek": {"domains": ["electrek.co"]}}, 2_000_000_000)
+    assert reg.matcher().match("Electrek") == "Electrek"
+    assert reg.matcher().match(None, "https://reuters.com/x") is None
+    assert reg.reloads == 2
+
+    # a broken edit keeps the last good list
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+    assert reg.matcher().match("Electrek") == "Electrek"
+    assert reg.reloads == 2
+
+
+def test_broken_file_is_reported_once(tmp_path, monkeypatch):
+    path = tmp_path / "trusted.json"
+    _write(path, {"Reuters": {}}, 1_000_000_000)
+    reg = SourceRegistry(str(path), check_interval=0)
+    warnings = []
+    monkeypatch.setattr(sr.logger, "warning", warnings.append)
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    for _ in range(5):
+        assert reg.matcher().match("Reuters") == "Reuters"
+    assert len(warnings) == 1
+
+    # a fixed file loads, and a new broken edit is reported again
+    _write(path, {"CNBC": {}}, 3_000_000_000)
+    assert reg.matcher().match("CNBC") == "CNBC"
+    path.write_text("[]", encoding="utf-8")
+    os.utime(path, ns=(4_000_000_000, 4_000_000_000))
+    reg.matcher()
+    reg.matcher()
+    assert len(warnings) == 2
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        ["reuters.com"],
+        "reuters.com",
+        {"domains": "reuters.com"},
+        {"domains": [1]},
+        {"weight": "high"},
+        {"weight": -1},
+        {"weight": True},
+    ],
+)
+def test_malformed_entry_keeps_the_last_good_list(tmp_path, entry):
+    path = tmp_path / "trusted.json"
+    _write(path, {"Reuters": {"domains": ["reuters.com"]}}, 1_000_000_000)
+    reg = SourceRegistry(str(path), check_interval=0)
+
+    _write(path, {"Reuters": entry, "CNBC": {}}, 2_000_000_000)
+    with pytest.raises(ValueError):
+        sr.load_registry_file(str(path))
+    assert reg.matcher().match("Reuters") == "Reuters"
+    assert reg.matcher().match("CNBC") is None
+    assert reg.reloads == 1
+
+
+def test_shared_matcher_counts_every_lookup():
+    m = SourceMatcher(["Reuters"], {"Reuters": ["reuters.com"]})
+
+    def lookups():
+        for _ in range(2000):
+            m.match("Reuters")
+            m.match(None, "https://reuters.com/x")
+
+    threads = [threading.Thread(target=lookups) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert m.stats["name"] == m.stats["domain"] == 16000
+
+
+def test_registry_throttles_stat_calls(tmp_path):
+    path = tmp_path / "trusted.json"
+    _write(path, {"Reuters": {}}, 1_000_000_000)
+    reg = SourceRegistry(str(path), check_interval=3600)
+    _write(path, {"CNBC": {}}, 2_000_000_000)
+    assert reg.matcher().match("CNBC") is None  # not re-checked yet
+    assert reg.refresh(force=True)
+    assert reg.matcher().match("CNBC") == "CNBC"
+
+
+def test_shared_instance_uses_bundled_file():
+    assert get_registry() is get_registry()
+    assert get_matcher().match("Reuters") == "Reuters"
@@ -0,0 +1,57 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.service.tiered_cache import TieredCache
+from src.service.sentiment_cache import cache_key
+
+
+def test_tiered_cache_roundtrip_and_persistence(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = TieredCache(path, maxsize=2)
+    cache.put_many({"a": {"label": "positive"}, "b": [1, 2, 3]})
+    assert cache.get_many(["a", "b", "c"]) == {"a": {"label": "positive"}, "b": [1, 2, 3]}
+
+    # a fresh instance (new process / restart) only has the disk tier
+    reopened = TieredCache(path, maxsize=2)
+    assert reopened.get("a") == {"label": "positive"}
+    assert reopened.get("missing", "default") == "default"
+
+
+def test_tiered_cache_lru_eviction_falls_back_to_disk(tmp_path):
+    cache = TieredCache(str(tmp_path / "cache.sqlite"), maxsize=2)
+    cache.put_many({"a": 1, "b": 2, "c": 3})
+    assert list(cache._lru) == ["b", "c"]
+    assert cache.get("a") == 1  # served from SQLite, promoted back into the LRU
+    assert list(cache._lru) == ["c", "a"]
+
+
+def test_tiered_cache_memory_only():
+    cache = TieredCache(None, maxsize=1)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get_many(["a", "b"]) == {"b": 2}
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_sentiment_cache_key_depends_on_model_and_revision():
+    k = cache_key("Tesla beats expectations", "ProsusAI/finbert", "main")
+    assert k == cache_key("Tesla beats expectations", "ProsusAI/finbert", "main")
+    assert k != cache_key("Tesla beats expectations", "ProsusAI/finbert", "abc123")
+    assert k != cache_key("Tesla beats expectations.", "ProsusAI/finbert", "main")
+
+
+def test_tiered_cache_max_age(tmp_path, monkeypatch):
+    import src.service.tiered_cache as tc
+
+    path = str(tmp_path / "cache.sqlite")
+    now = [1000.0]
+    monkeypatch.setattr(tc.time, "time", lambda: now[0])
+    cache = TieredCache(path)
+    cache.put("a", 1)
+    now[0] = 1100.0
+    assert cache.get("a", max_age=200) == 1
+    assert cache.get("a", max_age=50) is None
+    assert cache.get("a") == 1  # no max_age: never expires
+    assert TieredCache(path).get("a", max_age=50) is None  # disk tier too